@@ -1,86 +1,336 @@
-import json
+import asyncio
+from typing import Any, Literal, TypeVar, cast, get_args, get_origin, overload
 
 import httpx
+import msgspec
+import orjson
+import pydantic_core
 from pydantic import BaseModel, ValidationError
 
+_ModelT = TypeVar("_ModelT", bound=BaseModel)
+_StructT = TypeVar("_StructT", bound=msgspec.Struct)
+
+_PASSTHROUGH_ERRORS = (
+    httpx.HTTPStatusError,
+    httpx.NetworkError,
+    ValidationError,
+    msgspec.ValidationError,
+)
+
+
+def _construct_model(model: type[BaseModel], data: dict[str, Any]) -> BaseModel:
+    """
+    Builds a model instance from trusted data without running validation.
+
+    Nested model fields (directly or inside a list) are constructed recursively,
+    since ``model_construct`` alone would leave them as plain dictionaries.
+    """
+    values: dict[str, Any] = {}
+    for name, value in data.items():
+        field = model.model_fields.get(name)
+        if field is None:
+            values[name] = value
+            continue
+        annotation = field.annotation
+        if (
+            isinstance(value, dict)
+            and isinstance(annotation, type)
+            and issubclass(annotation, BaseModel)
+        ):
+            values[name] = _construct_model(annotation, value)
+        elif isinstance(value, list) and get_origin(annotation) is list:
+            (item_type,) = get_args(annotation) or (Any,)
+            if isinstance(item_type, type) and issubclass(item_type, BaseModel):
+                values[name] = [
+                    _construct_model(item_type, item)
+                    if isinstance(item, dict)
+                    else item
+                    for item in value
+                ]
+            else:
+                values[name] = value
+        else:
+            values[name] = value
+    return model.model_construct(**values)
+
+
+def build_a2a_http_client() -> httpx.AsyncClient:
+    """
+    Creates the HTTP client used for agent-to-agent communication.
+
+    HTTP/2 lets concurrent calls to the same agent share one connection, and the
+    keep-alive pool avoids paying a new TCP/TLS handshake on every call.
+    """
+    return httpx.AsyncClient(
+        http2=True,
+        limits=httpx.Limits(
+            max_connections=512,
+            max_keepalive_connections=256,
+            keepalive_expiry=60.0,
+        ),
+        timeout=httpx.Timeout(30.0, connect=5.0),
+    )
+
 
 class A2AClientAdapter:
     """
     Adapter for making Agent-to-Agent (A2A) calls to remote capabilities.
     """
 
-    def __init__(self, http_client: httpx.AsyncClient):
+    _HEADERS = {"Content-Type": "application/json", "Accept": "application/json"}
+
+    def __init__(
+        self,
+        http_client: httpx.AsyncClient,
+        batch_window: float = 0.005,
+        max_batch_size: int = 32,
+    ):
         """
         Initializes the A2AClientAdapter with an asynchronous HTTP client.
 
         Args:
             http_client: The asynchronous HTTP client used for making agent-to-agent requests.
+            batch_window: Seconds to wait for more calls before sending a batch.
+            max_batch_size: Maximum number of calls sent in a single batch request.
         """
         self.http_client = http_client
+        # Bound once so the hot path avoids two attribute lookups per call
+        self._post = http_client.post
+        self._url_cache: dict[tuple[str, str], str] = {}
+        self._batch_window = batch_window
+        self._max_batch_size = max_batch_size
+        self._batch_queues: dict[str, list[tuple[str, dict, asyncio.Future]]] = {}
+        self._batch_workers: dict[str, asyncio.Task] = {}
 
+    @overload
     async def execute_remote_capability(
         self,
         agent_url: str,
         capability_name: str,
-        request_payload: BaseModel,
-        response_model: type[BaseModel] | None = None,
-    ) -> BaseModel | dict:
+        request_payload: BaseModel | msgspec.Struct,
+        response_model: type[_ModelT],
+        trusted: bool = ...,
+        raw_bytes: bool = ...,
+    ) -> _ModelT: ...
+
+    @overload
+    async def execute_remote_capability(
+        self,
+        agent_url: str,
+        capability_name: str,
+        request_payload: BaseModel | msgspec.Struct,
+        response_model: type[_StructT],
+        trusted: bool = ...,
+        raw_bytes: bool = ...,
+    ) -> _StructT: ...
+
+    @overload
+    async def execute_remote_capability(
+        self,
+        agent_url: str,
+        capability_name: str,
+        request_payload: BaseModel | msgspec.Struct,
+        response_model: None = ...,
+        trusted: bool = ...,
+        raw_bytes: Literal[False] = ...,
+    ) -> dict: ...
+
+    @overload
+    async def execute_remote_capability(
+        self,
+        agent_url: str,
+        capability_name: str,
+        request_payload: BaseModel | msgspec.Struct,
+        response_model: None = ...,
+        trusted: bool = ...,
+        *,
+        raw_bytes: Literal[True],
+    ) -> bytes: ...
+
+    async def execute_remote_capability(
+        self,
+        agent_url: str,
+        capability_name: str,
+        request_payload: BaseModel | msgspec.Struct,
+        response_model: type[BaseModel] | type[msgspec.Struct] | None = None,
+        trusted: bool = False,
+        raw_bytes: bool = False,
+    ) -> BaseModel | msgspec.Struct | dict | bytes:
         """
         Executes a remote capability on another agent via an asynchronous HTTP POST request.
 
-        Sends a JSON-serialized request payload to the specified agent and capability endpoint. If a response model is provided, the response is deserialized into that Pydantic model; otherwise, the raw JSON dictionary is returned.
+        Sends a JSON-serialized request payload to the specified agent and capability endpoint. If a response model is provided, the response is deserialized into that model; otherwise, the raw JSON dictionary is returned.
+
+        Payloads and response models may be Pydantic models or ``msgspec.Struct`` types
+        (see ``A2AStruct``); structs are encoded and decoded directly by msgspec.
 
         Args:
             agent_url: The base URL of the target agent.
             capability_name: The name of the capability to execute.
-            request_payload: The Pydantic model instance representing the request payload.
-            response_model: Optional Pydantic model type to deserialize the response into.
+            request_payload: The Pydantic model or msgspec struct representing the request payload.
+            response_model: Optional Pydantic model or msgspec struct type to deserialize the response into.
+            trusted: If True, the response is assumed to come from a trusted agent and a
+                Pydantic response is built with ``model_construct`` instead of being validated.
+            raw_bytes: If True and no response_model is given, the response body is
+                returned as unparsed bytes, e.g. for callers that forward it unchanged.
 
         Returns:
-            An instance of the response_model if provided, otherwise a dictionary containing the response data.
+            An instance of the response_model if provided, the raw response body if
+            raw_bytes is set, otherwise a dictionary containing the response data.
 
         Raises:
             httpx.HTTPStatusError: If the remote server returns an HTTP error status.
             httpx.NetworkError: If a network error occurs.
             ValidationError: If the response cannot be validated against the response_model.
+            msgspec.ValidationError: If the response does not match a msgspec response_model.
             RuntimeError: For JSON decoding failures or other unexpected errors.
         """
-        url = f"{agent_url.rstrip('/')}/a2a/execute/{capability_name}"
-        headers = {"Content-Type": "application/json", "Accept": "application/json"}
+        key = (agent_url, capability_name)
+        url = self._url_cache.get(key)
+        if url is None:
+            url = self._url_cache.setdefault(
+                key, f"{agent_url.rstrip('/')}/a2a/execute/{capability_name}"
+            )
+
+        if isinstance(request_payload, msgspec.Struct):
+            content = msgspec.json.encode(request_payload)
+        else:
+            # Serialize straight to bytes; model_dump_json() would decode to str
+            content = pydantic_core.to_json(request_payload)
 
         try:
-            response = await self.http_client.post(
-                url,
-                json=request_payload.model_dump(),
-                headers=headers,
-            )
+            response = await self._post(url, content=content, headers=self._HEADERS)
             response.raise_for_status()
 
-            response_data = await response.json()
+            if raw_bytes and response_model is None:
+                return response.content
+
+            if response_model is not None and issubclass(
+                response_model, msgspec.Struct
+            ):
+                return msgspec.json.decode(response.content, type=response_model)
+
+            response_data = orjson.loads(response.content)
 
             if response_model:
-                return response_model(**response_data)
+                if trusted:
+                    return _construct_model(response_model, response_data)
+                return response_model.model_validate(response_data)
             else:
-                return response_data
+                return cast(dict, response_data)
 
-        except httpx.HTTPStatusError as e:
-            # Re-raise specific HTTP errors to be handled by the caller
-            raise e
+        except _PASSTHROUGH_ERRORS:
+            # HTTP, network and response validation errors are handled by the caller
+            raise
 
-        except httpx.NetworkError as e:
-            # Re-raise network errors
-            raise e
-
-        except json.JSONDecodeError as e:
-            # Handle cases where response.json() fails
+        except (orjson.JSONDecodeError, msgspec.DecodeError) as e:
             raise RuntimeError(f"Failed to decode JSON response from {url}: {e}") from e
 
-        except ValidationError as e:
-            # Re-raise Pydantic validation errors if response_model is provided
-            raise e
-
         except Exception as e:
             # Catch any other unexpected errors during the process
             raise RuntimeError(
                 f"An unexpected error occurred when calling {url}: {e}"
             ) from e
+
+    async def execute_remote_capability_batched(
+        self,
+        agent_url: str,
+        capability_name: str,
+        request_payload: BaseModel | msgspec.Struct,
+        response_model: type[BaseModel] | type[msgspec.Struct] | None = None,
+    ) -> BaseModel | msgspec.Struct | dict:
+        """
+        Executes a remote capability, coalescing concurrent calls to the same agent.
+
+        Calls to the same agent that arrive within ``batch_window`` seconds are sent
+        together as a single POST to the agent's ``/a2a/batch`` endpoint, and each
+        caller receives its own result.
+
+        Args:
+            agent_url: The base URL of the target agent.
+            capability_name: The name of the capability to execute.
+            request_payload: The Pydantic model or msgspec struct representing the request payload.
+            response_model: Optional Pydantic model or msgspec struct type to deserialize the response into.
+
+        Returns:
+            An instance of the response_model if provided, otherwise a dictionary containing the response data.
+
+        Raises:
+            httpx.HTTPStatusError: If the batch request returns an HTTP error status.
+            httpx.NetworkError: If a network error occurs.
+            ValidationError: If the response cannot be validated against the response_model.
+            RuntimeError: If the remote agent reports a failure for this call.
+        """
+        if isinstance(request_payload, msgspec.Struct):
+            payload = msgspec.to_builtins(request_payload)
+        else:
+            payload = request_payload.model_dump(mode="json")
+
+        future: asyncio.Future = asyncio.get_running_loop().create_future()
+        queue = self._batch_queues.setdefault(agent_url, [])
+        queue.append((capability_name, payload, future))
+        if agent_url not in self._batch_workers:
+            self._batch_workers[agent_url] = asyncio.create_task(
+                self._drain_batch_queue(agent_url)
+            )
+
+        response_data = await future
+        if response_model is None:
+            return cast(dict, response_data)
+        if issubclass(response_model, msgspec.Struct):
+            return msgspec.convert(response_data, type=response_model)
+        return response_model.model_validate(response_data)
+
+    async def _drain_batch_queue(self, agent_url: str) -> None:
+        """Sends queued calls for an agent in batches until its queue is empty."""
+        queue = self._batch_queues[agent_url]
+        try:
+            while queue:
+                if len(queue) < self._max_batch_size:
+                    await asyncio.sleep(self._batch_window)
+                batch = queue[: self._max_batch_size]
+                del queue[: self._max_batch_size]
+                await self._send_batch(agent_url, batch)
+        finally:
+            del self._batch_workers[agent_url]
+
+    async def _send_batch(
+        self, agent_url: str, batch: list[tuple[str, dict, asyncio.Future]]
+    ) -> None:
+        """Posts one batch request and resolves the futures of the calls it contains."""
+        url = f"{agent_url.rstrip('/')}/a2a/batch"
+        body = {
+            "calls": [
+                {"capability_name": capability_name, "payload": payload}
+                for capability_name, payload, _ in batch
+            ]
+        }
+        try:
+            response = await self._post(
+                url, content=orjson.dumps(body), headers=self._HEADERS
+            )
+            response.raise_for_status()
+            results = orjson.loads(response.content)["results"]
+        except Exception as e:
+            for _, _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for (capability_name, _, future), result in zip(batch, results, strict=False):
+            if future.done():
+                continue
+            if result.get("status_code", 200) >= 400:
+                future.set_exception(
+                    RuntimeError(
+                        f"Remote capability '{capability_name}' at {url} failed "
+                        f"with status {result['status_code']}: {result.get('detail')}"
+                    )
+                )
+            else:
+                future.set_result(result.get("data"))
+        for _, _, future in batch[len(results) :]:
+            if not future.done():
+                future.set_exception(
+                    RuntimeError(f"No result returned for batched call to {url}")
+                )
@@ -0,0 +1,153 @@
+"""Two-tier response cache for stateless AI pattern executions."""
+
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Sequence
+from typing import Any
+
+import orjson
+
+from app.adapters.embedding_ring import EmbeddingRing, normalize_embedding
+
+# (pattern_name, model_name, input variable name)
+_Scope = tuple[str, str | None, str]
+
+
+class CompletionCache:
+    """
+    Caches AI replies for pattern executions that carry no session state.
+
+    The exact tier is an LRU keyed on a digest of the pattern, model and
+    input variables. When an ``embedder`` is provided, a semantic tier
+    additionally returns the reply cached for a single-variable input whose
+    embedding has cosine similarity above ``similarity_threshold`` with the
+    new input. Patterns with several variables only use the exact tier, since
+    similar text in one variable says nothing about the others.
+
+    Entries expire ``ttl_seconds`` after they are stored.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        ttl_seconds: float = 300.0,
+        embedder: Callable[[str], Sequence[float]] | None = None,
+        similarity_threshold: float = 0.95,
+    ) -> None:
+        """
+        Initialize the cache.
+
+        Args:
+            max_entries: Maximum number of entries kept in each tier.
+            ttl_seconds: How long a stored reply may be served.
+            embedder: Optional callable turning an input into an embedding vector.
+                Enables the semantic tier when given.
+            similarity_threshold: Minimum cosine similarity for a semantic hit.
+        """
+        self._max_entries = max_entries
+        self._ttl = ttl_seconds
+        self._embedder = embedder
+        self._threshold = similarity_threshold
+        self._lock = threading.Lock()
+        # digest -> (expires_at, reply)
+        self._exact: OrderedDict[bytes, tuple[float, str]] = OrderedDict()
+        # Semantic tier: input embeddings -> (scope, expires_at, reply)
+        self._semantic: EmbeddingRing[tuple[_Scope, float, str]] = EmbeddingRing(
+            max_entries
+        )
+
+    def lookup(
+        self,
+        pattern_name: str,
+        input_variables: dict[str, Any],
+        model_name: str | None = None,
+    ) -> tuple[str | None, Any]:
+        """
+        Look up a cached reply for a pattern execution.
+
+        Returns:
+            A ``(reply, embedding)`` pair. ``reply`` is None on a miss.
+            ``embedding`` is the input embedding computed for the semantic tier
+            (or None) and should be passed back to ``store``.
+        """
+        digest = self._digest(pattern_name, input_variables, model_name)
+        now = time.monotonic()
+        with self._lock:
+            entry = self._exact.get(digest)
+            if entry is not None:
+                expires_at, reply = entry
+                if expires_at > now:
+                    self._exact.move_to_end(digest)
+                    return reply, None
+                del self._exact[digest]
+
+        scope = self._semantic_scope(pattern_name, input_variables, model_name)
+        embedder = self._embedder
+        if scope is None or embedder is None:
+            return None, None
+
+        (text,) = input_variables.values()
+        embedding = normalize_embedding(embedder(str(text)))
+
+        with self._lock:
+            for entry_scope, expires_at, reply in self._semantic.matches(
+                embedding, self._threshold
+            ):
+                if entry_scope == scope and expires_at > now:
+                    return reply, embedding
+        return None, embedding
+
+    def store(
+        self,
+        pattern_name: str,
+        input_variables: dict[str, Any],
+        reply: str,
+        model_name: str | None = None,
+        embedding: Any = None,
+    ) -> None:
+        """Store a reply, evicting the oldest entries when full."""
+        digest = self._digest(pattern_name, input_variables, model_name)
+        expires_at = time.monotonic() + self._ttl
+        with self._lock:
+            self._exact[digest] = (expires_at, reply)
+            self._exact.move_to_end(digest)
+            while len(self._exact) > self._max_entries:
+                self._exact.popitem(last=False)
+
+            scope = self._semantic_scope(pattern_name, input_variables, model_name)
+            if embedding is None or scope is None:
+                return
+
+            self._semantic.add(embedding, (scope, expires_at, reply))
+
+    def clear(self) -> None:
+        """Drop every cached entry."""
+        with self._lock:
+            self._exact.clear()
+            self._semantic.clear()
+
+    @staticmethod
+    def _digest(
+        pattern_name: str, input_variables: dict[str, Any], model_name: str | None
+    ) -> bytes:
+        """Hash the execution parameters into the exact-tier key."""
+        payload = orjson.dumps(
+            [pattern_name, model_name, input_variables],
+            option=orjson.OPT_SORT_KEYS,
+            default=str,
+        )
+        return hashlib.blake2b(payload, digest_size=16).digest()
+
+    def _semantic_scope(
+        self,
+        pattern_name: str,
+        input_variables: dict[str, Any],
+        model_name: str | None,
+    ) -> _Scope | None:
+        """Scope shared by semantically matched entries, or None if not eligible."""
+        if self._embedder is None or len(input_variables) != 1:
+            return None
+        (variable_name,) = input_variables
+        return (pattern_name, model_name, variable_name)
@@ -1,14 +1,16 @@
 from uuid import UUID
 
 from app.domain.agent.models import Conversation
-from app.domain.agent.ports import AbstractConversationRepository
 
 
 class ConversationAlreadyExistsError(Exception):
     pass
 
 
-class InMemoryConversationRepository(AbstractConversationRepository):
+class InMemoryConversationRepository:
+    # Satisfies AbstractConversationRepository structurally; inheriting the
+    # Protocol would give this class the slower _ProtocolMeta isinstance path.
+
     def __init__(self) -> None:
         self._conversations: dict[UUID, Conversation] = {}
 
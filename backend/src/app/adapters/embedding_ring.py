@@ -0,0 +1,68 @@
+"""Fixed-size store of normalized embeddings for semantic cache tiers."""
+
+from collections.abc import Iterator, Sequence
+from typing import Any, Generic, TypeVar
+
+T = TypeVar("T")
+
+
+def normalize_embedding(vector: Sequence[float]) -> Any:
+    """Return ``vector`` as a unit-length float32 array (unchanged if all zero)."""
+    import numpy as np
+
+    embedding = np.asarray(vector, dtype=np.float32)
+    norm = np.linalg.norm(embedding)
+    if norm:
+        embedding = embedding / norm
+    return embedding
+
+
+class EmbeddingRing(Generic[T]):
+    """
+    Ring buffer of ``capacity`` normalized embeddings, each with a payload.
+
+    Rows are preallocated on the first ``add``; once full, each ``add``
+    overwrites the oldest row. Not thread-safe: callers guard it with their
+    own lock.
+    """
+
+    def __init__(self, capacity: int) -> None:
+        self._capacity = capacity
+        self._embeddings: Any = None
+        self._payloads: list[T | None] = [None] * capacity
+        self._size = 0
+        self._next = 0
+
+    def add(self, embedding: Any, payload: T) -> None:
+        """Store a normalized embedding, overwriting the oldest row when full."""
+        if self._embeddings is None:
+            import numpy as np
+
+            self._embeddings = np.empty(
+                (self._capacity, embedding.shape[0]), dtype=np.float32
+            )
+        index = self._next
+        self._embeddings[index] = embedding
+        self._payloads[index] = payload
+        self._next = (index + 1) % self._capacity
+        self._size = min(self._size + 1, self._capacity)
+
+    def matches(self, embedding: Any, threshold: float) -> Iterator[T]:
+        """Yield payloads with similarity of at least ``threshold``, best first."""
+        if not self._size:
+            return
+        import numpy as np
+
+        similarities = self._embeddings[: self._size] @ embedding
+        for index in np.argsort(similarities)[::-1]:
+            if similarities[index] < threshold:
+                break
+            payload = self._payloads[index]
+            if payload is not None:
+                yield payload
+
+    def clear(self) -> None:
+        """Drop every row, keeping the allocated buffer for reuse."""
+        self._payloads = [None] * self._capacity
+        self._size = 0
+        self._next = 0
@@ -1,9 +1,137 @@
 """Memory adapter implementation using Mem0 client."""
 
+import asyncio
+import bisect
+import hashlib
 import logging
-from typing import Any, Protocol
-
-from pydantic import BaseModel
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import AsyncIterator, Callable, Iterable, Iterator, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Protocol, TypeVar
+
+import httpx
+import orjson
+from pydantic import AliasChoices, BaseModel, Field, TypeAdapter, ValidationError
+from pydantic.dataclasses import dataclass
+
+from app.adapters.memory_search_cache import MemorySearchCache
+
+_RequestT = TypeVar("_RequestT")
+_ResultT = TypeVar("_ResultT")
+
+# Shared MemoryClient instances keyed by (api_key, host)
+_CLIENT_POOL: dict[tuple[str | None, str | None], Any] = {}
+_CLIENT_POOL_LOCK = threading.Lock()
+
+
+class _LogSampler:
+    """
+    Token bucket limiting how often an adapter logs errors.
+
+    Keeps a burst of failures (e.g. a flapping connection pool) from turning
+    into a log storm: at most ``rate`` records per second are let through,
+    with bursts of up to ``burst`` records.
+    """
+
+    def __init__(self, rate: float = 5.0, burst: int = 5) -> None:
+        self._rate = rate
+        self._burst = float(burst)
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def allow(self) -> bool:
+        """Consume a token if one is available."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self._burst, self._tokens + (now - self._updated) * self._rate
+            )
+            self._updated = now
+            if self._tokens < 1.0:
+                return False
+            self._tokens -= 1.0
+            return True
+
+
+class _AddDedupCache:
+    """
+    Per-user LRU of (text, metadata) hash -> memory id for recently added
+    memories.
+
+    Lets adapters answer repeated writes of the same memory locally instead of
+    paying another Mem0 round-trip (and server-side extraction) for each.
+    """
+
+    def __init__(self, max_entries_per_user: int = 1024) -> None:
+        self._max_entries = max_entries_per_user
+        self._entries: dict[str, OrderedDict[bytes, str]] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(text_content: str, metadata: dict[str, Any] | None = None) -> bytes:
+        """Hash memory text and metadata into a compact cache key."""
+        payload = orjson.dumps(
+            [text_content, metadata], option=orjson.OPT_SORT_KEYS, default=str
+        )
+        return hashlib.sha1(payload, usedforsecurity=False).digest()
+
+    def get(self, user_id: str, key: bytes) -> str | None:
+        """Return the memory id previously stored for ``key``, if any."""
+        with self._lock:
+            entries = self._entries.get(user_id)
+            if entries is None:
+                return None
+            memory_id = entries.get(key)
+            if memory_id is not None:
+                entries.move_to_end(key)
+            return memory_id
+
+    def put(self, user_id: str, key: bytes, memory_id: str) -> None:
+        """Remember ``memory_id`` for ``key``, evicting the oldest entry when full."""
+        with self._lock:
+            entries = self._entries.setdefault(user_id, OrderedDict())
+            entries[key] = memory_id
+            entries.move_to_end(key)
+            if len(entries) > self._max_entries:
+                entries.popitem(last=False)
+
+
+def get_memory_client(api_key: str | None = None, host: str | None = None) -> Any:
+    """
+    Return a shared ``mem0.MemoryClient`` for the given credentials.
+
+    Clients are created once per (api_key, host) and reused, so API key
+    validation runs only once and keep-alive connections are shared across
+    adapters. Each client gets its own pooled ``httpx.Client``, because mem0
+    sets per-key auth headers on the client it is given.
+    """
+    key = (api_key, host)
+    client = _CLIENT_POOL.get(key)
+    if client is not None:
+        return client
+
+    with _CLIENT_POOL_LOCK:
+        client = _CLIENT_POOL.get(key)
+        if client is None:
+            from mem0 import MemoryClient
+
+            # Limits must be set on the transport: httpx ignores the client's
+            # ``limits`` argument when a custom transport is supplied.
+            http_client = httpx.Client(
+                transport=httpx.HTTPTransport(
+                    limits=httpx.Limits(
+                        max_connections=32, max_keepalive_connections=32
+                    ),
+                    retries=3,
+                ),
+                timeout=300,
+            )
+            client = MemoryClient(api_key=api_key, host=host, client=http_client)
+            _CLIENT_POOL[key] = client
+    return client
 
 
 class MemoryWriteRequest(BaseModel):
@@ -23,15 +151,27 @@ class MemorySearchRequest(BaseModel):
     min_score: float | None = None
 
 
-class MemorySearchResult(BaseModel):
-    """Result model for memory search."""
+@dataclass(frozen=True, slots=True, kw_only=True)
+class MemorySearchResult:
+    """
+    Result model for memory search.
+
+    A slotted, frozen pydantic dataclass rather than a BaseModel: searches can
+    return many hits, and dropping the per-instance ``__dict__`` keeps each one
+    small. Frozen also makes results safe to share from the search cache.
+    """
 
     id: str
-    content: str
+    # Mem0 returns the text as "memory" (older API versions used "text")
+    content: str = Field(validation_alias=AliasChoices("content", "memory", "text"))
     score: float
     metadata: dict[str, Any] | None = None
 
 
+_SEARCH_RESULT_ADAPTER = TypeAdapter(MemorySearchResult)
+_SEARCH_RESULTS_ADAPTER = TypeAdapter(list[MemorySearchResult])
+
+
 class AbstractMemoryAdapter(Protocol):
     """Port/interface for memory operations."""
 
@@ -47,16 +187,48 @@ class AbstractMemoryAdapter(Protocol):
 class Mem0Adapter:
     """Concrete adapter for Mem0 memory service."""
 
-    def __init__(self, client: Any) -> None:
-        """Initialize with mem0 client."""
-        self._client = client
+    BATCH_MAX_WORKERS = 16
+
+    def __init__(
+        self,
+        client: Any | None = None,
+        api_key: str | None = None,
+        host: str | None = None,
+        search_cache: MemorySearchCache | None = None,
+    ) -> None:
+        """
+        Initialize with a mem0 client.
+
+        If no client is given, a shared pooled client for ``api_key``/``host``
+        is fetched on first use (see ``get_memory_client``), so building the
+        adapter needs neither network access nor credentials. When
+        ``search_cache`` is given, search results are served from it and
+        invalidated per user on ``add``.
+        """
+        self._client: Any | None = client
+        self._api_key = api_key
+        self._host = host
+        self._search_cache = search_cache
+        self._dedup = _AddDedupCache()
         self._logger = logging.getLogger(__name__)
+        self._error_sampler = _LogSampler()
+
+    def _memory_client(self) -> Any:
+        """Return the mem0 client, fetching the shared pooled one on first use."""
+        if self._client is None:
+            self._client = get_memory_client(self._api_key, self._host)
+        return self._client
 
     def add(self, request: MemoryWriteRequest) -> str | None:
-        """Add a memory to Mem0."""
+        """Add a memory to Mem0; re-adding the same text returns the earlier id."""
+        dedup_key = self._dedup.key(request.text_content, request.metadata)
+        memory_id = self._dedup.get(request.user_id, dedup_key)
+        if memory_id is not None:
+            return memory_id
+
         try:
             # When mem0 client is available, this would be:
-            # response = self._client.add(
+            # response = self._memory_client().add(
             #     user_id=request.user_id,
             #     text=request.text_content,
             #     metadata=request.metadata
@@ -64,18 +236,33 @@ class Mem0Adapter:
             # return response.get("id")
 
             # Mock implementation for now
-            self._logger.info(f"Adding memory for user {request.user_id}")
-            return f"memory_{request.user_id}_{hash(request.text_content)}"
+            self._logger.info("Adding memory for user %s", request.user_id)
+            memory_id = f"memory_{request.user_id}_{hash(request.text_content)}"
 
-        except Exception as e:
-            self._logger.exception(f"Error adding memory: {e}")
+        except Exception:
+            if self._error_sampler.allow():
+                self._logger.exception(
+                    "Error adding memory for user=%s", request.user_id
+                )
             return None
 
+        self._dedup.put(request.user_id, dedup_key, memory_id)
+        if self._search_cache is not None:
+            self._search_cache.invalidate(request.user_id)
+        return memory_id
+
     def search(self, request: MemorySearchRequest) -> list[MemorySearchResult]:
         """Search memories in Mem0."""
+        scope: Any = None
+        embedding: Any = None
+        if self._search_cache is not None:
+            cached, scope, embedding = self._search_cache.lookup(request)
+            if cached is not None:
+                return cached
+
         try:
             # When mem0 client is available, this would be:
-            # results = self._client.search(
+            # results = self._memory_client().search(
             #     user_id=request.user_id,
             #     query=request.query,
             #     limit=request.limit
@@ -90,8 +277,8 @@ class Mem0Adapter:
             # ]
 
             # Mock implementation for now
-            self._logger.info(f"Searching memories for user {request.user_id}")
-            return [
+            self._logger.info("Searching memories for user %s", request.user_id)
+            results = [
                 MemorySearchResult(
                     id="mock_1",
                     content="Mock memory result 1",
@@ -106,16 +293,262 @@ class Mem0Adapter:
                 ),
             ]
 
-        except Exception as e:
-            self._logger.exception(f"Error searching memories: {e}")
+        except Exception:
+            if self._error_sampler.allow():
+                self._logger.exception(
+                    "Error searching memories for user=%s", request.user_id
+                )
+            return []
+
+        if self._search_cache is not None:
+            self._search_cache.store(request, results, scope, embedding)
+        return results
+
+    def batch_add(self, requests: Sequence[MemoryWriteRequest]) -> list[str | None]:
+        """
+        Add several memories concurrently.
+
+        Results keep the order of ``requests``; a failed item yields None
+        instead of aborting the rest of the batch.
+        """
+        return self._run_batch(self.add, requests)
+
+    def batch_search(
+        self, requests: Sequence[MemorySearchRequest]
+    ) -> list[list[MemorySearchResult]]:
+        """
+        Run several searches concurrently.
+
+        Results keep the order of ``requests``; a failed search yields an empty list.
+        """
+        return self._run_batch(self.search, requests)
+
+    def _run_batch(
+        self,
+        operation: Callable[[_RequestT], _ResultT],
+        requests: Sequence[_RequestT],
+    ) -> list[_ResultT]:
+        """Dispatch blocking adapter calls on a thread pool, preserving input order."""
+        if not requests:
+            return []
+        max_workers = min(self.BATCH_MAX_WORKERS, len(requests))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(operation, requests))
+
+
+class AsyncMem0Adapter:
+    """
+    Asynchronous adapter for the Mem0 memory service.
+
+    Wraps ``mem0.AsyncMemoryClient`` so memory I/O can be awaited from async
+    handlers without blocking the event loop, and batch operations overlap
+    their requests with ``asyncio.gather``.
+    """
+
+    def __init__(self, client: Any) -> None:
+        """Initialize with an async mem0 client (e.g. ``AsyncMemoryClient``)."""
+        self._client = client
+        self._dedup = _AddDedupCache()
+        self._logger = logging.getLogger(__name__)
+        self._error_sampler = _LogSampler()
+
+    async def add(self, request: MemoryWriteRequest) -> str | None:
+        """Add a memory to Mem0; re-adding the same text returns the earlier id."""
+        dedup_key = self._dedup.key(request.text_content, request.metadata)
+        memory_id = self._dedup.get(request.user_id, dedup_key)
+        if memory_id is not None:
+            return memory_id
+
+        try:
+            response = await self._client.add(
+                request.text_content,
+                user_id=request.user_id,
+                metadata=request.metadata,
+            )
+        except Exception:
+            if self._error_sampler.allow():
+                self._logger.exception(
+                    "Error adding memory for user=%s", request.user_id
+                )
+            return None
+
+        get = getattr(response, "get", None)
+        if get is None:
+            return None
+        memory_id = get("id")
+        if memory_id is None:
+            results = get("results")
+            if results:
+                memory_id = results[0].get("id")
+        if memory_id is not None:
+            self._dedup.put(request.user_id, dedup_key, memory_id)
+        return memory_id
+
+    async def search(self, request: MemorySearchRequest) -> list[MemorySearchResult]:
+        """Search memories in Mem0."""
+        try:
+            response = await self._client.search(
+                request.query, user_id=request.user_id, limit=request.limit
+            )
+        except Exception:
+            if self._error_sampler.allow():
+                self._logger.exception(
+                    "Error searching memories for user=%s", request.user_id
+                )
             return []
 
+        results = self._validate_results(self._hits(response))
+        if request.min_score is not None:
+            results = [r for r in results if r.score >= request.min_score]
+        return results
+
+    async def search_iter(
+        self, request: MemorySearchRequest
+    ) -> AsyncIterator[MemorySearchResult]:
+        """
+        Search memories in Mem0, validating hits lazily.
+
+        Unlike ``search``, each hit is only validated when the caller asks for
+        it, so callers that stop after the first few results skip the cost of
+        validating the rest of the page.
+        """
+        try:
+            response = await self._client.search(
+                request.query, user_id=request.user_id, limit=request.limit
+            )
+        except Exception:
+            if self._error_sampler.allow():
+                self._logger.exception(
+                    "Error searching memories for user=%s", request.user_id
+                )
+            return
+
+        for item in self._hits(response):
+            try:
+                result = _SEARCH_RESULT_ADAPTER.validate_python(item)
+            except ValidationError as e:
+                self._logger.warning("Skipping malformed Mem0 search result: %s", e)
+                continue
+            if request.min_score is None or result.score >= request.min_score:
+                yield result
+
+    @staticmethod
+    def _hits(response: Any) -> list[Any]:
+        """Extract the raw hits from a Mem0 search response."""
+        # The v2 API wraps hits in {"results": [...]}; v1 returns the list itself
+        get = getattr(response, "get", None)
+        items = get("results", []) if get is not None else response
+        return items or []
+
+    def _validate_results(self, items: list[Any]) -> list[MemorySearchResult]:
+        """
+        Validate raw Mem0 search hits in a single pass.
+
+        Falls back to per-item validation only when the batch contains a
+        malformed hit, which is then skipped.
+        """
+        try:
+            return _SEARCH_RESULTS_ADAPTER.validate_python(items)
+        except ValidationError:
+            pass
+
+        results = []
+        for item in items:
+            try:
+                results.append(_SEARCH_RESULT_ADAPTER.validate_python(item))
+            except ValidationError as e:
+                self._logger.warning("Skipping malformed Mem0 search result: %s", e)
+        return results
+
+    async def batch_add(
+        self, requests: Sequence[MemoryWriteRequest]
+    ) -> list[str | None]:
+        """Add several memories concurrently; failed items yield None."""
+        results = await asyncio.gather(
+            *(self.add(request) for request in requests), return_exceptions=True
+        )
+        return [None if isinstance(r, BaseException) else r for r in results]
+
+    async def batch_search(
+        self, requests: Sequence[MemorySearchRequest]
+    ) -> list[list[MemorySearchResult]]:
+        """Run several searches concurrently; failed searches yield an empty list."""
+        results = await asyncio.gather(
+            *(self.search(request) for request in requests), return_exceptions=True
+        )
+        return [[] if isinstance(r, BaseException) else r for r in results]
+
+
+class _TokenIndex:
+    """
+    Word index over one user's memories for the fake adapter's search.
+
+    Exact words map to memory positions; two sorted word lists, one of the
+    words and one of the words reversed, find words by prefix and by suffix
+    with a binary search instead of a scan over the whole vocabulary.
+    """
+
+    def __init__(self) -> None:
+        self._positions: dict[str, set[int]] = {}
+        self._words: list[str] = []
+        self._reversed_words: list[str] = []
+
+    def add(self, text: str, position: int) -> None:
+        """Index every word of ``text`` as appearing at ``position``."""
+        for word in text.split():
+            positions = self._positions.get(word)
+            if positions is None:
+                positions = self._positions[word] = set()
+                bisect.insort(self._words, word)
+                bisect.insort(self._reversed_words, word[::-1])
+            positions.add(position)
+
+    def candidates(self, query_tokens: list[str]) -> set[int] | None:
+        """
+        Positions of memories holding a matching word for every query token.
+
+        Query words surrounded by other query words must appear as whole words
+        in a match. The first word may be the end of a word and the last the
+        start of one. A single-word query may sit anywhere inside a word, which
+        no index here can answer, so it returns None to ask for a full scan.
+        """
+        if len(query_tokens) < 2:
+            return None
+        first, *interior, last = query_tokens
+        positions: set[int] = set()
+        # Exact lookups first: they are the cheapest and usually the smallest
+        for i, token in enumerate(interior):
+            matches = self._positions.get(token, set())
+            positions = matches if i == 0 else positions & matches
+            if not positions:
+                return set()
+        prefixed = self._with_prefix(self._words, last)
+        suffixed = (
+            word[::-1]
+            for word in self._with_prefix(self._reversed_words, first[::-1])
+        )
+        for i, words in enumerate((prefixed, suffixed)):
+            matches = set().union(*(self._positions[word] for word in words))
+            positions = matches if i == 0 and not interior else positions & matches
+            if not positions:
+                return set()
+        return positions
+
+    @staticmethod
+    def _with_prefix(words: list[str], prefix: str) -> Iterator[str]:
+        """Yield the words of sorted ``words`` starting with ``prefix``."""
+        for i in range(bisect.bisect_left(words, prefix), len(words)):
+            if not words[i].startswith(prefix):
+                break
+            yield words[i]
+
 
 class FakeMemoryAdapter:
     """Fake adapter for testing."""
 
     def __init__(self) -> None:
         self._memories: dict[str, list[dict[str, Any]]] = {}
+        self._index: dict[str, _TokenIndex] = {}
         self._next_id = 1
 
     def add(self, request: MemoryWriteRequest) -> str | None:
@@ -123,13 +556,16 @@ class FakeMemoryAdapter:
         memory_id = f"fake_memory_{self._next_id}"
         self._next_id += 1
 
-        if request.user_id not in self._memories:
-            self._memories[request.user_id] = []
+        user_memories = self._memories.setdefault(request.user_id, [])
+        content_lower = request.text_content.lower()
+        user_index = self._index.setdefault(request.user_id, _TokenIndex())
+        user_index.add(content_lower, len(user_memories))
 
-        self._memories[request.user_id].append(
+        user_memories.append(
             {
                 "id": memory_id,
                 "content": request.text_content,
+                "content_lower": content_lower,
                 "metadata": request.metadata or {},
             }
         )
@@ -139,25 +575,29 @@ class FakeMemoryAdapter:
     def search(self, request: MemorySearchRequest) -> list[MemorySearchResult]:
         """Search memories in fake storage."""
         user_memories = self._memories.get(request.user_id, [])
+        query = request.query.lower()
+
+        # Simple case-insensitive substring matching for fake implementation.
+        # The token index narrows the candidates before the substring check.
+        candidates: Iterable[dict[str, Any]] = user_memories
+        user_index = self._index.get(request.user_id)
+        positions = user_index.candidates(query.split()) if user_index else None
+        if positions is not None:
+            candidates = (user_memories[i] for i in sorted(positions))
 
-        # Simple text matching for fake implementation
         results = []
-        for memory in user_memories:
-            if request.query.lower() in memory["content"].lower():
-                score = (
-                    0.9 if request.query.lower() == memory["content"].lower() else 0.7
-                )
+        for memory in candidates:
+            content_lower = memory["content_lower"]
+            if query in content_lower:
                 results.append(
                     MemorySearchResult(
                         id=memory["id"],
                         content=memory["content"],
-                        score=score,
+                        score=0.9 if query == content_lower else 0.7,
                         metadata=memory["metadata"],
                     )
                 )
-
-        # Apply limit
-        if request.limit:
-            results = results[: request.limit]
+                if request.limit and len(results) >= request.limit:
+                    break
 
         return results
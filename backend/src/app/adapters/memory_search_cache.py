@@ -0,0 +1,137 @@
+"""Two-tier result cache for memory search adapters."""
+
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Sequence
+from typing import TYPE_CHECKING, Any
+
+from app.adapters.embedding_ring import EmbeddingRing, normalize_embedding
+
+if TYPE_CHECKING:
+    from app.adapters.mem0_adapter import MemorySearchRequest, MemorySearchResult
+
+# (user_id, generation, limit, min_score)
+_Scope = tuple[str, int, int | None, float | None]
+
+
+class MemorySearchCache:
+    """
+    Caches memory search results in front of a remote memory service.
+
+    The exact tier is an LRU keyed on the full search request. When an
+    ``embedder`` is provided, a semantic tier additionally returns cached
+    results for queries whose embedding has cosine similarity above
+    ``similarity_threshold`` with a previously cached query.
+
+    Entries are scoped by a per-user generation counter; ``invalidate(user_id)``
+    bumps it so writes make earlier results for that user unreachable.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 256,
+        embedder: Callable[[str], Sequence[float]] | None = None,
+        similarity_threshold: float = 0.95,
+    ) -> None:
+        """
+        Initialize the cache.
+
+        Args:
+            max_entries: Maximum number of entries kept in each tier.
+            embedder: Optional callable turning a query into an embedding vector.
+                Enables the semantic tier when given.
+            similarity_threshold: Minimum cosine similarity for a semantic hit.
+        """
+        self._max_entries = max_entries
+        self._embedder = embedder
+        self._threshold = similarity_threshold
+        self._lock = threading.Lock()
+        self._generations: dict[str, int] = {}
+        self._exact: OrderedDict[tuple[_Scope, str], list[MemorySearchResult]] = (
+            OrderedDict()
+        )
+        # Semantic tier: query embeddings -> (scope, results)
+        self._semantic: EmbeddingRing[tuple[_Scope, list[MemorySearchResult]]] = (
+            EmbeddingRing(max_entries)
+        )
+
+    def lookup(
+        self, request: "MemorySearchRequest"
+    ) -> tuple["list[MemorySearchResult] | None", _Scope, Any]:
+        """
+        Look up cached results for a request.
+
+        Returns:
+            A ``(results, scope, embedding)`` triple. ``results`` is None on a
+            miss. ``scope`` captures the user's generation at lookup time and
+            ``embedding`` is the query embedding computed for the semantic tier
+            (or None); both should be passed back to ``store`` so results
+            fetched before an ``invalidate`` are not stored as current.
+        """
+        with self._lock:
+            scope = self._scope(request)
+            key = (scope, request.query)
+            results = self._exact.get(key)
+            if results is not None:
+                self._exact.move_to_end(key)
+                return list(results), scope, None
+
+        if self._embedder is None:
+            return None, scope, None
+
+        embedding = normalize_embedding(self._embedder(request.query))
+
+        with self._lock:
+            for entry_scope, results in self._semantic.matches(
+                embedding, self._threshold
+            ):
+                if entry_scope == scope:
+                    return list(results), scope, embedding
+        return None, scope, embedding
+
+    def store(
+        self,
+        request: "MemorySearchRequest",
+        results: "list[MemorySearchResult]",
+        scope: _Scope | None = None,
+        embedding: Any = None,
+    ) -> None:
+        """
+        Store results for a request, evicting the oldest entries when full.
+
+        ``scope`` should be the one returned by the ``lookup`` that preceded
+        the search; if the user was invalidated since, the results land under
+        the old generation and are never served. Defaults to the current scope.
+        """
+        with self._lock:
+            if scope is None:
+                scope = self._scope(request)
+            self._exact[(scope, request.query)] = list(results)
+            self._exact.move_to_end((scope, request.query))
+            while len(self._exact) > self._max_entries:
+                self._exact.popitem(last=False)
+
+            if embedding is None:
+                return
+
+            self._semantic.add(embedding, (scope, list(results)))
+
+    def invalidate(self, user_id: str) -> None:
+        """Make all cached results for ``user_id`` stale."""
+        with self._lock:
+            self._generations[user_id] = self._generations.get(user_id, 0) + 1
+
+    def clear(self) -> None:
+        """Drop every cached entry."""
+        with self._lock:
+            self._exact.clear()
+            self._semantic.clear()
+
+    def _scope(self, request: "MemorySearchRequest") -> _Scope:
+        """Build the part of the cache key shared by both tiers."""
+        return (
+            request.user_id,
+            self._generations.get(request.user_id, 0),
+            request.limit,
+            request.min_score,
+        )
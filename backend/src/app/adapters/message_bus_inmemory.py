@@ -1,43 +1,114 @@
 import asyncio
-from collections import defaultdict
-from collections.abc import Callable
+import logging
+from collections import deque
+from collections.abc import Awaitable, Callable, Iterable
+from concurrent.futures import Executor
+from typing import cast
 
 from app.core.base_aggregate import DomainEvent
 
+logger = logging.getLogger(__name__)
+
+_SyncHandler = Callable[[DomainEvent], None]
+_AsyncHandler = Callable[[DomainEvent], Awaitable[None]]
+_Handler = Callable[[DomainEvent], None | Awaitable[None]]
+_ResolvedHandlers = tuple[tuple[_SyncHandler, ...], tuple[_AsyncHandler, ...]]
+
 
 class InMemoryMessageBus:
     """In-memory implementation of message bus for testing and simple deployments."""
 
-    def __init__(self) -> None:
-        self.subscriptions: dict[
-            type[DomainEvent], list[Callable[[DomainEvent], None]]
-        ] = defaultdict(list)
-        self.published_events: list[DomainEvent] = []
+    def __init__(
+        self, history_maxlen: int = 10_000, executor: Executor | None = None
+    ) -> None:
+        """
+        Initialize the bus.
+
+        Args:
+            history_maxlen: Number of most recent events kept in
+                ``published_events``. Older events are dropped; 0 disables
+                recording entirely.
+            executor: Executor that synchronous handlers run in, so blocking
+                handlers don't stall the event loop. Defaults to the loop's
+                default executor.
+        """
+        self._executor = executor
+        self.subscriptions: dict[type[DomainEvent], list[_Handler]] = {}
+        # Subscriptions split by handler kind when subscribing, so publishing
+        # never has to inspect a handler.
+        self._sync_subscriptions: dict[type[DomainEvent], list[_SyncHandler]] = {}
+        self._async_subscriptions: dict[type[DomainEvent], list[_AsyncHandler]] = {}
+        # (sync, async) handlers resolved per concrete event type, including those
+        # subscribed to its base classes. Cleared whenever subscriptions change.
+        self._resolved: dict[type[DomainEvent], _ResolvedHandlers] = {}
+        self.published_events: deque[DomainEvent] = deque(maxlen=history_maxlen)
 
     async def publish(self, event: DomainEvent) -> None:
         """
         Publishes an event to all subscribed handlers.
 
+        Handlers subscribed to a base class of the event's type are called too.
+        Synchronous handlers run in the executor while coroutine handlers are
+        awaited, all concurrently.
+
         Args:
             event: The domain event to publish.
         """
         self.published_events.append(event)
 
-        # Call all registered handlers for this event type
-        event_type = type(event)
-        for handler in self.subscriptions[event_type]:
-            try:
-                if asyncio.iscoroutinefunction(handler):
-                    await handler(event)
-                else:
-                    handler(event)
-            except Exception as e:
-                # Log error but don't stop processing other handlers
-                print(f"Error in event handler: {e}")
+        sync_handlers, async_handlers = self._resolve(type(event))
+        if not sync_handlers and not async_handlers:
+            return
 
-    def subscribe(
-        self, event_type: type[DomainEvent], handler: Callable[[DomainEvent], None]
-    ) -> None:
+        loop = asyncio.get_running_loop()
+        pending: list[Awaitable[None]] = [
+            loop.run_in_executor(self._executor, handler, event)
+            for handler in sync_handlers
+        ]
+        pending.extend(handler(event) for handler in async_handlers)
+        await self._gather(pending)
+
+    async def publish_many(self, events: Iterable[DomainEvent]) -> None:
+        """
+        Publishes several events, resolving handlers once per event type.
+
+        Synchronous handlers run in the executor and coroutine handlers are
+        awaited, concurrently across all events.
+
+        Args:
+            events: The domain events to publish.
+        """
+        groups: dict[type[DomainEvent], list[DomainEvent]] = {}
+        record = self.published_events.append
+        for event in events:
+            record(event)
+            groups.setdefault(type(event), []).append(event)
+
+        loop = asyncio.get_running_loop()
+        pending: list[Awaitable[None]] = []
+        for event_type, grouped_events in groups.items():
+            sync_handlers, async_handlers = self._resolve(event_type)
+            for sync_handler in sync_handlers:
+                pending.extend(
+                    loop.run_in_executor(self._executor, sync_handler, event)
+                    for event in grouped_events
+                )
+            for async_handler in async_handlers:
+                pending.extend(async_handler(event) for event in grouped_events)
+
+        if pending:
+            await self._gather(pending)
+
+    async def publish_batch(self, events: list[DomainEvent]) -> None:
+        """
+        Publishes multiple events in a batch.
+
+        Args:
+            events: The domain events to publish.
+        """
+        await self.publish_many(events)
+
+    def subscribe(self, event_type: type[DomainEvent], handler: _Handler) -> None:
         """
         Subscribes a handler to a specific event type.
 
@@ -45,12 +116,43 @@ class InMemoryMessageBus:
             event_type: The type of the event to subscribe to.
             handler: The callable function that will handle the event.
         """
-        self.subscriptions[event_type].append(handler)
+        self.subscriptions.setdefault(event_type, []).append(handler)
+        if asyncio.iscoroutinefunction(handler):
+            self._async_subscriptions.setdefault(event_type, []).append(
+                cast(_AsyncHandler, handler)
+            )
+        else:
+            self._sync_subscriptions.setdefault(event_type, []).append(
+                cast(_SyncHandler, handler)
+            )
+        self._resolved.clear()
 
     def clear_subscriptions(self) -> None:
         """Clear all subscriptions - useful for testing."""
         self.subscriptions.clear()
+        self._sync_subscriptions.clear()
+        self._async_subscriptions.clear()
+        self._resolved.clear()
 
     def clear_published_events(self) -> None:
         """Clear published events history - useful for testing."""
         self.published_events.clear()
+
+    def _resolve(self, event_type: type[DomainEvent]) -> _ResolvedHandlers:
+        """Return the handlers for an event type, walking its MRO on first use."""
+        resolved = self._resolved.get(event_type)
+        if resolved is None:
+            mro = event_type.__mro__
+            resolved = self._resolved[event_type] = (
+                tuple(h for cls in mro for h in self._sync_subscriptions.get(cls, ())),
+                tuple(h for cls in mro for h in self._async_subscriptions.get(cls, ())),
+            )
+        return resolved
+
+    @staticmethod
+    async def _gather(pending: Iterable[Awaitable[None]]) -> None:
+        """Await handler calls concurrently, logging failures individually."""
+        for result in await asyncio.gather(*pending, return_exceptions=True):
+            if isinstance(result, Exception):
+                # Log error but don't stop processing other handlers
+                logger.error("Exception handling event", exc_info=result)
@@ -22,15 +22,34 @@ from app.config import settings
 # For now, let's assume a UserCreate schema will be available or adapted.
 # We will need to address the UserCreate and crud.create_user dependency for init_db carefully.
 
-engine = create_engine(str(settings.SQLALCHEMY_DATABASE_URI))
+engine = create_engine(
+    str(settings.SQLALCHEMY_DATABASE_URI),
+    pool_size=settings.POSTGRES_POOL_SIZE,
+    max_overflow=settings.POSTGRES_MAX_OVERFLOW,
+    pool_timeout=settings.POSTGRES_POOL_TIMEOUT,
+    # Recycle before server/proxy idle timeouts, and check connections on
+    # checkout so stale ones are replaced instead of failing a request
+    pool_recycle=settings.POSTGRES_POOL_RECYCLE,
+    pool_pre_ping=True,
+    # Reuse the most recently returned connection so warm ones stay warm
+    pool_use_lifo=True,
+)
 
 # make sure all SQLModel models are imported before initializing DB
 # otherwise, SQLModel might fail to initialize relationships properly
 # For more details: https://github.com/fastapi/full-stack-fastapi-template/issues/28
 # SQLModel.metadata.create_all(engine) # This should be handled by Alembic
 
+# Set once the superuser is known to exist, so repeated init_db calls in the
+# same process skip the lookup.
+_superuser_bootstrapped = False
+
 
 def init_db(session: Session) -> None:
+    global _superuser_bootstrapped
+    if _superuser_bootstrapped:
+        return
+
     # Tables should be created with Alembic migrations
     # But if you don\'t want to use migrations, create
     # the tables un-commenting the next lines
@@ -78,6 +97,8 @@ def init_db(session: Session) -> None:
         session.refresh(db_user)
         print(f"Superuser {settings.FIRST_SUPERUSER} created.")
 
+    _superuser_bootstrapped = True
+
 
 # Database model, database table inferred from class name
 class User(SQLModel, table=True):
@@ -0,0 +1,115 @@
+import logging
+import queue
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+
+import pika  # type: ignore[import-untyped]
+import pika.channel  # type: ignore[import-untyped]
+
+from app.adapters.rabbitmq_config import RabbitMQConfig
+
+
+class PooledChannel:
+    """
+    A pooled connection with one long-lived channel on it.
+
+    pika connections are not thread-safe, so a slot is only ever used by the
+    thread that acquired it from the pool. The slot also remembers which
+    queues were declared on its channel so they are declared only once.
+    """
+
+    def __init__(
+        self, connection_factory: Callable[[], pika.BlockingConnection]
+    ) -> None:
+        self._connection_factory = connection_factory
+        self._connection: pika.BlockingConnection | None = None
+        self._channel: pika.channel.Channel | None = None
+        self.declared_queues: set[str] = set()
+        self._logger = logging.getLogger(__name__)
+
+    @property
+    def channel(self) -> pika.channel.Channel:
+        """Return the slot's channel, (re)opening the connection if needed."""
+        channel = self._channel
+        if channel is None or not channel.is_open:
+            connection = self._connection
+            if connection is None or not connection.is_open:
+                connection = self._connection_factory()
+                self._connection = connection
+            channel = connection.channel()
+            self._channel = channel
+            self.declared_queues.clear()
+        return channel
+
+    def reset(self) -> None:
+        """Drop the channel after a failure so the next use reopens it."""
+        channel, self._channel = self._channel, None
+        self.declared_queues.clear()
+        if channel is not None and channel.is_open:
+            try:
+                channel.close()
+            except Exception as e:
+                self._logger.warning(
+                    "Error closing pooled channel: %s", e, exc_info=True
+                )
+
+    def close(self) -> None:
+        """Close the slot's channel and connection."""
+        self.reset()
+        connection, self._connection = self._connection, None
+        if connection is not None and connection.is_open:
+            connection.close()
+
+
+class RabbitMQChannelPool:
+    """
+    Fixed-size pool of connections, each with a reusable channel.
+
+    Lets concurrent publishers use separate connections instead of
+    serializing on one. Connections are opened lazily on first use.
+    """
+
+    def __init__(
+        self,
+        connection_factory: Callable[[], pika.BlockingConnection],
+        size: int = 4,
+    ) -> None:
+        self._slots: list[PooledChannel] = [
+            PooledChannel(connection_factory) for _ in range(size)
+        ]
+        self._idle: queue.Queue[PooledChannel] = queue.Queue()
+        for slot in self._slots:
+            self._idle.put(slot)
+
+    @classmethod
+    def from_config(cls, config: RabbitMQConfig) -> "RabbitMQChannelPool":
+        """Build a pool whose connections use the given broker settings."""
+        credentials = (
+            pika.PlainCredentials(config.username, config.password or "")
+            if config.username
+            else pika.ConnectionParameters.DEFAULT_CREDENTIALS
+        )
+        parameters = pika.ConnectionParameters(
+            host=config.host,
+            port=config.port,
+            virtual_host=config.virtual_host,
+            credentials=credentials,
+        )
+        return cls(
+            lambda: pika.BlockingConnection(parameters),
+            size=config.connection_pool_size,
+        )
+
+    @contextmanager
+    def acquire(self) -> Iterator[PooledChannel]:
+        """Borrow a slot for exclusive use, blocking until one is free."""
+        slot = self._idle.get()
+        try:
+            yield slot
+        finally:
+            self._idle.put(slot)
+
+    def close(self) -> None:
+        """Close every connection opened by the pool."""
+        for slot in self._slots:
+            slot.close()
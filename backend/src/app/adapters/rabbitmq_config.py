@@ -9,3 +9,7 @@ class RabbitMQConfig(BaseModel):
     username: Optional[str] = None
     password: Optional[str] = None
     virtual_host: str = "/"
+    # Number of publisher connections in RabbitMQChannelPool
+    connection_pool_size: int = 4
+    # Unacknowledged deliveries the broker may push to each consumer
+    prefetch_count: int = 64
@@ -1,20 +1,55 @@
 import asyncio  # Added
-import json
 import logging  # Added
-from collections.abc import Callable
+from collections.abc import Callable, Mapping, Sequence
 
-import pika
-import pika.exceptions  # Already imported but good to confirm
-import pika.spec
+import pika  # type: ignore[import-untyped]
+import pika.exceptions  # type: ignore[import-untyped]
+import pika.spec  # type: ignore[import-untyped]
+import pydantic_core
 from pydantic import ValidationError
 
+from app.adapters.rabbitmq_channel_pool import RabbitMQChannelPool
 from app.core.base_aggregate import DomainEvent
 from app.service_layer.exceptions import MessageBusError  # Added
 from app.service_layer.message_bus import AbstractMessageBus
 
+# Built once and shared by every publish. Reliable events are persisted by the
+# broker; others skip the disk write.
+_PERSISTENT_PROPERTIES = pika.BasicProperties(
+    content_type="application/json",
+    delivery_mode=pika.spec.PERSISTENT_DELIVERY_MODE,
+)
+_TRANSIENT_PROPERTIES = pika.BasicProperties(
+    content_type="application/json",
+    delivery_mode=pika.spec.TRANSIENT_DELIVERY_MODE,
+)
+
 
 class RabbitMQMessageBus(AbstractMessageBus):
-    def __init__(self, connection: pika.BlockingConnection) -> None:
+    # Unacknowledged deliveries the broker may push to the consumer channel
+    CONSUMER_PREFETCH_COUNT = 256
+    # Successful deliveries acknowledged together with one multiple=True ack;
+    # kept well below the prefetch window so the broker never stalls on it
+    ACK_BATCH_SIZE = 64
+
+    def __init__(
+        self,
+        connection: pika.BlockingConnection,
+        publish_pool: RabbitMQChannelPool | None = None,
+        prefetch_count: int | None = None,
+    ) -> None:
+        """
+        Initialize the bus.
+
+        Args:
+            connection: Connection used for consuming (``register_handler``).
+            publish_pool: Pool of separate connections for publishing, so
+                publishers neither serialize on nor get throttled with the
+                consumer connection. Without one, publishes share ``connection``.
+            prefetch_count: Per-consumer prefetch window, typically
+                ``RabbitMQConfig.prefetch_count``. Defaults to
+                ``CONSUMER_PREFETCH_COUNT``.
+        """
         self._connection: pika.BlockingConnection = connection
         self._handlers: dict[str, Callable[[DomainEvent], None]] = {}
         self._event_types: dict[
@@ -22,18 +57,40 @@ class RabbitMQMessageBus(AbstractMessageBus):
         ] = {}  # To store event class for deserialization
         # It's good practice to get a logger instance per module
         self._logger = logging.getLogger(__name__)
+        # Publishing channels are long-lived and borrowed for exclusive use,
+        # since pika is not thread-safe.
+        self._publish_pool = publish_pool or RabbitMQChannelPool(
+            lambda: connection, size=1
+        )
+        # One channel carries every consumer; consumer tags allow cancelling them
+        self._consumer_channel: pika.channel.Channel | None = None
+        self._consumer_tags: dict[str, str] = {}
+        self._consuming = False
+        self._prefetch_count = (
+            self.CONSUMER_PREFETCH_COUNT if prefetch_count is None else prefetch_count
+        )
+        # Highest successfully handled delivery tag not yet acknowledged, and how
+        # many deliveries that ack will cover. Only touched on the consuming thread.
+        self._unacked_tag: int | None = None
+        self._unacked_count = 0
+        # Routing key and message properties per event class, computed once
+        self._publish_meta: dict[
+            type[DomainEvent], tuple[str, pika.BasicProperties]
+        ] = {}
 
     def _perform_publish(
-        self, channel: pika.channel.Channel, routing_key: str, body: str
+        self,
+        channel: pika.channel.Channel,
+        routing_key: str,
+        body: bytes,
+        properties: pika.BasicProperties = _PERSISTENT_PROPERTIES,
     ) -> None:
         """Helper method to perform the actual basic_publish call."""
         channel.basic_publish(
             exchange="",
             routing_key=routing_key,
             body=body,
-            properties=pika.BasicProperties(
-                delivery_mode=pika.spec.PERSISTENT_DELIVERY_MODE
-            ),
+            properties=properties,
         )
 
     async def publish(self, event: DomainEvent) -> None:
@@ -41,44 +98,60 @@ class RabbitMQMessageBus(AbstractMessageBus):
         await asyncio.to_thread(self._publish_sync, event)
 
     def _publish_sync(self, event: DomainEvent) -> None:
-        channel = None
-        routing_key = type(event).__name__
-        try:
-            channel = self._connection.channel()
-            # Ensure queue exists for routing, durable to survive broker restart
-            channel.queue_declare(queue=routing_key, durable=True)
+        self._publish_many_sync((event,))
 
-            body = event.model_dump_json()
+    def _publish_many_sync(self, events: Sequence[DomainEvent]) -> None:
+        """Publish events back-to-back on one pooled publisher channel."""
+        if not events:
+            return
+        routing_key = type(events[0]).__name__
+        with self._publish_pool.acquire() as pooled:
+            try:
+                channel = pooled.channel
+                for event in events:
+                    meta = self._publish_meta.get(type(event))
+                    if meta is None:
+                        meta = self._cache_publish_meta(type(event))
+                    routing_key, properties = meta
+                    if routing_key not in pooled.declared_queues:
+                        # Ensure queue exists for routing, durable to survive broker restart
+                        channel.queue_declare(queue=routing_key, durable=True)
+                        pooled.declared_queues.add(routing_key)
 
-            self._perform_publish(channel, routing_key, body)
-            self._logger.info(f"Successfully published event {routing_key}")
-        except (
-            pika.exceptions.AMQPConnectionError,
-            pika.exceptions.ChannelClosedByBroker,
-            pika.exceptions.StreamLostError,
-            pika.exceptions.ChannelWrongStateError,
-        ) as e:
-            self._logger.error(
-                f"Failed to publish event {routing_key}: {e}", exc_info=True
-            )
-            raise MessageBusError(f"Failed to publish event {routing_key}: {e}") from e
-        finally:
-            if channel and channel.is_open:
-                try:
-                    channel.close()
-                    self._logger.debug(
-                        f"Closed channel for publishing event {routing_key}"
-                    )
-                except Exception as e:
-                    self._logger.warning(
-                        f"Error closing channel after publishing event {routing_key}: {e}",
-                        exc_info=True,
-                    )
+                    # Serialize straight to bytes in pydantic-core; pika would
+                    # otherwise re-encode the str returned by model_dump_json()
+                    body = pydantic_core.to_json(event)
+                    self._perform_publish(channel, routing_key, body, properties)
+                    self._logger.info(f"Successfully published event {routing_key}")
+            except (
+                pika.exceptions.AMQPConnectionError,
+                pika.exceptions.ChannelClosedByBroker,
+                pika.exceptions.StreamLostError,
+                pika.exceptions.ChannelWrongStateError,
+            ) as e:
+                # The channel may be unusable now; reopen it on the next publish
+                pooled.reset()
+                self._logger.error(
+                    f"Failed to publish event {routing_key}: {e}", exc_info=True
+                )
+                raise MessageBusError(
+                    f"Failed to publish event {routing_key}: {e}"
+                ) from e
+
+    def _cache_publish_meta(
+        self, event_type: type[DomainEvent]
+    ) -> tuple[str, pika.BasicProperties]:
+        """Compute and remember the routing key and properties for an event class."""
+        properties = (
+            _PERSISTENT_PROPERTIES if event_type.reliable else _TRANSIENT_PROPERTIES
+        )
+        meta = (event_type.__name__, properties)
+        self._publish_meta[event_type] = meta
+        return meta
 
     async def publish_batch(self, events: list[DomainEvent]) -> None:
-        # Run each publish in a thread to avoid blocking the event loop
-        for event in events:
-            await self.publish(event)
+        # Publish the whole batch in one worker thread, back-to-back on one channel
+        await asyncio.to_thread(self._publish_many_sync, list(events))
 
     def _setup_channel_for_event_handler(
         self,
@@ -97,7 +170,7 @@ class RabbitMQMessageBus(AbstractMessageBus):
         """Helper method to declare queue and set up consumer for an event type."""
         try:
             channel.queue_declare(queue=event_type_name, durable=True)
-            channel.basic_consume(
+            self._consumer_tags[event_type_name] = channel.basic_consume(
                 queue=event_type_name,
                 on_message_callback=on_message_callback_func,
                 auto_ack=False,  # Manual acknowledgment
@@ -123,56 +196,105 @@ class RabbitMQMessageBus(AbstractMessageBus):
     def register_handler(
         self, event_type: type[DomainEvent], handler: Callable[[DomainEvent], None]
     ) -> None:
+        self.register_handlers({event_type: handler})
+
+    def register_handlers(
+        self, handlers: Mapping[type[DomainEvent], Callable[[DomainEvent], None]]
+    ) -> None:
+        """
+        Register several event handlers on one consumer channel.
+
+        Declaring every queue and attaching every consumer on a single channel
+        avoids opening a channel (an extra broker round-trip) per event type.
+        """
+        callbacks = {}
+        for event_type, handler in handlers.items():
+            event_type_name = event_type.__name__
+            self._handlers[event_type_name] = handler
+            self._event_types[event_type_name] = (
+                event_type  # Store event class for deserialization
+            )
+            callbacks[event_type_name] = self._make_message_callback(
+                event_type, handler
+            )
+        if not callbacks:
+            return
+
+        event_type_name = next(iter(callbacks))
+        try:
+            channel = self._get_consumer_channel()
+            for event_type_name, callback in callbacks.items():
+                self._setup_channel_for_event_handler(
+                    channel, event_type_name, callback
+                )
+        except MessageBusError:  # Propagate error if setup fails
+            self._consumer_channel = None
+            # The _setup_channel_for_event_handler already logs the specific pika error
+            self._logger.error(
+                f"Failed to register handler for {event_type_name} due to channel setup issues."
+            )
+            raise  # Re-raise the MessageBusError
+        except (
+            Exception
+        ) as e:  # Catch any other unexpected errors during channel acquisition
+            # A failed declare closes the channel; open a new one next time
+            self._consumer_channel = None
+            self._logger.error(
+                f"An unexpected error occurred while acquiring channel for {event_type_name}: {e}",
+                exc_info=True,
+            )
+            raise MessageBusError(
+                f"Unexpected error acquiring channel for {event_type_name}: {e}"
+            ) from e
+
+    def _get_consumer_channel(self) -> pika.channel.Channel:
+        """Return the shared consumer channel, opening it on first use."""
+        channel = self._consumer_channel
+        if channel is None or not channel.is_open:
+            channel = self._connection.channel()
+            channel.basic_qos(prefetch_count=self._prefetch_count, global_qos=False)
+            self._consumer_channel = channel
+            self._consumer_tags.clear()
+        return channel
+
+    def _make_message_callback(
+        self, event_type: type[DomainEvent], handler: Callable[[DomainEvent], None]
+    ) -> Callable[
+        [
+            pika.channel.Channel,
+            pika.spec.Basic.Deliver,
+            pika.spec.BasicProperties,
+            bytes,
+        ],
+        None,
+    ]:
+        """Build the pika consumer callback for one event type."""
         event_type_name = event_type.__name__
-        self._handlers[event_type_name] = handler
-        self._event_types[event_type_name] = (
-            event_type  # Store event class for deserialization
-        )
+        # Bind the validator and handler once so the per-message callback does
+        # no lookups; the queue is named after event_type_name.
+        validate = event_type.model_validate_json
 
-        # The on_message_callback needs access to self, event_type_name, etc.
-        # Defining it as a nested function captures these from the surrounding scope.
         def on_message_callback_internal(
             ch: pika.channel.Channel,  # Renamed to avoid conflict with outer scope 'channel' if any
             method: pika.spec.Basic.Deliver,
             properties: pika.spec.BasicProperties,
             body: bytes,
         ) -> None:
-            # The routing_key or queue name should tell us the event type name
-            # Assuming queue name is the event_type_name as per current setup
-            # If method.routing_key is more reliable, use that.
-            # For basic_consume on a specific queue, that queue's name is the key.
-
-            # This callback is registered per queue, and we named the queue after event_type_name.
-            # The 'event_type_name' string is captured from the outer scope of register_handler.
-
-            # Retrieve the actual DomainEvent subclass for deserialization
-            specific_event_type_class = self._event_types.get(event_type_name)
-
-            if not specific_event_type_class:
-                self._logger.error(
-                    f"No event type class found for event_type_name '{event_type_name}'. Message body: {body[:200]}. NACKing."
-                )
-                ch.basic_nack(delivery_tag=method.delivery_tag, requeue=False)
-                return
-
             try:
                 self._logger.debug(
                     f"Received message for event '{event_type_name}', delivery_tag {method.delivery_tag}"
                 )
-                event_obj = specific_event_type_class.model_validate_json(
-                    body.decode("utf-8")
-                )
+                # pydantic-core parses the raw bytes; no separate UTF-8 decode
+                event_obj = validate(body)
 
-                # Retrieve the actual handler function
-                actual_handler = self._handlers[event_type_name]
-                actual_handler(event_obj)  # Execute the domain handler
+                handler(event_obj)  # Execute the domain handler
 
                 self._logger.info(
                     f"Successfully processed event '{event_type_name}', delivery_tag {method.delivery_tag}. ACK."
                 )
-                ch.basic_ack(delivery_tag=method.delivery_tag)
+                self._ack(ch, method.delivery_tag)
 
-            except (json.JSONDecodeError, ValidationError) as e:
+            except ValidationError as e:
                 decoded_body = body.decode("utf-8", errors="replace")
                 max_log_length = 200
                 sanitized_body = (
@@ -187,56 +309,66 @@ class RabbitMQMessageBus(AbstractMessageBus):
                 ch.basic_nack(delivery_tag=method.delivery_tag, requeue=False)
             except Exception as e:
                 self._logger.error(
-                    f"Error processing message for event '{event_type_name}', delivery_tag {method.delivery_tag}: {e}. Body: {body[:200]}. NACKing.",
+                    f"Error processing message for event '{event_type_name}', delivery_tag {method.delivery_tag}: {e}. Body: {body[:200]!r}. NACKing.",
                     exc_info=True,
                 )
                 ch.basic_nack(delivery_tag=method.delivery_tag, requeue=False)
 
-        # Obtain a channel for this registration
-        # The lifecycle of this channel needs consideration. If it's one channel per registration,
-        # it should be managed (e.g., stored if it needs to be accessed later for cancellation).
-        # For BlockingConnection, channel operations are synchronous.
-        try:
-            channel = self._connection.channel()
-            self._setup_channel_for_event_handler(
-                channel, event_type_name, on_message_callback_internal
-            )
-        except MessageBusError:  # Propagate error if setup fails
-            # The _setup_channel_for_event_handler already logs the specific pika error
-            self._logger.error(
-                f"Failed to register handler for {event_type_name} due to channel setup issues."
-            )
-            raise  # Re-raise the MessageBusError
-        except (
-            Exception
-        ) as e:  # Catch any other unexpected errors during channel acquisition
-            self._logger.error(
-                f"An unexpected error occurred while acquiring channel for {event_type_name}: {e}",
-                exc_info=True,
-            )
-            raise MessageBusError(
-                f"Unexpected error acquiring channel for {event_type_name}: {e}"
-            ) from e
+        return on_message_callback_internal
 
     def start_consuming(self) -> None:
-        # This method might be needed if the connection is run in a separate thread
-        # and start_consuming needs to be called on channels.
-        # For BlockingConnection, often channel.start_consuming() is called,
-        # which blocks. If handlers are on multiple queues/channels, this needs careful management.
-        # For now, tests pass by directly invoking the callback, so a full consuming loop
-        # isn't strictly necessary for this step.
-        # If we have multiple consumers (channels consuming), each would need its start_consuming call,
-        # typically each in its own thread.
-
-        # A simple way if only one channel is used for all consumption, or if called per channel:
-        # try:
-        #     print("Starting to consume messages...")
-        #     # Assuming a single channel for now, or that this is called on the relevant channel.
-        #     # This is a blocking call.
-        #     # self._connection.channel().start_consuming() # This would need channel to be stored if used like this.
-        # except KeyboardInterrupt:
-        #     print("Consumption stopped.")
-        # finally:
-        #     if self._connection.is_open:
-        #         self._connection.close()
-        pass  # Placeholder, as tests trigger callbacks directly.
+        """
+        Dispatch messages for every registered handler on the calling thread.
+
+        All consumers live on ``self._connection``, so a single thread driving
+        its I/O loop serves every queue; no thread per queue is needed.
+        Pending acknowledgements are flushed after every I/O iteration (at
+        most a second apart). Blocks until ``stop_consuming`` is called.
+        """
+        self._consuming = True
+        while self._consuming:
+            self._connection.process_data_events(time_limit=1)
+            # Don't leave a partial ack batch waiting when traffic is quiet
+            self.flush_acks()
+
+    def stop_consuming(self) -> None:
+        """Make ``start_consuming`` return after the current I/O iteration."""
+        self._consuming = False
+
+    def flush_acks(self) -> None:
+        """Acknowledge every successfully handled delivery not yet acked."""
+        tag = self._unacked_tag
+        if tag is None:
+            return
+        self._unacked_tag = None
+        self._unacked_count = 0
+        channel = self._consumer_channel
+        if channel is not None and channel.is_open:
+            channel.basic_ack(delivery_tag=tag, multiple=True)
+
+    def _ack(self, channel: pika.channel.Channel, delivery_tag: int) -> None:
+        """
+        Acknowledge a delivery as part of a batch.
+
+        One ``multiple=True`` ack per ``ACK_BATCH_SIZE`` deliveries covers all
+        earlier ones on the channel. NACKs stay per-message, so a rejected
+        delivery is never swept into a batch ack.
+        """
+        self._unacked_tag = delivery_tag
+        self._unacked_count += 1
+        # A small prefetch window must not fill up before the batch is acked
+        if self._unacked_count >= min(
+            self.ACK_BATCH_SIZE, max(1, self._prefetch_count // 2)
+        ):
+            self._unacked_tag = None
+            self._unacked_count = 0
+            channel.basic_ack(delivery_tag=delivery_tag, multiple=True)
+
+    def cancel_consumers(self) -> None:
+        """Cancel every registered consumer on the shared consumer channel."""
+        self.flush_acks()
+        channel = self._consumer_channel
+        if channel is not None and channel.is_open:
+            for consumer_tag in self._consumer_tags.values():
+                channel.basic_cancel(consumer_tag)
+        self._consumer_tags.clear()
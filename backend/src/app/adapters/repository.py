@@ -1,8 +1,11 @@
+import builtins
 from abc import ABC, abstractmethod
+from collections.abc import Sequence
 from typing import Generic, TypeVar
 from uuid import UUID
 
-from sqlmodel import Session, SQLModel
+from sqlalchemy.orm import class_mapper
+from sqlmodel import Session, SQLModel, select
 
 # Generic TypeVariables for Repository
 T = TypeVar("T", bound=SQLModel)  # Type of the entity
@@ -43,18 +46,51 @@ class SQLAlchemyRepository(AbstractRepository[T, U, V]):
     def __init__(self, session: Session, model: type[T]):
         super().__init__(session)
         self.model = model
+        # Reloading a row after writing it is only needed when the database
+        # fills in values itself; client-side defaults are already populated.
+        self._needs_refresh = any(
+            column.server_default is not None or column.server_onupdate is not None
+            for column in class_mapper(model).columns
+        )
 
     def get(self, id: UUID) -> T | None:
         return self.session.get(self.model, id)
 
     def list(self, skip: int = 0, limit: int = 100) -> list[T]:
-        return list(self.session.query(self.model).offset(skip).limit(limit).all())
+        statement = select(self.model).offset(skip).limit(limit)
+        return list(self.session.exec(statement))
 
     def create(self, obj_in: U) -> T:
         db_obj = self.model.model_validate(obj_in)  # SQLModel v0.0.12+
         self.session.add(db_obj)
         self.session.commit()
-        self.session.refresh(db_obj)
+        if self._needs_refresh:
+            self.session.refresh(db_obj)
+        return db_obj
+
+    # builtins.list: ``list`` is shadowed by the method above in this class body
+    def create_many(self, objs_in: Sequence[U]) -> builtins.list[T]:
+        """
+        Create several objects in a single transaction.
+
+        Unlike ``create``, objects are not refreshed one by one after the
+        commit; expired attributes are reloaded lazily on first access.
+        """
+        db_objs = [self.model.model_validate(obj_in) for obj_in in objs_in]
+        self.session.add_all(db_objs)
+        self.session.commit()
+        return db_objs
+
+    def create_no_commit(self, obj_in: U) -> T:
+        """
+        Add an object and flush it without committing.
+
+        For callers inside a unit of work, which commits once for the whole
+        transaction.
+        """
+        db_obj = self.model.model_validate(obj_in)
+        self.session.add(db_obj)
+        self.session.flush()
         return db_obj
 
     def update(self, db_obj: T, obj_in: V) -> T:
@@ -63,7 +99,8 @@ class SQLAlchemyRepository(AbstractRepository[T, U, V]):
             setattr(db_obj, field, value)
         self.session.add(db_obj)
         self.session.commit()
-        self.session.refresh(db_obj)
+        if self._needs_refresh:
+            self.session.refresh(db_obj)
         return db_obj
 
     def remove(self, id: UUID) -> T | None:
@@ -84,4 +121,6 @@ class SQLAlchemyRepository(AbstractRepository[T, U, V]):
 
 #     # Add user-specific methods here if any, e.g.:
 #     def get_by_email(self, email: str) -> User | None:
-#         return self.session.query(self.model).filter(self.model.email == email).first()
+#         return self.session.exec(
+#             select(self.model).where(self.model.email == email)
+#         ).first()
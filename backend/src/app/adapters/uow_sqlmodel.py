@@ -41,6 +41,7 @@ class SqlModelUnitOfWork(AbstractUnitOfWork):
     def __enter__(self) -> "SqlModelUnitOfWork":
         """Starts a new transaction and session."""
         self.session = self.session_factory()
+        self.committed = False
         # self.products = ProductRepository(self.session) # Re-init with new session
         return super().__enter__()
 
@@ -54,6 +55,7 @@ class SqlModelUnitOfWork(AbstractUnitOfWork):
         """Commits the current session's transaction."""
         if self.session:  # Ensure session was created
             self.session.commit()
+            self.committed = True
 
     def rollback(self) -> None:
         """Rolls back the current session's transaction."""
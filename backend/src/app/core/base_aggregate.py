@@ -1,9 +1,8 @@
 import uuid
-from typing import Generic, NewType, TypeVar
+from typing import ClassVar, NewType
 
 from pydantic import BaseModel, ConfigDict, Field, PrivateAttr
 
-EventT = TypeVar("EventT", bound="DomainEvent")  # Generic type for events
 AggregateId = NewType("AggregateId", uuid.UUID)
 
 
@@ -17,15 +16,20 @@ class DomainEvent(BaseModel):
 
     Attributes:
         event_id: The unique identifier for the event.
+        reliable: Class-level flag. Events that can be lost without harm
+            (e.g. high-volume bookkeeping events) set it to False so
+            message buses may deliver them without durability guarantees.
     """
 
     model_config = ConfigDict(frozen=True)
 
+    reliable: ClassVar[bool] = True
+
     event_id: uuid.UUID = Field(default_factory=uuid.uuid4)
     # timestamp: datetime = Field(default_factory=datetime.utcnow) # Consider adding later
 
 
-class AggregateRoot(BaseModel, Generic[EventT]):
+class AggregateRoot(BaseModel):
     """
     Base class for aggregate roots in the domain model.
 
@@ -43,9 +47,9 @@ class AggregateRoot(BaseModel, Generic[EventT]):
     model_config = ConfigDict(arbitrary_types_allowed=True)
 
     id: uuid.UUID = Field(default_factory=uuid.uuid4)
-    _events: list[EventT] = PrivateAttr(default_factory=list[EventT])
+    _events: list[DomainEvent] = PrivateAttr(default_factory=list)
 
-    def add_event(self, event: EventT) -> None:
+    def add_event(self, event: DomainEvent) -> None:
         """
         Add a domain event to the aggregate's event list.
 
@@ -57,7 +61,7 @@ class AggregateRoot(BaseModel, Generic[EventT]):
         """
         self._events.append(event)
 
-    def pull_events(self) -> list[EventT]:
+    def pull_events(self) -> list[DomainEvent]:
         """
         Return all stored events and clear the internal list.
 
@@ -68,6 +72,6 @@ class AggregateRoot(BaseModel, Generic[EventT]):
             List of domain events that were stored. The internal list
             is cleared after this call.
         """
-        events = self._events.copy()
-        self._events.clear()
+        # Hand over the current list and start a fresh one instead of copying
+        events, self._events = self._events, []
         return events
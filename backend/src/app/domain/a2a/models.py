@@ -1,6 +1,16 @@
+import msgspec
 from pydantic import BaseModel
 
 
+class A2AStruct(msgspec.Struct):
+    """
+    Base for A2A request/response payloads handled by msgspec instead of Pydantic.
+
+    The A2A client adapter encodes and decodes these structs directly, skipping the
+    Pydantic dump/validate steps for high-volume internal calls.
+    """
+
+
 class SummarizeTextA2ARequest(BaseModel):
     """Request model for text summarization A2A capability."""
 
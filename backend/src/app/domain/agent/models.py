@@ -1,29 +1,128 @@
+import sys
+from collections.abc import Iterable, Iterator, Sequence
+from dataclasses import dataclass
 from datetime import datetime, timezone
-from uuid import UUID
+from typing import Any, overload
 
-from pydantic import BaseModel, Field
+from pydantic import Field, PrivateAttr, model_validator
 
 from app.core.base_aggregate import AggregateRoot
 from app.domain.agent.events import ConversationMessageAddedEvent
 
 
-class ChatMessage(BaseModel):
+@dataclass(frozen=True, slots=True)
+class ChatMessage:
+    # Internal value object: a plain dataclass, so construction skips validation
     role: str  # "user", "assistant", "system"
     content: str
 
 
-class Conversation(AggregateRoot[UUID]):
+class ChatMessageView(Sequence[ChatMessage]):
+    """
+    Read-only sequence of ChatMessage over a conversation's message columns.
+
+    Messages are stored as parallel ``roles``/``contents`` lists; a
+    ChatMessage is only built when an item is accessed.
+    """
+
+    __slots__ = ("roles", "contents")
+
+    def __init__(self, roles: list[str], contents: list[str]) -> None:
+        self.roles = roles
+        self.contents = contents
+
+    def __len__(self) -> int:
+        return len(self.roles)
+
+    @overload
+    def __getitem__(self, index: int) -> ChatMessage: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[ChatMessage]: ...
+
+    def __getitem__(self, index: int | slice) -> ChatMessage | list[ChatMessage]:
+        if isinstance(index, slice):
+            return [
+                ChatMessage(role=role, content=content)
+                for role, content in zip(
+                    self.roles[index], self.contents[index], strict=True
+                )
+            ]
+        return ChatMessage(role=self.roles[index], content=self.contents[index])
+
+    def __iter__(self) -> Iterator[ChatMessage]:
+        for role, content in zip(self.roles, self.contents, strict=True):
+            yield ChatMessage(role=role, content=content)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, ChatMessageView):
+            return self.roles == other.roles and self.contents == other.contents
+        if isinstance(other, Sequence) and not isinstance(other, str):
+            return len(other) == len(self) and all(
+                isinstance(msg, ChatMessage)
+                and msg.role == role
+                and msg.content == content
+                for msg, role, content in zip(
+                    other, self.roles, self.contents, strict=False
+                )
+            )
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"ChatMessageView({list(self)!r})"
+
+
+class Conversation(AggregateRoot):
     # id is inherited from AggregateRoot
     user_id: str | None = None
-    messages: list[ChatMessage] = Field(default_factory=list)
+    # Messages are stored column-wise; use ``messages`` for ChatMessage access
+    roles: list[str] = Field(default_factory=list)
+    contents: list[str] = Field(default_factory=list)
     created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
     last_updated_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
 
+    _messages_view: ChatMessageView | None = PrivateAttr(default=None)
+
+    @model_validator(mode="before")
+    @classmethod
+    def _split_messages(cls, data: Any) -> Any:
+        """Accept ``messages=[ChatMessage | dict, ...]`` and store it as columns."""
+        if isinstance(data, dict) and "messages" in data:
+            data = dict(data)
+            messages = [
+                msg if isinstance(msg, ChatMessage) else ChatMessage(**msg)
+                for msg in data.pop("messages") or ()
+            ]
+            data["roles"] = [sys.intern(msg.role) for msg in messages]
+            data["contents"] = [msg.content for msg in messages]
+        return data
+
+    @property
+    def messages(self) -> ChatMessageView:
+        view = self._messages_view
+        if view is None or view.roles is not self.roles or view.contents is not self.contents:
+            # (Re)bind after construction or a copy replaced the column lists
+            view = ChatMessageView(self.roles, self.contents)
+            self._messages_view = view
+        return view
+
     def add_message(self, role: str, content: str) -> None:
-        msg = ChatMessage(role=role, content=content)
-        self.messages.append(msg)
+        # Roles come from a tiny set; interning shares one str per role
+        self.roles.append(sys.intern(role))
+        self.contents.append(content)
         self.last_updated_at = datetime.now(timezone.utc)
         self.add_event(ConversationMessageAddedEvent(conversation_id=self.id, role=role, content_preview=content[:50]))
 
-    def get_messages(self) -> list[ChatMessage]:
+    def add_messages(self, pairs: Iterable[tuple[str, str]]) -> None:
+        """Append several ``(role, content)`` messages with one timestamp update."""
+        pairs = list(pairs)
+        if not pairs:
+            return
+        self.roles.extend(sys.intern(role) for role, _ in pairs)
+        self.contents.extend(content for _, content in pairs)
+        self.last_updated_at = datetime.now(timezone.utc)
+        for role, content in pairs:
+            self.add_event(ConversationMessageAddedEvent(conversation_id=self.id, role=role, content_preview=content[:50]))
+
+    def get_messages(self) -> ChatMessageView:
         return self.messages
@@ -1,10 +1,8 @@
-from dataclasses import dataclass
 from datetime import datetime
 
 from app.core.base_aggregate import DomainEvent
 
 
-@dataclass(frozen=True)
 class MemoryStoredEvent(DomainEvent):
     """Event raised when a memory is successfully stored."""
 
@@ -13,3 +11,12 @@ class MemoryStoredEvent(DomainEvent):
     content: str
     metadata: dict | None = None
     timestamp: datetime | None = None
+
+
+class MemoryRetrievalFailedEvent(DomainEvent):
+    """Event raised when searching a user's memories fails."""
+
+    user_id: str
+    query: str
+    error_message: str
+    timestamp: datetime | None = None
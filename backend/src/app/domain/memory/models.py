@@ -1,19 +1,44 @@
+import os
+import sys
 import uuid
+from collections import deque
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Any, NewType
+from typing import Any, Final, NewType
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
 
-from app.core.base_aggregate import AggregateId, AggregateRoot, DomainEvent
+from app.core.base_aggregate import AggregateId, AggregateRoot
 
 MemoryId = NewType("MemoryId", AggregateId)
 
+# Number of ids drawn from one os.urandom call when the pool runs dry
+_UUID_BATCH_SIZE = 1024
+_uuid_pool: deque[uuid.UUID] = deque()
+# A forked child inherits the parent's pool and would hand out the same ids
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_uuid_pool.clear)
+
+
+def _pooled_uuid4() -> uuid.UUID:
+    """Return a random (version 4) UUID, amortizing urandom reads over a batch."""
+    try:
+        return _uuid_pool.popleft()
+    except IndexError:
+        raw = os.urandom(16 * _UUID_BATCH_SIZE)
+        _uuid_pool.extend(
+            uuid.UUID(bytes=raw[offset : offset + 16], version=4)
+            for offset in range(16, len(raw), 16)
+        )
+        return uuid.UUID(bytes=raw[:16], version=4)
+
 
-class MemoryMetadata(BaseModel):
+@dataclass(frozen=True, slots=True)
+class MemoryMetadata:
     """Represents metadata associated with a memory item."""
 
-    pass
+
+_EMPTY_METADATA: Final = MemoryMetadata()
 
 
 class MemoryWriteRequest(BaseModel):
@@ -26,7 +51,7 @@ class MemoryWriteRequest(BaseModel):
     )  # Corrected default
 
 
-class MemoryItem(AggregateRoot[DomainEvent]):
+class MemoryItem(AggregateRoot):
     """
     Represents a memory item in the domain.
     This is an aggregate root.
@@ -34,24 +59,9 @@ class MemoryItem(AggregateRoot[DomainEvent]):
 
     user_id: str
     text_content: str
-    metadata: MemoryMetadata
-    _mem0_id: str | None = Field(default=None, alias="mem0_id")
-
-    def __init__(
-        self,
-        id: MemoryId,
-        user_id: str,
-        text_content: str,
-        metadata: dict[str, Any] | None = None,
-        mem0_id: str | None = None,
-        **data: Any,
-    ) -> None:
-        """Initializes MemoryItem."""
-        super().__init__(id)
-        self.user_id = user_id
-        self.text_content = text_content
-        self.metadata = MemoryMetadata(**(metadata or {}))
-        self._mem0_id = mem0_id
+    metadata: MemoryMetadata = _EMPTY_METADATA
+    version: int = 0
+    _mem0_id: str | None = PrivateAttr(default=None)
 
     @classmethod
     def create(
@@ -63,15 +73,12 @@ class MemoryItem(AggregateRoot[DomainEvent]):
         external_mem_id: str | None = None,
     ) -> "MemoryItem":
         """Factory method to create a new MemoryItem."""
-        # Corrected MemoryId creation and removed type: ignore
-        agg_id = memory_id if memory_id else MemoryId(AggregateId(uuid.uuid4()))
-        item = cls(
-            id=agg_id,
-            user_id=user_id,
-            text_content=text_content,
-            metadata=metadata,
-            mem0_id=external_mem_id,
-        )
+        # MemoryId/AggregateId are NewTypes and erase to plain UUIDs at runtime
+        agg_id = memory_id if memory_id else _pooled_uuid4()
+        # MemoryMetadata declares no fields, so every item shares the default
+        # A user's items all share one interned user_id string
+        item = cls(id=agg_id, user_id=sys.intern(user_id), text_content=text_content)
+        item._mem0_id = external_mem_id
         return item
 
     def update_content(
@@ -80,7 +87,7 @@ class MemoryItem(AggregateRoot[DomainEvent]):
         """Updates content and optionally metadata."""
         self.text_content = text_content
         if new_metadata is not None:
-            self.metadata = MemoryMetadata(**new_metadata)
+            self.metadata = _EMPTY_METADATA
         self.version += 1
 
     @property
@@ -89,7 +96,12 @@ class MemoryItem(AggregateRoot[DomainEvent]):
         return self._mem0_id
 
 
-class MemorySearchResultItem(BaseModel):
+# Resolve the core schema once at import rather than on first construction
+MemoryItem.model_rebuild()
+
+
+@dataclass(frozen=True, slots=True)
+class MemorySearchResultItem:
     """Represents a single search result item."""
 
     id: str
@@ -108,7 +120,7 @@ class MemoryQuery(BaseModel):
     )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MemoryQueryResult:
     """DTO for memory query results following read model patterns."""
 
@@ -5,6 +5,8 @@ from pydantic import BaseModel, ConfigDict, EmailStr, Field
 
 # Shared properties
 class UserBase(BaseModel):
+    # Needed: UserCreate.model_validate() is fed request schema objects, and
+    # User is read from ORM rows
     model_config = ConfigDict(from_attributes=True)
 
     email: EmailStr = Field(max_length=255)
@@ -23,8 +25,6 @@ class UserRegister(BaseModel):
     password: str = Field(min_length=8, max_length=40)
     full_name: str | None = Field(default=None, max_length=255)
 
-    model_config = ConfigDict(from_attributes=True)
-
 
 # Properties to receive via API on update, all are optional - Considered domain
 class UserUpdate(UserBase):
@@ -36,21 +36,14 @@ class UserUpdateMe(BaseModel):
     full_name: str | None = Field(default=None, max_length=255)
     email: EmailStr | None = Field(default=None, max_length=255)
 
-    model_config = ConfigDict(from_attributes=True)
-
 
 class UpdatePassword(BaseModel):
     current_password: str = Field(min_length=8, max_length=40)
     new_password: str = Field(min_length=8, max_length=40)
 
-    model_config = ConfigDict(from_attributes=True)
-
 
 # Domain model for User - distinct from DB model
 class User(UserBase):
     id: uuid.UUID
     # Hashed password is not part of the domain model for direct manipulation
     # items list would be handled by service layer, not directly part of this core domain model object
-    model_config = ConfigDict(from_attributes=True)
-
-    model_config = ConfigDict(from_attributes=True)
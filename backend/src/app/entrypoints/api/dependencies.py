@@ -1,15 +1,23 @@
+import functools
 from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import ContextVar, Token
+from pathlib import Path
 from typing import Annotated, Any
 
 import httpx
 from fastapi import Depends
 
-from app.adapters.a2a_client_adapter import A2AClientAdapter
+from app.adapters.a2a_client_adapter import A2AClientAdapter, build_a2a_http_client
+from app.adapters.completion_cache import CompletionCache
 from app.adapters.message_bus_inmemory import InMemoryMessageBus
 from app.adapters.uow_sqlmodel import SqlModelUnitOfWork
 from app.service_layer.a2a_service import A2ACapabilityService, A2AHandlerService
 from app.service_layer.ai_pattern_execution_service import AIPatternExecutionService
-from app.service_layer.ai_provider_service import AIProviderService
+from app.service_layer.ai_provider_service import (
+    AIProviderService,
+    BatchingAIProviderService,
+)
 from app.service_layer.context_service import ContextService
 from app.service_layer.memory_service import AbstractMemoryService
 from app.service_layer.message_bus import AbstractMessageBus
@@ -19,116 +27,165 @@ from app.service_layer.template_service import TemplateService
 from app.service_layer.unit_of_work import AbstractUnitOfWork
 
 
-def get_db_session_factory() -> Callable[[], Any]:
-    """
-    Provides a factory for database sessions.
-    """
+# Resolved once at import so pattern lookups never re-resolve the path
+PATTERNS_DIRECTORY = (Path(__file__).parent.parent.parent / "patterns").resolve()
+
 
-    class DummySession:
-        """A dummy session class for DI testing without a real database."""
+class _DummySession:
+    """A dummy session class for DI testing without a real database."""
 
-        def commit(self) -> None:
-            """Simulates committing a transaction."""
-            pass
+    def commit(self) -> None:
+        """Simulates committing a transaction."""
+        pass
 
-        def rollback(self) -> None:
-            """Simulates rolling back a transaction."""
-            pass
+    def rollback(self) -> None:
+        """Simulates rolling back a transaction."""
+        pass
 
-        def close(self) -> None:
-            """Simulates closing a session."""
-            pass
+    def close(self) -> None:
+        """Simulates closing a session."""
+        pass
 
-        def __enter__(self) -> "DummySession":
-            """Allows use as a context manager."""
-            return self
+    def __enter__(self) -> "_DummySession":
+        """Allows use as a context manager."""
+        return self
 
-        def __exit__(self, *args: Any) -> None:
-            """Handles exiting the context."""
-            pass
+    def __exit__(self, *args: Any) -> None:
+        """Handles exiting the context."""
+        pass
 
-    def dummy_session_factory() -> DummySession:
-        """Creates and returns a new DummySession instance."""
-        return DummySession()
 
-    return dummy_session_factory
+def _dummy_session_factory() -> _DummySession:
+    """Creates and returns a new _DummySession instance."""
+    return _DummySession()
+
+
+# The UoW dependencies only construct objects (the session itself is opened
+# lazily in SqlModelUnitOfWork.__enter__), so they are declared `async def`:
+# FastAPI then calls them on the event loop instead of sending each one
+# through the threadpool.
+async def get_db_session_factory() -> Callable[[], Any]:
+    """
+    Provides a factory for database sessions.
+    """
+    return _dummy_session_factory
 
 
 # Global instance of message bus
-message_bus_instance: AbstractMessageBus = InMemoryMessageBus()
+# Sync handlers often do blocking I/O; bound the threads they can occupy.
+message_bus_instance: AbstractMessageBus = InMemoryMessageBus(
+    executor=ThreadPoolExecutor(max_workers=32, thread_name_prefix="message-bus")
+)
 
 
-def get_uow(
+async def get_uow(
     session_factory: Annotated[Callable[[], Any], Depends(get_db_session_factory)],
 ) -> AbstractUnitOfWork:
     """FastAPI dependency injector for Unit of Work."""
     return SqlModelUnitOfWork(session_factory=session_factory)
 
 
-def get_message_bus() -> AbstractMessageBus:
+# Current message bus; defaults to the global instance and can be swapped per
+# context (e.g. a test or a task) without monkeypatching this module.
+_message_bus_var: ContextVar[AbstractMessageBus] = ContextVar(
+    "message_bus", default=message_bus_instance
+)
+
+
+def set_message_bus(bus: AbstractMessageBus) -> Token[AbstractMessageBus]:
+    """Use ``bus`` in the current context; pass the token to ``reset_message_bus``."""
+    return _message_bus_var.set(bus)
+
+
+def reset_message_bus(token: Token[AbstractMessageBus]) -> None:
+    """Restore the message bus that was current before ``set_message_bus``."""
+    _message_bus_var.reset(token)
+
+
+async def get_message_bus() -> AbstractMessageBus:
     """FastAPI dependency injector for Message Bus."""
-    return message_bus_instance
+    return _message_bus_var.get()
 
 
-# Singleton HTTP client for A2A communications
-_http_client: httpx.AsyncClient | None = None
+# Singleton HTTP client for A2A communications, created once at import
+_http_client: httpx.AsyncClient = build_a2a_http_client()
 
 
 async def get_http_client() -> httpx.AsyncClient:
-    """Get or create the shared HTTP client for A2A communications."""
-    global _http_client
-    if _http_client is None:
-        _http_client = httpx.AsyncClient(timeout=30.0)
+    """Get the shared HTTP client for A2A communications."""
     return _http_client
 
 
-def get_a2a_client_adapter(
+async def get_a2a_client_adapter(
     http_client: httpx.AsyncClient = Depends(get_http_client),
 ) -> A2AClientAdapter:
     """Dependency for A2A client adapter."""
     return A2AClientAdapter(http_client=http_client)
 
 
-def get_template_service(
+async def get_template_service(
     a2a_client_adapter: A2AClientAdapter = Depends(get_a2a_client_adapter),
 ) -> TemplateService:
     """Dependency for template service with A2A client adapter."""
     return TemplateService(a2a_client_adapter=a2a_client_adapter)
 
 
-def get_pattern_service() -> PatternService:
-    """Dependency for pattern service."""
-    return PatternService()
+# Shared services are built once by the cached `_shared_*` builders; their
+# getters are `async def` so FastAPI returns them on the event loop rather
+# than dispatching each lookup to the threadpool.
+@functools.lru_cache(maxsize=1)
+def _shared_pattern_service() -> PatternService:
+    return PatternService(PATTERNS_DIRECTORY)
 
 
-def get_strategy_service() -> StrategyService:
-    """Dependency for strategy service."""
+async def get_pattern_service() -> PatternService:
+    """Dependency for pattern service, shared so its content cache persists."""
+    return _shared_pattern_service()
+
+
+@functools.lru_cache(maxsize=1)
+def _shared_strategy_service() -> StrategyService:
     return StrategyService()
 
 
-def get_context_service() -> ContextService:
-    """Dependency for context service."""
+async def get_strategy_service() -> StrategyService:
+    """Dependency for strategy service, built once and shared across requests."""
+    return _shared_strategy_service()
+
+
+@functools.lru_cache(maxsize=1)
+def _shared_context_service() -> ContextService:
     return ContextService()
 
 
-def get_ai_provider_service() -> AIProviderService:
-    """Dependency for AI provider service."""
-    return AIProviderService()
+async def get_context_service() -> ContextService:
+    """Dependency for context service, built once and shared across requests."""
+    return _shared_context_service()
+
+
+@functools.lru_cache(maxsize=1)
+def _shared_ai_provider_service() -> BatchingAIProviderService:
+    return BatchingAIProviderService()
+
+
+async def get_ai_provider_service() -> BatchingAIProviderService:
+    """Dependency for AI provider service, shared so concurrent requests can batch their completions."""
+    return _shared_ai_provider_service()
 
 
-def get_unit_of_work() -> AbstractUnitOfWork:
+async def get_unit_of_work() -> AbstractUnitOfWork:
     """Dependency for unit of work."""
     from app.adapters.fake_unit_of_work import FakeUnitOfWork
 
     return FakeUnitOfWork()
 
 
-def get_memory_service() -> AbstractMemoryService | None:
+async def get_memory_service() -> AbstractMemoryService | None:
     """Dependency for memory service."""
     return None
 
 
-def get_ai_pattern_execution_service(
+async def get_ai_pattern_execution_service(
     pattern_service: PatternService = Depends(get_pattern_service),
     template_service: TemplateService = Depends(get_template_service),
     strategy_service: StrategyService = Depends(get_strategy_service),
@@ -151,24 +208,54 @@ def get_ai_pattern_execution_service(
     )
 
 
-def get_a2a_capability_service() -> A2ACapabilityService:
-    """Dependency for A2A capability service."""
+@functools.lru_cache(maxsize=1)
+def _shared_a2a_capability_service() -> A2ACapabilityService:
     return A2ACapabilityService()
 
 
-def get_a2a_handler_service() -> A2AHandlerService:
-    """Dependency for A2A handler service."""
+async def get_a2a_capability_service() -> A2ACapabilityService:
+    """Dependency for A2A capability service, shared so registrations made at startup are visible to every request."""
+    return _shared_a2a_capability_service()
+
+
+@functools.lru_cache(maxsize=1)
+def _shared_a2a_handler_service() -> A2AHandlerService:
     return A2AHandlerService()
 
 
+async def get_a2a_handler_service() -> A2AHandlerService:
+    """Dependency for A2A handler service, built once and shared across requests."""
+    return _shared_a2a_handler_service()
+
+
+@functools.lru_cache(maxsize=1)
+def _shared_completion_cache() -> CompletionCache:
+    return CompletionCache()
+
+
+async def get_completion_cache() -> CompletionCache:
+    """Dependency for the reply cache shared by stateless pattern executions."""
+    return _shared_completion_cache()
+
+
 async def cleanup_dependencies():
     """Cleanup function to close HTTP client and other resources."""
     global _http_client
-    if _http_client:
-        await _http_client.aclose()
-        _http_client = None
+    await _http_client.aclose()
+    # A closed client cannot be reopened; keep a usable one for app restarts
+    _http_client = build_a2a_http_client()
+    # Stops the completion batching worker; it restarts on the next call
+    await _shared_ai_provider_service().aclose()
 
 
 # Type Aliases for FastAPI dependencies
 UoWDep = Annotated[AbstractUnitOfWork, Depends(get_uow)]
 MessageBusDep = Annotated[AbstractMessageBus, Depends(get_message_bus)]
+AIPatternExecutionServiceDep = Annotated[
+    AIPatternExecutionService, Depends(get_ai_pattern_execution_service)
+]
+A2ACapabilityDep = Annotated[
+    A2ACapabilityService, Depends(get_a2a_capability_service)
+]
+A2AHandlerDep = Annotated[A2AHandlerService, Depends(get_a2a_handler_service)]
+CompletionCacheDep = Annotated[CompletionCache, Depends(get_completion_cache)]
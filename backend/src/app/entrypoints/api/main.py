@@ -1,17 +1,15 @@
-from fastapi import Depends, FastAPI
+from functools import cache, lru_cache
+from typing import Any
+
+from fastapi import APIRouter, FastAPI
 
 from app.core.base_aggregate import DomainEvent  # For type hint
 from app.service_layer.message_bus import AbstractMessageBus  # Removed EventT
 from app.service_layer.unit_of_work import AbstractUnitOfWork
 
-# Import the new router
-from app.entrypoints.api.routes import copilot_api
-from .dependencies import MessageBusDep, UoWDep, get_uow
-
-app = FastAPI(title="Vibeconomics Agentic Framework")
+from .dependencies import MessageBusDep, UoWDep
 
-# Include the Copilot API router
-app.include_router(copilot_api.router, prefix="/copilot", tags=["copilot"])
+__all__ = ["create_api_router", "create_app"]
 
 
 # Example Event for testing
@@ -21,13 +19,22 @@ class TestDIEvent(DomainEvent):
     message: str
 
 
-@app.get("/")
+@cache
+def _is_message_bus_type(bus_type: type) -> bool:
+    """
+    Structural AbstractMessageBus check, resolved once per concrete type.
+
+    The protocol only has methods, so the answer depends on the class alone;
+    caching it avoids re-walking the protocol members on every request.
+    """
+    return issubclass(bus_type, AbstractMessageBus)
+
+
 async def read_root() -> dict[str, str]:
     """Root endpoint for the application."""
     return {"message": "Welcome to Vibeconomics Agentic Framework"}
 
 
-@app.post("/test-di-uow")
 async def test_di_uow(uow: UoWDep) -> dict[str, bool]:
     """
     Endpoint to test Unit of Work dependency injection.
@@ -39,41 +46,88 @@ async def test_di_uow(uow: UoWDep) -> dict[str, bool]:
     # with uow:
     #    uow.some_repository.add(...)
     #    uow.commit()
-    # The 'committed' attribute check is illustrative; SqlModelUnitOfWork
-    # sets 'committed' only if its context manager methods are fully used.
+    # The 'committed' attribute check is illustrative; it stays at the
+    # AbstractUnitOfWork default of False until commit() succeeds.
     # Here, we mainly test if the DI provided an object of the correct abstract type.
     return {
         "is_uow_instance": is_uow_instance,
-        "committed": getattr(uow, "committed", False),
+        "committed": uow.committed,
     }
 
 
-@app.post("/test-di-message-bus")
 async def test_di_message_bus(bus: MessageBusDep) -> dict[str, bool]:
     """
     Endpoint to test MessageBus dependency injection.
 
     Verifies that the injected 'bus' is an instance of AbstractMessageBus.
     """
-    is_bus_instance = isinstance(bus, AbstractMessageBus)
+    is_bus_instance = _is_message_bus_type(type(bus))
     # In a real scenario, you'd use the bus:
     # event = TestDIEvent(message="Hello from DI test")
     # bus.publish(event)
     return {"is_bus_instance": is_bus_instance}
 
 
-# Example of using the concrete dependency getters directly if needed
-@app.post("/test-di-concrete-uow")
-async def test_di_concrete_uow(
-    uow: AbstractUnitOfWork = Depends(get_uow),
-) -> dict[str, bool]:
+# Shares the UoWDep alias (and so the same Depends(get_uow)) with /test-di-uow
+async def test_di_concrete_uow(uow: UoWDep) -> dict[str, bool]:
     """
-    Endpoint to test direct injection of UoW using the getter.
+    Endpoint to test direct injection of UoW through the shared UoWDep alias.
 
     Verifies that the injected 'uow' is an instance of AbstractUnitOfWork.
     """
     return {"is_uow_instance": isinstance(uow, AbstractUnitOfWork)}
 
 
+@lru_cache(maxsize=1)
+def create_api_router() -> APIRouter:
+    """
+    Build the API router on first use.
+
+    Route registration makes FastAPI build the dependant graph and the
+    Pydantic schemas of every endpoint, so it is deferred until an app
+    actually needs the router rather than paid on every import.
+    """
+    # Imported here so that importing this module does not build the
+    # Copilot router (and its schemas) as a side effect.
+    from app.entrypoints.api.routes import copilot_api
+
+    router = APIRouter()
+    # Every route needs a tag: the tag prefixes the generated operation id
+    router.add_api_route("/", read_root, methods=["GET"], tags=["root"])
+    router.add_api_route(
+        "/test-di-uow", test_di_uow, methods=["POST"], tags=["di-test"]
+    )
+    router.add_api_route(
+        "/test-di-message-bus", test_di_message_bus, methods=["POST"], tags=["di-test"]
+    )
+    router.add_api_route(
+        "/test-di-concrete-uow",
+        test_di_concrete_uow,
+        methods=["POST"],
+        tags=["di-test"],
+    )
+    # Include the Copilot API router
+    router.include_router(copilot_api.router, prefix="/copilot", tags=["copilot"])
+    return router
+
+
+@lru_cache(maxsize=1)
+def create_app() -> FastAPI:
+    """Build the standalone application; repeated calls return the same app."""
+    app = FastAPI(title="Vibeconomics Agentic Framework")
+    app.include_router(create_api_router())
+    return app
+
+
+def __getattr__(name: str) -> Any:
+    # Keep `from app.entrypoints.api.main import app` / `api_router` working
+    # while only building them when they are first asked for.
+    if name == "app":
+        return create_app()
+    if name == "api_router":
+        return create_api_router()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 # If you need to override dependencies for testing, FastAPI supports this.
-# e.g., app.dependency_overrides[get_uow] = lambda: mock_uow
+# e.g., create_app().dependency_overrides[get_uow] = lambda: mock_uow
@@ -1,35 +1,29 @@
+import asyncio
 from typing import Any
 
-from fastapi import APIRouter, Body, Depends, HTTPException
-from pydantic import ValidationError
+import orjson
+from fastapi import APIRouter, Body, HTTPException, Request, Response
+from pydantic import BaseModel, ValidationError
 
-from app.entrypoints.api.dependencies import (
-    get_a2a_capability_service,
-    get_a2a_handler_service,
-)
+from app.entrypoints.api.dependencies import A2ACapabilityDep, A2AHandlerDep
 from app.service_layer.a2a_service import A2ACapabilityService, A2AHandlerService
 
 a2a_api_router = APIRouter()
 
 
-@a2a_api_router.post("/execute/{capability_name}")
-async def execute_capability(
-    capability_name: str,
-    request_data: dict[str, Any] = Body(...),
-    a2a_service: A2ACapabilityService = Depends(get_a2a_capability_service),
-    handler_service: A2AHandlerService = Depends(get_a2a_handler_service),
-) -> Any:
-    """
-    Executes a specified capability by validating input data, invoking the handler, and returning a validated response.
+def _error_details(error: ValidationError) -> list[Any]:
+    """Returns the validation errors without the per-error URL, input and context."""
+    return error.errors(include_url=False, include_context=False, include_input=False)
 
-    Validates the incoming request against the capability's input schema, dispatches the request to the handler service, and ensures the handler's response conforms to the capability's output schema. Returns the validated response or raises appropriate HTTP errors for missing schemas, validation failures, or unexpected handler results.
 
-    Args:
-        capability_name: The name of the capability to execute.
-        request_data: The JSON payload to be validated against the capability's input schema.
-
-    Returns:
-        The validated response matching the capability's output schema.
+async def _run_capability(
+    capability_name: str,
+    request_data: dict[str, Any],
+    a2a_service: A2ACapabilityService,
+    handler_service: A2AHandlerService,
+) -> BaseModel:
+    """
+    Validates input data, invokes the handler, and returns a response validated against the output schema.
 
     Raises:
         HTTPException: If the capability is not found, schemas are missing, input or output validation fails, or the handler returns an unexpected result.
@@ -53,10 +47,11 @@ async def execute_capability(
         )
 
     try:
-        parsed_request = capability.input_schema(**request_data)
+        parsed_request = capability.input_schema.model_validate(request_data)
     except ValidationError as e:
-        # Pydantic's ValidationError provides detailed error messages
-        raise HTTPException(status_code=422, detail=e.errors())
+        # Pydantic's ValidationError provides detailed error messages; the doc
+        # URL, echoed input and context are left out of the HTTP response
+        raise HTTPException(status_code=422, detail=_error_details(e))
     except Exception as e:  # Catch any other parsing errors
         raise HTTPException(
             status_code=422,
@@ -69,29 +64,18 @@ async def execute_capability(
         capability_name=capability_name, data=parsed_request
     )
 
-    # Ensure response_data conforms to output_schema
-    # If response_data is a dict, try to parse it with the output_schema
-    # If it's already a BaseModel, Pydantic will validate it on assignment (if types are compatible)
-    # or when model_validate is called.
+    # Accepts the output model as-is and parses a dict into it
     try:
-        if isinstance(response_data, dict):
-            # The tests expect the handler_service mock to return a dict like {'summary': 'Mocked summary'}
-            # This will be parsed into the capability's output_schema.
-            final_response = capability.output_schema(**response_data)
-        elif isinstance(response_data, capability.output_schema):
-            final_response = response_data  # Already correct type
-        else:
-            # If the response_data is neither a dict nor an instance of the expected output_schema,
-            # it's an unexpected type from the handler.
-            raise HTTPException(
-                status_code=500,
-                detail=f"Handler for '{capability_name}' returned an unexpected data type.",
-            )
-
+        final_response = capability.validate_output(response_data)
     except ValidationError as e:
         raise HTTPException(
             status_code=500,
-            detail=f"Handler for '{capability_name}' returned data that does not match the output schema: {e.errors()}",
+            detail=f"Handler for '{capability_name}' returned data that does not match the output schema: {_error_details(e)}",
+        )
+    except TypeError:
+        raise HTTPException(
+            status_code=500,
+            detail=f"Handler for '{capability_name}' returned an unexpected data type.",
         )
     except Exception as e:
         raise HTTPException(
@@ -100,3 +84,112 @@ async def execute_capability(
         )
 
     return final_response
+
+
+@a2a_api_router.post(
+    "/execute/{capability_name}",
+    # The body is parsed by hand, so describe it for the OpenAPI schema
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {"application/json": {"schema": {"type": "object"}}},
+        }
+    },
+)
+async def execute_capability(
+    capability_name: str,
+    request: Request,
+    a2a_service: A2ACapabilityDep,
+    handler_service: A2AHandlerDep,
+) -> Response:
+    """
+    Executes a specified capability by validating input data, invoking the handler, and returning a validated response.
+
+    Validates the incoming request against the capability's input schema, dispatches the request to the handler service, and ensures the handler's response conforms to the capability's output schema. Returns the validated response or raises appropriate HTTP errors for missing schemas, validation failures, or unexpected handler results.
+
+    The JSON body is decoded with orjson and the response is serialized
+    straight from the output model by pydantic-core, bypassing FastAPI's
+    body parsing and ``jsonable_encoder``.
+
+    Args:
+        capability_name: The name of the capability to execute.
+        request: The incoming request; its JSON object body is validated against the capability's input schema.
+
+    Returns:
+        The validated response matching the capability's output schema, as JSON.
+
+    Raises:
+        HTTPException: If the body is not a JSON object, the capability is not found, schemas are missing, input or output validation fails, or the handler returns an unexpected result.
+    """
+    try:
+        request_data = orjson.loads(await request.body())
+    except orjson.JSONDecodeError as e:
+        raise HTTPException(status_code=422, detail=f"Invalid JSON body: {e}")
+    if not isinstance(request_data, dict):
+        raise HTTPException(status_code=422, detail="Request body must be a JSON object")
+
+    final_response = await _run_capability(
+        capability_name, request_data, a2a_service, handler_service
+    )
+    return Response(
+        content=final_response.model_dump_json(), media_type="application/json"
+    )
+
+
+async def _missing_capability_name() -> BaseModel:
+    raise HTTPException(
+        status_code=422, detail="Batch call is missing 'capability_name'"
+    )
+
+
+def _batch_result(outcome: BaseModel | BaseException) -> dict[str, Any]:
+    """Converts the outcome of one batched call into its result entry."""
+    if isinstance(outcome, HTTPException):
+        return {"status_code": outcome.status_code, "detail": outcome.detail}
+    if isinstance(outcome, BaseException):
+        return {
+            "status_code": 500,
+            "detail": f"Error executing capability: {outcome}",
+        }
+    return {"status_code": 200, "data": outcome.model_dump(mode="json")}
+
+
+@a2a_api_router.post("/batch")
+async def execute_capability_batch(
+    a2a_service: A2ACapabilityDep,
+    handler_service: A2AHandlerDep,
+    batch: dict[str, list[dict[str, Any]]] = Body(...),
+) -> Response:
+    """
+    Executes several capability calls received in a single request.
+
+    The body has the form ``{"calls": [{"capability_name": ..., "payload": {...}}, ...]}``.
+    Each call is executed independently, so a failing call does not affect the others.
+
+    Returns:
+        ``{"results": [...]}`` in call order, where each entry holds either
+        ``{"status_code": 200, "data": {...}}`` or ``{"status_code": <code>, "detail": ...}``.
+        The envelope is encoded by orjson rather than FastAPI's ``jsonable_encoder``.
+    """
+    calls = batch.get("calls", [])
+    # Calls are independent, so they run concurrently: the batch takes as
+    # long as its slowest call rather than the sum of all of them.
+    outcomes = await asyncio.gather(
+        *(
+            _run_capability(
+                call["capability_name"],
+                call.get("payload", {}),
+                a2a_service,
+                handler_service,
+            )
+            if "capability_name" in call
+            else _missing_capability_name()
+            for call in calls
+        ),
+        return_exceptions=True,
+    )
+    results = [_batch_result(outcome) for outcome in outcomes]
+    return Response(
+        content=orjson.dumps({"results": results}, default=str),
+        media_type="application/json",
+    )
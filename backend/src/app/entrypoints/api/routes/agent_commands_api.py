@@ -1,29 +1,34 @@
-from fastapi import APIRouter, Depends, HTTPException, status
-from pydantic import BaseModel
+from collections.abc import Callable
+from typing import Annotated, Any, Dict, Optional
 from uuid import UUID
-from typing import Dict, Any, Optional, Type
 
-from pydantic import BaseModel, ValidationError # Added ValidationError
+import msgspec
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
+from pydantic import ValidationError
+
+from app.entrypoints.api.dependencies import (
+    get_ai_provider_service,
+    get_context_service,
+    get_pattern_service,
+    get_strategy_service,
+    get_template_service,
+    get_uow,
+)
+from app.entrypoints.api.msgspec_body import decode_msgspec_body, msgspec_body_openapi
 from app.service_layer.ai_pattern_execution_service import AIPatternExecutionService, EmptyRenderedPromptError
-from app.domain.agent.models import Conversation # Assuming Conversation might be part of a response or error detail
 
 # Imports for actual dependencies of AIPatternExecutionService
+from app.service_layer.ai_provider_service import AIProviderService
+from app.service_layer.context_service import ContextService
 from app.service_layer.pattern_service import PatternService
-from app.service_layer.template_service import TemplateService
 from app.service_layer.strategy_service import StrategyService
-from app.service_layer.context_service import ContextService
-from app.service_layer.ai_provider_service import AIProviderService
-from app.domain.agent.ports import AbstractConversationRepository
+from app.service_layer.template_service import TemplateService
 from app.service_layer.unit_of_work import AbstractUnitOfWork
 
-# Concrete implementations for abstract dependencies
-from app.adapters.conversation_repository_inmemory import InMemoryConversationRepository
-from app.adapters.uow_sqlmodel import SqlModelUnitOfWork # Using SqlModelUnitOfWork as found
-
 router = APIRouter(prefix="/agent/commands", tags=["Agent Commands"])
 
 
-class ExecutePatternRequest(BaseModel):
+class ExecutePatternRequest(msgspec.Struct):
     pattern_name: str
     input_variables: Dict[str, Any]
     session_id: Optional[UUID] = None
@@ -33,24 +38,22 @@ class ExecutePatternRequest(BaseModel):
     # output_model_name: Optional[str] = None # Omitted as per instructions
 
 
-class ExecutePatternResponse(BaseModel):
+class ExecutePatternResponse(msgspec.Struct):
     result: Any
 
 
 async def get_aipes_service(
-    pattern_service: PatternService = Depends(),
-    template_service: TemplateService = Depends(),
-    strategy_service: StrategyService = Depends(),
-    context_service: ContextService = Depends(),
-    ai_provider_service: AIProviderService = Depends(),
-    # Provide concrete implementations for abstract types via Depends
-    conversation_repository: AbstractConversationRepository = Depends(InMemoryConversationRepository),
-    uow: AbstractUnitOfWork = Depends(SqlModelUnitOfWork) 
+    pattern_service: PatternService = Depends(get_pattern_service),
+    template_service: TemplateService = Depends(get_template_service),
+    strategy_service: StrategyService = Depends(get_strategy_service),
+    context_service: ContextService = Depends(get_context_service),
+    ai_provider_service: AIProviderService = Depends(get_ai_provider_service),
+    uow: AbstractUnitOfWork = Depends(get_uow)
 ) -> AIPatternExecutionService:
     """
     Dependency provider for AIPatternExecutionService.
-    Constructs and returns a real instance of AIPatternExecutionService
-    with its required dependencies resolved by FastAPI.
+    The stateless services are shared singletons from the dependencies module;
+    only the unit of work is created per request.
     """
     return AIPatternExecutionService(
         pattern_service=pattern_service,
@@ -58,16 +61,51 @@ async def get_aipes_service(
         strategy_service=strategy_service,
         context_service=context_service,
         ai_provider_service=ai_provider_service,
-        conversation_repository=conversation_repository,
         uow=uow
     )
 
 
-@router.post("/execute-pattern", response_model=ExecutePatternResponse)
+AIPESDep = Annotated[AIPatternExecutionService, Depends(get_aipes_service)]
+
+
+# Maps service exceptions to the HTTP error the endpoint reports for them.
+# Lookups walk the raised type's MRO, so subclasses map like their bases.
+_EXC_TO_HTTP: Dict[type[BaseException], Callable[[BaseException], HTTPException]] = {
+    EmptyRenderedPromptError: lambda e: HTTPException(
+        status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)
+    ),
+    # Pydantic validation errors, e.g. from output_model parsing in the service
+    ValidationError: lambda e: HTTPException(
+        status_code=status.HTTP_400_BAD_REQUEST,
+        detail=f"Data validation or parsing error: {e}",
+    ),
+    # In a real app, log the exception with a logger before hiding it
+    Exception: lambda e: HTTPException(
+        status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+        detail="An internal server error occurred.",
+    ),
+}
+
+
+def _http_error_for(exc: Exception) -> HTTPException:
+    """Builds the HTTPException for ``exc`` from the nearest mapped type in its MRO."""
+    for exc_type in type(exc).__mro__:
+        builder = _EXC_TO_HTTP.get(exc_type)
+        if builder is not None:
+            return builder(exc)
+    return _EXC_TO_HTTP[Exception](exc)
+
+
+@router.post(
+    "/execute-pattern",
+    openapi_extra=msgspec_body_openapi(ExecutePatternRequest),
+)
 async def execute_pattern_endpoint(
-    request: ExecutePatternRequest,
-    service: AIPatternExecutionService = Depends(get_aipes_service)
-):
+    http_request: Request,
+    service: AIPESDep,
+) -> Response:
+    request = await decode_msgspec_body(http_request, ExecutePatternRequest)
+
     try:
         service_response = await service.execute_pattern(
             pattern_name=request.pattern_name,
@@ -78,13 +116,9 @@ async def execute_pattern_endpoint(
             model_name=request.model_name,
             output_model=None # API layer doesn't pass the Type[BaseModel] directly.
         )
-        return ExecutePatternResponse(result=service_response)
-    except EmptyRenderedPromptError as e:
-        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
-    except ValidationError as e:
-        # This handles Pydantic validation errors, e.g. from output_model parsing in the service
-        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=f"Data validation or parsing error: {e}")
+        return Response(
+            content=msgspec.json.encode(ExecutePatternResponse(result=service_response)),
+            media_type="application/json",
+        )
     except Exception as e:
-        # In a real app, log the exception e with a logger
-        # logger.error(f"An unexpected error occurred during pattern execution: {e}", exc_info=True)
-        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="An internal server error occurred.")
+        raise _http_error_for(e) from e
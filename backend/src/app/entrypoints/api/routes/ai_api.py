@@ -1,15 +1,15 @@
 from typing import Any
 
-from fastapi import APIRouter, Depends
-from pydantic import BaseModel
+import msgspec
+from fastapi import APIRouter, Request, Response
 
-from app.entrypoints.api.dependencies import get_ai_pattern_execution_service
-from app.service_layer.ai_pattern_execution_service import AIPatternExecutionService
+from app.entrypoints.api.dependencies import AIPatternExecutionServiceDep
+from app.entrypoints.api.msgspec_body import decode_msgspec_body, msgspec_body_openapi
 
 ai_router = APIRouter()
 
 
-class ExecutePatternRequest(BaseModel):
+class ExecutePatternRequest(msgspec.Struct):
     pattern_name: str
     input_variables: dict[str, Any]
     session_id: str | None = None
@@ -18,16 +18,20 @@ class ExecutePatternRequest(BaseModel):
     model_name: str | None = None
 
 
-class ExecutePatternResponse(BaseModel):
+class ExecutePatternResponse(msgspec.Struct):
     result: Any
 
 
-@ai_router.post("/execute-pattern", response_model=ExecutePatternResponse)
+@ai_router.post(
+    "/execute-pattern",
+    openapi_extra=msgspec_body_openapi(ExecutePatternRequest),
+)
 async def execute_pattern(
-    request: ExecutePatternRequest,
-    ai_service: AIPatternExecutionService = Depends(get_ai_pattern_execution_service),
-) -> ExecutePatternResponse:
+    http_request: Request,
+    ai_service: AIPatternExecutionServiceDep,
+) -> Response:
     """Execute an AI pattern with the given parameters."""
+    request = await decode_msgspec_body(http_request, ExecutePatternRequest)
     result = await ai_service.execute_pattern(
         pattern_name=request.pattern_name,
         input_variables=request.input_variables,
@@ -36,4 +40,7 @@ async def execute_pattern(
         context_name=request.context_name,
         model_name=request.model_name,
     )
-    return ExecutePatternResponse(result=result)
+    return Response(
+        content=msgspec.json.encode(ExecutePatternResponse(result=result)),
+        media_type="application/json",
+    )
@@ -1,10 +1,15 @@
 import asyncio
+from typing import Any
 from uuid import UUID
 
-from fastapi import APIRouter, Body, Depends, HTTPException
+from fastapi import APIRouter, Body, HTTPException
 from pydantic import BaseModel
 
-from app.entrypoints.api.dependencies import get_ai_pattern_execution_service
+from app.adapters.completion_cache import CompletionCache
+from app.entrypoints.api.dependencies import (
+    AIPatternExecutionServiceDep,
+    CompletionCacheDep,
+)
 from app.service_layer.ai_pattern_execution_service import (
     AIPatternExecutionService,
     EmptyRenderedPromptError,
@@ -52,11 +57,43 @@ class CopilotMockResponse(BaseModel):
     message: str
 
 
+async def cached_execute(
+    ai_service: AIPatternExecutionService,
+    cache: CompletionCache,
+    pattern_name: str,
+    input_variables: dict[str, Any],
+    session_id: UUID | None,
+) -> Any:
+    """
+    Executes a pattern, serving stateless executions from the reply cache.
+
+    Executions within a conversation depend on its history, so they always
+    reach the AI service. Only plain-text replies are cached.
+    """
+    if session_id is not None:
+        return await ai_service.execute_pattern(
+            pattern_name=pattern_name,
+            input_variables=input_variables,
+            session_id=session_id,
+        )
+
+    reply, embedding = cache.lookup(pattern_name, input_variables)
+    if reply is not None:
+        return reply
+    result = await ai_service.execute_pattern(
+        pattern_name=pattern_name, input_variables=input_variables
+    )
+    if isinstance(result, str):
+        cache.store(pattern_name, input_variables, result, embedding=embedding)
+    return result
+
+
 # --- Endpoints ---
 @router.post("/execute", response_model=CopilotExecuteResponse)
 async def execute_copilot_action(
     request_data: CopilotExecuteRequest,
-    ai_service: AIPatternExecutionService = Depends(get_ai_pattern_execution_service),
+    ai_service: AIPatternExecutionServiceDep,
+    completion_cache: CompletionCacheDep,
 ):
     """
     Receives a request from a CopilotKit frontend, processes it
@@ -80,12 +117,13 @@ async def execute_copilot_action(
 
         # Using a generic pattern name for now. This should be defined in your pattern service.
         # The input variables are passed directly from the request.
-        result = await ai_service.execute_pattern(
+        # Stateless requests (no conversationId) may be answered from the cache.
+        result = await cached_execute(
+            ai_service,
+            completion_cache,
             pattern_name="copilot_chat",  # Replace with an actual, defined pattern
             input_variables={"message": request_data.message},
             session_id=session_id_uuid,
-            # model_name="gpt-4", # Optionally specify model, or let service use default
-            # output_model=None # Define if structured output is expected
         )
 
         if isinstance(result, str):
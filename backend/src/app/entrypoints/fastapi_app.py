@@ -1,34 +1,70 @@
 # backend/src/app/entrypoints/fastapi_app.py
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from functools import lru_cache
+from typing import Any
+
 import sentry_sdk
 from fastapi import FastAPI
 from fastapi.routing import APIRoute
 from starlette.middleware.cors import CORSMiddleware
 
 from app.config import settings
-from app.entrypoints.api.main import api_router
+from app.entrypoints.api.dependencies import cleanup_dependencies
+from app.entrypoints.api.main import create_api_router
 
 
 def custom_generate_unique_id(route: APIRoute) -> str:
+    # Untagged routes fall back to their name instead of failing schema generation
+    if not route.tags:
+        return route.name
     return f"{route.tags[0]}-{route.name}"
 
 
-if settings.SENTRY_DSN and settings.ENVIRONMENT != "local":
-    sentry_sdk.init(dsn=str(settings.SENTRY_DSN), enable_tracing=True)
+@asynccontextmanager
+async def lifespan(_app: FastAPI) -> AsyncIterator[None]:
+    # Generate (and cache) the OpenAPI schema before serving, so the route
+    # tables and model JSON schemas are built at worker start rather than
+    # by whichever request arrives first.
+    _app.openapi()
+    yield
+    await cleanup_dependencies()
+
+
+@lru_cache(maxsize=1)
+def create_app() -> FastAPI:
+    """
+    ASGI application factory.
 
-app = FastAPI(
-    title=settings.PROJECT_NAME,
-    openapi_url=f"{settings.API_V1_STR}/openapi.json",
-    generate_unique_id_function=custom_generate_unique_id,
-)
+    Serve with ``uvicorn --factory app.entrypoints.fastapi_app:create_app``
+    so the app is built once per worker rather than on every import.
+    """
+    if settings.SENTRY_DSN and settings.ENVIRONMENT != "local":
+        sentry_sdk.init(dsn=str(settings.SENTRY_DSN), enable_tracing=True)
 
-# Set all CORS enabled origins
-if settings.all_cors_origins:
-    app.add_middleware(
-        CORSMiddleware,
-        allow_origins=settings.all_cors_origins,
-        allow_credentials=True,
-        allow_methods=["*"],
-        allow_headers=["*"],
+    app = FastAPI(
+        title=settings.PROJECT_NAME,
+        lifespan=lifespan,
+        openapi_url=f"{settings.API_V1_STR}/openapi.json",
+        generate_unique_id_function=custom_generate_unique_id,
     )
 
-app.include_router(api_router, prefix=settings.API_V1_STR)
+    # Set all CORS enabled origins
+    if settings.all_cors_origins:
+        app.add_middleware(
+            CORSMiddleware,
+            allow_origins=settings.all_cors_origins,
+            allow_credentials=True,
+            allow_methods=["*"],
+            allow_headers=["*"],
+        )
+
+    app.include_router(create_api_router(), prefix=settings.API_V1_STR)
+    return app
+
+
+def __getattr__(name: str) -> Any:
+    # `fastapi_app.app` is still importable (e.g. by scripts/generate-client.sh).
+    if name == "app":
+        return create_app()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,26 +1,58 @@
 from collections.abc import Callable
-from typing import Any
+from dataclasses import dataclass, field
+from typing import Any, cast
 
 from pydantic import BaseModel
 
 
+def _reject_output(data: Any) -> BaseModel:
+    """Output validator for capabilities that declare no output schema."""
+    raise TypeError("Capability declares no output schema")
+
+
+def _build_output_validator(
+    output_schema: type[BaseModel] | None,
+) -> Callable[[Any], BaseModel]:
+    """Build the function that coerces a handler result to ``output_schema``."""
+    if output_schema is None:
+        return _reject_output
+    validate = output_schema.model_validate
+
+    def validate_output(data: Any) -> BaseModel:
+        data_type = type(data)
+        # Exact-type check first: model classes are ABCs, so isinstance()
+        # takes the slower ABCMeta path and is only needed for subclasses
+        if data_type is output_schema:
+            return cast(BaseModel, data)
+        if data_type is dict:
+            return validate(data)
+        if isinstance(data, output_schema):
+            return data
+        raise TypeError(
+            f"Expected a dict or {output_schema.__name__}, got {type(data).__name__}"
+        )
+
+    return validate_output
+
+
+@dataclass(frozen=True, slots=True)
 class CapabilityMetadata:
     """Metadata for an Agent-to-Agent capability."""
 
-    def __init__(
-        self,
-        name: str,
-        description: str,
-        input_schema: type[BaseModel] | None = None,
-        output_schema: type[BaseModel] | None = None,
-        handler: Callable | None = None,
-    ):
-        """Initialize capability metadata."""
-        self.name = name
-        self.description = description
-        self.input_schema = input_schema
-        self.output_schema = output_schema
-        self.handler = handler
+    name: str
+    description: str
+    input_schema: type[BaseModel] | None = None
+    output_schema: type[BaseModel] | None = None
+    handler: Callable | None = None
+    validate_output: Callable[[Any], BaseModel] = field(
+        init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        # Bound once so each request dispatches on the result type directly
+        object.__setattr__(
+            self, "validate_output", _build_output_validator(self.output_schema)
+        )
 
 
 class A2ACapabilityService:
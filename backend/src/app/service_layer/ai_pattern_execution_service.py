@@ -1,3 +1,4 @@
+import asyncio
 import inspect
 from typing import Any  # For type hinting module_class
 from uuid import UUID, uuid4
@@ -124,6 +125,39 @@ class AIPatternExecutionService:
             )
         return result
 
+    async def _load_session(
+        self, session_id: UUID | None
+    ) -> tuple[Conversation | None, list[str]]:
+        """Load (or start) the session's conversation and format its history."""
+        history_parts: list[str] = []
+        if not session_id:
+            return None, history_parts
+
+        async with self.uow:
+            conversation = await self.uow.conversations.get_by_id(session_id)
+        if not conversation:
+            return Conversation(id=session_id), history_parts
+
+        # Format conversation history properly for the prompt
+        history_messages = conversation.get_messages()
+        if history_messages:
+            history_parts.append("=== Conversation History ===")
+            for msg in history_messages:
+                history_parts.append(f"{msg.role.upper()}: {msg.content}")
+            history_parts.append("=== End History ===\n")
+        return conversation, history_parts
+
+    async def _load_strategy_prompt(self, strategy_name: str | None) -> str | None:
+        if not strategy_name:
+            return None
+        strategy = await self.strategy_service.get_strategy(strategy_name)
+        return strategy.prompt if strategy else None
+
+    async def _load_context_content(self, context_name: str | None) -> str | None:
+        if not context_name:
+            return None
+        return await self.context_service.get_context_content(context_name)
+
     async def execute_pattern(
         self,
         pattern_name: str,
@@ -153,40 +187,26 @@ class AIPatternExecutionService:
             EmptyRenderedPromptError: If the rendered prompt is empty or contains only whitespace.
             ValidationError: If parsing the AI response into the specified output model fails.
         """
-        conversation: Conversation | None = None
-        prompt_parts: list[str] = []
-
-        # Session Loading / Creation (within UoW)
-        async with self.uow:
-            if session_id:
-                conversation = await self.uow.conversations.get_by_id(session_id)
-                if conversation:
-                    # Format conversation history properly for the prompt
-                    history_messages = conversation.get_messages()
-                    if history_messages:
-                        prompt_parts.append("=== Conversation History ===")
-                        for msg in history_messages:
-                            prompt_parts.append(f"{msg.role.upper()}: {msg.content}")
-                        prompt_parts.append("=== End History ===\n")
-                else:
-                    conversation = Conversation(id=session_id)
-
-        # Strategy Assembly
-        if strategy_name:
-            strategy = await self.strategy_service.get_strategy(strategy_name)
-            if strategy and strategy.prompt:
-                prompt_parts.append(f"=== Strategy ===\n{strategy.prompt}\n")
-
-        # Context Assembly
-        if context_name:
-            context_content = await self.context_service.get_context_content(
-                context_name
-            )
-            if context_content:
-                prompt_parts.append(f"=== Context ===\n{context_content}\n")
+        # Session, strategy, context and pattern lookups are independent, so
+        # their I/O overlaps instead of running one after another. Pattern
+        # loading is synchronous file I/O and runs in a worker thread.
+        (
+            (conversation, history_parts),
+            strategy_prompt,
+            context_content,
+            pattern_content,
+        ) = await asyncio.gather(
+            self._load_session(session_id),
+            self._load_strategy_prompt(strategy_name),
+            self._load_context_content(context_name),
+            asyncio.to_thread(self.pattern_service.get_pattern_content, pattern_name),
+        )
 
-        # Pattern Assembly
-        pattern_content = await self.pattern_service.get_pattern_content(pattern_name)
+        prompt_parts: list[str] = history_parts
+        if strategy_prompt:
+            prompt_parts.append(f"=== Strategy ===\n{strategy_prompt}\n")
+        if context_content:
+            prompt_parts.append(f"=== Context ===\n{context_content}\n")
         if pattern_content:
             prompt_parts.append(f"=== Current Task ===\n{pattern_content}")
 
@@ -227,15 +247,14 @@ class AIPatternExecutionService:
             else:
                 user_message = str(input_variables)
 
+            turn = (("user", user_message), ("assistant", ai_response_content))
             if conversation:
-                conversation.add_message(role="user", content=user_message)
-                conversation.add_message(role="assistant", content=ai_response_content)
+                conversation.add_messages(turn)
                 await self.uow.conversations.save(conversation)
             else:
                 new_conv_id = uuid4()
                 conversation = Conversation(id=new_conv_id)
-                conversation.add_message(role="user", content=user_message)
-                conversation.add_message(role="assistant", content=ai_response_content)
+                conversation.add_messages(turn)
                 await self.uow.conversations.create(conversation)
 
             await self.uow.commit()
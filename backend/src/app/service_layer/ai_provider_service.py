@@ -1,5 +1,11 @@
+import asyncio
+import logging
+from collections.abc import Sequence
+from dataclasses import dataclass
 from typing import Any
 
+logger = logging.getLogger(__name__)
+
 
 class AIProviderService:
     """
@@ -44,6 +50,53 @@ class AIProviderService:
         Returns:
             The AI-generated text completion as a string.
         """
+        return await self._complete(
+            prompt, model_name, max_tokens, temperature, **kwargs
+        )
+
+    async def get_completions(
+        self,
+        prompts: Sequence[str],
+        model_name: str | None = None,
+        max_tokens: int | None = 150,
+        temperature: float | None = 0.7,
+        **kwargs: Any,
+    ) -> list[str]:
+        """
+        Gets completions for several prompts sharing the same settings.
+
+        Args:
+            prompts: The prompts to send to the AI model.
+            model_name: The specific model to use; defaults as in `get_completion`.
+            max_tokens: The maximum number of tokens to generate per prompt.
+            temperature: The sampling temperature.
+            **kwargs: Additional provider-specific parameters.
+
+        Returns:
+            The completions, in the same order as `prompts`.
+        """
+        # A provider with a batch endpoint would send all prompts in one
+        # request here, e.g. a single call carrying a list of inputs.
+        return list(
+            await asyncio.gather(
+                *(
+                    self._complete(
+                        prompt, model_name, max_tokens, temperature, **kwargs
+                    )
+                    for prompt in prompts
+                )
+            )
+        )
+
+    async def _complete(
+        self,
+        prompt: str,
+        model_name: str | None,
+        max_tokens: int | None,
+        temperature: float | None,
+        **kwargs: Any,
+    ) -> str:
+        """Performs a single provider call for `prompt`."""
         current_model = model_name or self.default_model
 
         # This is a placeholder implementation.
@@ -106,3 +159,163 @@ class AIProviderService:
             "gpt-4",
             "claude-2",
         ]
+
+
+# Completions are only coalesced when these settings match.
+_BatchKey = tuple[str | None, int | None, float | None]
+
+
+@dataclass(frozen=True, slots=True)
+class _PendingCompletion:
+    key: _BatchKey
+    prompt: str
+    future: asyncio.Future[str]
+
+
+class BatchingAIProviderService(AIProviderService):
+    """
+    AIProviderService that coalesces concurrent `get_completion` calls.
+
+    Calls are queued and a background worker drains the queue for up to
+    `max_wait_ms` (or until `max_batch_size` calls are waiting), groups the
+    calls by model and sampling settings, and sends each group through
+    `get_completions`. Each caller still receives its own completion. Under
+    concurrency this replaces one provider round trip per request with one
+    per batch; a lone request waits at most `max_wait_ms` longer.
+    """
+
+    def __init__(
+        self,
+        api_key: str | None = None,
+        default_model: str | None = "default_model",
+        max_batch_size: int = 16,
+        max_wait_ms: float = 10.0,
+    ):
+        """
+        Initializes the batching provider.
+
+        Args:
+            api_key: The API key for the AI provider, if required.
+            default_model: The default model to use if none is specified in requests.
+            max_batch_size: Most calls collected into one batch.
+            max_wait_ms: Longest time the first queued call waits for others.
+        """
+        super().__init__(api_key=api_key, default_model=default_model)
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000
+        self._queue: asyncio.Queue[_PendingCompletion] | None = None
+        self._worker: asyncio.Task[None] | None = None
+        self._worker_loop: asyncio.AbstractEventLoop | None = None
+        # Strong references to in-flight batches so they are not collected
+        self._dispatches: set[asyncio.Task[None]] = set()
+
+    async def get_completion(
+        self,
+        prompt: str,
+        model_name: str | None = None,
+        max_tokens: int | None = 150,
+        temperature: float | None = 0.7,
+        **kwargs: Any,
+    ) -> str:
+        """
+        Gets a completion, sharing a provider call with concurrent requests.
+
+        Calls with provider-specific `kwargs` cannot share a batch and are
+        sent on their own.
+        """
+        if kwargs:
+            return await self._complete(
+                prompt, model_name, max_tokens, temperature, **kwargs
+            )
+        future: asyncio.Future[str] = asyncio.get_running_loop().create_future()
+        self._ensure_worker().put_nowait(
+            _PendingCompletion(
+                key=(model_name, max_tokens, temperature),
+                prompt=prompt,
+                future=future,
+            )
+        )
+        return await future
+
+    async def aclose(self) -> None:
+        """Stops the worker and fails any calls still waiting in the queue."""
+        worker, queue = self._worker, self._queue
+        self._worker = self._queue = self._worker_loop = None
+        if worker is not None:
+            worker.cancel()
+            try:
+                await worker
+            except asyncio.CancelledError:
+                pass
+        while queue is not None and not queue.empty():
+            pending = queue.get_nowait()
+            if not pending.future.done():
+                pending.future.set_exception(
+                    RuntimeError("AI provider service was closed")
+                )
+
+    def _ensure_worker(self) -> asyncio.Queue[_PendingCompletion]:
+        """Returns the queue, (re)starting its worker on the running loop."""
+        loop = asyncio.get_running_loop()
+        if (
+            self._queue is None
+            or self._worker is None
+            or self._worker.done()
+            or self._worker_loop is not loop
+        ):
+            self._queue = asyncio.Queue()
+            self._worker_loop = loop
+            self._worker = loop.create_task(self._run(self._queue))
+        return self._queue
+
+    async def _run(self, queue: asyncio.Queue[_PendingCompletion]) -> None:
+        """Collects queued calls into batches and dispatches them."""
+        while True:
+            batch = [await queue.get()]
+            self._drain(queue, batch)
+            if len(batch) < self.max_batch_size:
+                # Give concurrent requests a short window to join the batch
+                await asyncio.sleep(self.max_wait)
+                self._drain(queue, batch)
+            task = asyncio.create_task(self._dispatch(batch))
+            self._dispatches.add(task)
+            task.add_done_callback(self._dispatches.discard)
+
+    def _drain(
+        self, queue: asyncio.Queue[_PendingCompletion], batch: list[_PendingCompletion]
+    ) -> None:
+        while len(batch) < self.max_batch_size and not queue.empty():
+            batch.append(queue.get_nowait())
+
+    async def _dispatch(self, batch: list[_PendingCompletion]) -> None:
+        """Sends one `get_completions` call per group of compatible calls."""
+        groups: dict[_BatchKey, list[_PendingCompletion]] = {}
+        for pending in batch:
+            if not pending.future.done():  # skip callers that gave up
+                groups.setdefault(pending.key, []).append(pending)
+        await asyncio.gather(
+            *(self._complete_group(key, group) for key, group in groups.items())
+        )
+
+    async def _complete_group(
+        self, key: _BatchKey, group: list[_PendingCompletion]
+    ) -> None:
+        # Similar-length prompts side by side keep per-request padding low
+        # for providers that pad a batch to its longest input.
+        group.sort(key=lambda pending: len(pending.prompt))
+        model_name, max_tokens, temperature = key
+        try:
+            completions = await self.get_completions(
+                [pending.prompt for pending in group],
+                model_name=model_name,
+                max_tokens=max_tokens,
+                temperature=temperature,
+            )
+            for pending, completion in zip(group, completions, strict=True):
+                if not pending.future.done():
+                    pending.future.set_result(completion)
+        except Exception as e:
+            logger.warning("Batched completion of %d prompts failed: %s", len(group), e)
+            for pending in group:
+                if not pending.future.done():
+                    pending.future.set_exception(e)
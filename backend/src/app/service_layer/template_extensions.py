@@ -1,5 +1,6 @@
 import json  # Ensure json is imported at the top
 from collections.abc import Callable
+from dataclasses import asdict, is_dataclass
 from typing import Any  # For GenericRequest
 
 from pydantic import BaseModel, ConfigDict  # For GenericRequest in a2a extension
@@ -168,7 +169,11 @@ def mem0_search_extension_function(
             try:
                 return json.dumps(
                     [
-                        res.dict() if hasattr(res, "dict") else res
+                        res.dict()
+                        if hasattr(res, "dict")
+                        else asdict(res)
+                        if is_dataclass(res)
+                        else res
                         for res in search_results
                     ]
                 )
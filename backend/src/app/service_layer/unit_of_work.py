@@ -16,6 +16,9 @@ class AbstractUnitOfWork(Protocol):
     """
 
     repositories: dict[str, Any]
+    # Class-level default so every implementation answers `uow.committed`
+    # directly; implementations set it to True once commit() succeeds.
+    committed: bool = False
 
     async def __aenter__(self) -> "AbstractUnitOfWork":
         """Start a new transaction and return self.
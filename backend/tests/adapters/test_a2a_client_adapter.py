@@ -1,5 +1,6 @@
+import asyncio
 import json
-from unittest.mock import AsyncMock
+from unittest.mock import AsyncMock, MagicMock
 
 import httpx
 import pytest
@@ -7,6 +8,7 @@ import pytest_asyncio
 from pydantic import BaseModel, ValidationError
 
 from app.adapters.a2a_client_adapter import A2AClientAdapter
+from app.domain.a2a.models import A2AStruct
 
 
 class MyTestRequest(BaseModel):
@@ -17,6 +19,19 @@ class MyTestResponse(BaseModel):
     result: str
 
 
+class MyStructRequest(A2AStruct):
+    data: str
+
+
+class MyStructResponse(A2AStruct):
+    result: str
+
+
+class MyNestedTestResponse(BaseModel):
+    inner: MyTestResponse
+    items: list[MyTestResponse]
+
+
 @pytest_asyncio.fixture
 async def mock_httpx_client() -> AsyncMock:
     """
@@ -50,10 +65,9 @@ async def test_execute_remote_capability_success_with_response_model(
     request_payload = MyTestRequest(data="test data")
     response_model = MyTestResponse
 
-    mock_response = AsyncMock()
-    mock_response.json = AsyncMock(return_value={"result": "test result"})
-    mock_response.raise_for_status = AsyncMock(return_value=None)
-    mock_httpx_client.post = AsyncMock(return_value=mock_response)
+    mock_response = MagicMock()
+    mock_response.content = b'{"result": "test result"}'
+    mock_httpx_client.post.return_value = mock_response
 
     # Act
     result = await a2a_client_adapter.execute_remote_capability(
@@ -69,7 +83,7 @@ async def test_execute_remote_capability_success_with_response_model(
 
     mock_httpx_client.post.assert_called_once_with(
         f"{agent_url}/a2a/execute/{capability_name}",
-        json={"data": "test data"},
+        content=b'{"data":"test data"}',
         headers={"Content-Type": "application/json", "Accept": "application/json"},
     )
 
@@ -85,10 +99,9 @@ async def test_execute_remote_capability_success_without_response_model(
     capability_name = "test_capability"
     request_payload = MyTestRequest(data="test data")
 
-    mock_response = AsyncMock()
-    mock_response.json = AsyncMock(return_value={"result": "test result"})
-    mock_response.raise_for_status = AsyncMock(return_value=None)
-    mock_httpx_client.post = AsyncMock(return_value=mock_response)
+    mock_response = MagicMock()
+    mock_response.content = b'{"result": "test result"}'
+    mock_httpx_client.post.return_value = mock_response
 
     # Act
     result = await a2a_client_adapter.execute_remote_capability(
@@ -103,6 +116,84 @@ async def test_execute_remote_capability_success_without_response_model(
     assert result == {"result": "test result"}
 
 
+@pytest.mark.asyncio
+async def test_execute_remote_capability_with_msgspec_structs(
+    a2a_client_adapter: A2AClientAdapter,
+    mock_httpx_client: AsyncMock,
+) -> None:
+    """Test that msgspec structs are encoded and decoded without Pydantic."""
+    # Arrange
+    mock_response = MagicMock()
+    mock_response.content = b'{"result": "test result"}'
+    mock_httpx_client.post.return_value = mock_response
+
+    # Act
+    result = await a2a_client_adapter.execute_remote_capability(
+        agent_url="http://test-agent.com",
+        capability_name="test_capability",
+        request_payload=MyStructRequest(data="test data"),
+        response_model=MyStructResponse,
+    )
+
+    # Assert
+    assert result == MyStructResponse(result="test result")
+    assert mock_httpx_client.post.call_args.kwargs["content"] == b'{"data":"test data"}'
+
+
+@pytest.mark.asyncio
+async def test_execute_remote_capability_raw_bytes(
+    a2a_client_adapter: A2AClientAdapter,
+    mock_httpx_client: AsyncMock,
+) -> None:
+    """Test that raw_bytes returns the unparsed response body."""
+    # Arrange
+    mock_response = MagicMock()
+    mock_response.content = b'{"result": "test result"}'
+    mock_httpx_client.post.return_value = mock_response
+
+    # Act
+    result = await a2a_client_adapter.execute_remote_capability(
+        agent_url="http://test-agent.com",
+        capability_name="test_capability",
+        request_payload=MyTestRequest(data="test data"),
+        raw_bytes=True,
+    )
+
+    # Assert
+    assert result == b'{"result": "test result"}'
+
+
+@pytest.mark.asyncio
+async def test_execute_remote_capability_trusted_constructs_nested_models(
+    a2a_client_adapter: A2AClientAdapter,
+    mock_httpx_client: AsyncMock,
+) -> None:
+    """Test that trusted responses are constructed, including nested models."""
+    # Arrange
+    request_payload = MyTestRequest(data="test data")
+
+    mock_response = MagicMock()
+    mock_response.content = (
+        b'{"inner": {"result": "a"}, "items": [{"result": "b"}, {"result": "c"}]}'
+    )
+    mock_httpx_client.post.return_value = mock_response
+
+    # Act
+    result = await a2a_client_adapter.execute_remote_capability(
+        agent_url="http://test-agent.com",
+        capability_name="test_capability",
+        request_payload=request_payload,
+        response_model=MyNestedTestResponse,
+        trusted=True,
+    )
+
+    # Assert
+    assert isinstance(result, MyNestedTestResponse)
+    assert isinstance(result.inner, MyTestResponse)
+    assert result.inner.result == "a"
+    assert [item.result for item in result.items] == ["b", "c"]
+
+
 @pytest.mark.asyncio
 async def test_execute_remote_capability_http_error(
     a2a_client_adapter: A2AClientAdapter,
@@ -160,12 +251,9 @@ async def test_execute_remote_capability_json_decode_error(
     capability_name = "test_capability"
     request_payload = MyTestRequest(data="test data")
 
-    mock_response = AsyncMock()
-    mock_response.raise_for_status = AsyncMock(return_value=None)
-    mock_response.json = AsyncMock(
-        side_effect=json.JSONDecodeError("Invalid JSON", "", 0)
-    )
-    mock_httpx_client.post = AsyncMock(return_value=mock_response)
+    mock_response = MagicMock()
+    mock_response.content = b"not valid json"
+    mock_httpx_client.post.return_value = mock_response
 
     # Act & Assert
     with pytest.raises(RuntimeError, match="Failed to decode JSON response"):
@@ -188,12 +276,9 @@ async def test_execute_remote_capability_validation_error(
     request_payload = MyTestRequest(data="test data")
     response_model = MyTestResponse
 
-    mock_response = AsyncMock()
-    mock_response.json = AsyncMock(
-        return_value={"invalid": "data"}
-    )  # Missing 'result' field
-    mock_response.raise_for_status = AsyncMock(return_value=None)
-    mock_httpx_client.post = AsyncMock(return_value=mock_response)
+    mock_response = MagicMock()
+    mock_response.content = b'{"invalid": "data"}'  # Missing 'result' field
+    mock_httpx_client.post.return_value = mock_response
 
     # Act & Assert
     with pytest.raises(ValidationError):
@@ -203,3 +288,47 @@ async def test_execute_remote_capability_validation_error(
             request_payload=request_payload,
             response_model=response_model,
         )
+
+
+@pytest.mark.asyncio
+async def test_execute_remote_capability_batched_coalesces_calls(
+    a2a_client_adapter: A2AClientAdapter,
+    mock_httpx_client: AsyncMock,
+) -> None:
+    """Test that concurrent batched calls to one agent share a single request."""
+    # Arrange
+    agent_url = "http://test-agent.com"
+
+    mock_response = MagicMock()
+    mock_response.content = (
+        b'{"results": [{"status_code": 200, "data": {"result": "one"}},'
+        b' {"status_code": 404, "detail": "Capability not found"}]}'
+    )
+    mock_httpx_client.post.return_value = mock_response
+
+    # Act
+    first, second = await asyncio.gather(
+        a2a_client_adapter.execute_remote_capability_batched(
+            agent_url, "cap_one", MyTestRequest(data="1"), MyTestResponse
+        ),
+        a2a_client_adapter.execute_remote_capability_batched(
+            agent_url, "cap_two", MyTestRequest(data="2")
+        ),
+        return_exceptions=True,
+    )
+
+    # Assert
+    assert isinstance(first, MyTestResponse)
+    assert first.result == "one"
+    assert isinstance(second, RuntimeError)
+    assert "cap_two" in str(second)
+
+    mock_httpx_client.post.assert_called_once()
+    args, kwargs = mock_httpx_client.post.call_args
+    assert args[0] == f"{agent_url}/a2a/batch"
+    assert json.loads(kwargs["content"]) == {
+        "calls": [
+            {"capability_name": "cap_one", "payload": {"data": "1"}},
+            {"capability_name": "cap_two", "payload": {"data": "2"}},
+        ]
+    }
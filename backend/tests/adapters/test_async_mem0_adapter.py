@@ -0,0 +1,163 @@
+"""Tests for the asynchronous Mem0 adapter."""
+
+import logging
+from unittest.mock import AsyncMock
+
+import pytest
+
+from app.adapters.mem0_adapter import (
+    AsyncMem0Adapter,
+    MemorySearchRequest,
+    MemorySearchResult,
+    MemoryWriteRequest,
+)
+
+
+@pytest.fixture
+def mock_async_client() -> AsyncMock:
+    """Fixture providing a mocked AsyncMemoryClient."""
+    return AsyncMock()
+
+
+@pytest.mark.asyncio
+async def test_batch_add_preserves_order_and_maps_failures_to_none(
+    mock_async_client: AsyncMock,
+) -> None:
+    """Test that batch_add returns ids in input order with None for failures."""
+
+    async def fake_add(text: str, **_: object) -> dict:
+        if text == "bad":
+            raise RuntimeError("add failed")
+        return {"results": [{"id": f"id-{text}", "event": "ADD"}]}
+
+    mock_async_client.add.side_effect = fake_add
+    adapter = AsyncMem0Adapter(mock_async_client)
+
+    result = await adapter.batch_add(
+        [
+            MemoryWriteRequest(user_id="u1", text_content="one"),
+            MemoryWriteRequest(user_id="u1", text_content="bad"),
+            MemoryWriteRequest(user_id="u1", text_content="two"),
+        ]
+    )
+
+    assert result == ["id-one", None, "id-two"]
+    assert mock_async_client.add.await_count == 3
+
+
+@pytest.mark.asyncio
+async def test_add_answers_duplicate_text_locally(
+    mock_async_client: AsyncMock,
+) -> None:
+    """Test that re-adding the same text for a user skips the Mem0 call."""
+    mock_async_client.add.return_value = {"results": [{"id": "m1", "event": "ADD"}]}
+    adapter = AsyncMem0Adapter(mock_async_client)
+
+    first = await adapter.add(MemoryWriteRequest(user_id="u1", text_content="tea"))
+    second = await adapter.add(MemoryWriteRequest(user_id="u1", text_content="tea"))
+    await adapter.add(MemoryWriteRequest(user_id="u2", text_content="tea"))
+
+    assert first == second == "m1"
+    assert mock_async_client.add.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_add_with_different_metadata_is_not_deduplicated(
+    mock_async_client: AsyncMock,
+) -> None:
+    """Test that the same text with different metadata still reaches Mem0."""
+    mock_async_client.add.side_effect = [
+        {"results": [{"id": "m1", "event": "ADD"}]},
+        {"results": [{"id": "m2", "event": "ADD"}]},
+    ]
+    adapter = AsyncMem0Adapter(mock_async_client)
+
+    first = await adapter.add(
+        MemoryWriteRequest(user_id="u1", text_content="tea", metadata={"tag": "a"})
+    )
+    second = await adapter.add(
+        MemoryWriteRequest(user_id="u1", text_content="tea", metadata={"tag": "b"})
+    )
+
+    assert (first, second) == ("m1", "m2")
+    assert mock_async_client.add.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_batch_search_maps_results(mock_async_client: AsyncMock) -> None:
+    """Test that batch_search converts Mem0 results for each request."""
+    mock_async_client.search.return_value = {
+        "results": [{"id": "m1", "memory": "likes tea", "score": 0.8}]
+    }
+    adapter = AsyncMem0Adapter(mock_async_client)
+
+    result = await adapter.batch_search(
+        [
+            MemorySearchRequest(user_id="u1", query="tea"),
+            MemorySearchRequest(user_id="u2", query="tea"),
+        ]
+    )
+
+    expected = [MemorySearchResult(id="m1", content="likes tea", score=0.8)]
+    assert result == [expected, expected]
+
+
+@pytest.mark.asyncio
+async def test_search_skips_malformed_results(mock_async_client: AsyncMock) -> None:
+    """Test that a malformed hit is dropped while valid hits are kept."""
+    mock_async_client.search.return_value = {
+        "results": [
+            {"id": "m1", "memory": "likes tea", "score": 0.8},
+            {"id": "m2", "score": 0.7},  # missing text
+            {"id": "m3", "memory": "likes coffee", "score": 0.2},
+        ]
+    }
+    adapter = AsyncMem0Adapter(mock_async_client)
+
+    result = await adapter.search(
+        MemorySearchRequest(user_id="u1", query="drinks", min_score=0.5)
+    )
+
+    assert [r.id for r in result] == ["m1"]
+
+
+@pytest.mark.asyncio
+async def test_search_iter_validates_lazily(mock_async_client: AsyncMock) -> None:
+    """Test that search_iter yields hits one by one and stops with the caller."""
+    mock_async_client.search.return_value = {
+        "results": [
+            {"id": "m1", "memory": "likes tea", "score": 0.8},
+            {"id": "m2", "score": 0.7},  # missing text
+            {"id": "m3", "memory": "likes coffee", "score": 0.6},
+            {"id": "m4", "memory": "likes juice", "score": 0.5},
+        ]
+    }
+    adapter = AsyncMem0Adapter(mock_async_client)
+
+    taken = []
+    async for result in adapter.search_iter(
+        MemorySearchRequest(user_id="u1", query="drinks")
+    ):
+        taken.append(result.id)
+        if len(taken) == 2:
+            break
+
+    assert taken == ["m1", "m3"]
+
+
+@pytest.mark.asyncio
+async def test_search_error_logging_is_rate_limited(
+    mock_async_client: AsyncMock, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test that a burst of failures logs a bounded number of errors."""
+    mock_async_client.search.side_effect = RuntimeError("server error")
+    adapter = AsyncMem0Adapter(mock_async_client)
+    requests = [MemorySearchRequest(user_id="u1", query="q")] * 20
+
+    with caplog.at_level(logging.ERROR, logger="app.adapters.mem0_adapter"):
+        result = await adapter.batch_search(requests)
+
+    assert result == [[]] * 20
+    errors = [r for r in caplog.records if r.levelno == logging.ERROR]
+    assert 1 <= len(errors) <= 5
+    assert errors[0].getMessage() == "Error searching memories for user=u1"
@@ -0,0 +1,93 @@
+"""Tests for the AI pattern completion cache."""
+
+from unittest.mock import patch
+
+from app.adapters.completion_cache import CompletionCache
+
+
+def test_exact_hit_returns_stored_reply() -> None:
+    """Test that identical executions are served from the exact tier."""
+    cache = CompletionCache()
+    inputs = {"message": "hello", "tone": "formal"}
+
+    assert cache.lookup("chat", inputs) == (None, None)
+    cache.store("chat", inputs, "Good day.")
+
+    assert cache.lookup("chat", {"tone": "formal", "message": "hello"})[0] == "Good day."
+    assert cache.lookup("chat", inputs, model_name="other")[0] is None
+    assert cache.lookup("summarize", inputs)[0] is None
+
+
+def test_entries_expire_after_ttl() -> None:
+    """Test that a reply is no longer served once its TTL has passed."""
+    cache = CompletionCache(ttl_seconds=10)
+    with patch("app.adapters.completion_cache.time.monotonic", return_value=100.0):
+        cache.store("chat", {"message": "hello"}, "Hi!")
+    with patch("app.adapters.completion_cache.time.monotonic", return_value=105.0):
+        assert cache.lookup("chat", {"message": "hello"})[0] == "Hi!"
+    with patch("app.adapters.completion_cache.time.monotonic", return_value=111.0):
+        assert cache.lookup("chat", {"message": "hello"})[0] is None
+
+
+def test_exact_tier_evicts_least_recently_used() -> None:
+    """Test that the exact tier is bounded by max_entries."""
+    cache = CompletionCache(max_entries=2)
+    cache.store("chat", {"message": "first"}, "1")
+    cache.store("chat", {"message": "second"}, "2")
+    cache.lookup("chat", {"message": "first"})  # first becomes most recently used
+    cache.store("chat", {"message": "third"}, "3")
+
+    assert cache.lookup("chat", {"message": "first"})[0] == "1"
+    assert cache.lookup("chat", {"message": "second"})[0] is None
+
+
+def test_semantic_hit_for_similar_single_variable_input() -> None:
+    """Test that a near-identical message hits the semantic tier."""
+    vectors = {
+        "what is the weather": [1.0, 0.0, 0.01],
+        "what's the weather": [1.0, 0.0, 0.0],
+        "tell me a joke": [0.0, 1.0, 0.0],
+    }
+    cache = CompletionCache(embedder=vectors.__getitem__, similarity_threshold=0.95)
+    reply, embedding = cache.lookup("chat", {"message": "what is the weather"})
+    assert reply is None
+    cache.store("chat", {"message": "what is the weather"}, "Sunny.", embedding=embedding)
+
+    assert cache.lookup("chat", {"message": "what's the weather"})[0] == "Sunny."
+    assert cache.lookup("chat", {"message": "tell me a joke"})[0] is None
+    assert cache.lookup("other", {"message": "what's the weather"})[0] is None
+
+
+def test_semantic_tier_skips_multi_variable_inputs() -> None:
+    """Test that inputs with several variables never use the embedder."""
+    calls: list[str] = []
+
+    def embedder(text: str) -> list[float]:
+        calls.append(text)
+        return [1.0, 0.0]
+
+    cache = CompletionCache(embedder=embedder)
+    inputs = {"message": "hi", "tone": "formal"}
+
+    assert cache.lookup("chat", inputs) == (None, None)
+    assert calls == []
+
+
+def test_semantic_tier_overwrites_oldest_entry_when_full() -> None:
+    """Test that the semantic ring buffer keeps only the newest max_entries."""
+    vectors = {
+        "north": [1.0, 0.0, 0.0],
+        "east": [0.0, 1.0, 0.0],
+        "up": [0.0, 0.0, 1.0],
+        "northwards": [1.0, 0.01, 0.0],
+        "eastwards": [0.01, 1.0, 0.0],
+        "upwards": [0.0, 0.01, 1.0],
+    }
+    cache = CompletionCache(max_entries=2, embedder=vectors.__getitem__)
+    for message in ("north", "east", "up"):
+        _, embedding = cache.lookup("chat", {"message": message})
+        cache.store("chat", {"message": message}, message, embedding=embedding)
+
+    assert cache.lookup("chat", {"message": "northwards"})[0] is None
+    assert cache.lookup("chat", {"message": "eastwards"})[0] == "east"
+    assert cache.lookup("chat", {"message": "upwards"})[0] == "up"
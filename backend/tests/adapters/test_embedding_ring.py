@@ -0,0 +1,43 @@
+"""Tests for the embedding ring buffer shared by the semantic cache tiers."""
+
+import pytest
+
+from app.adapters.embedding_ring import EmbeddingRing, normalize_embedding
+
+
+def test_matches_yields_payloads_above_threshold_best_first() -> None:
+    """Test that only similar rows are returned, most similar first."""
+    ring: EmbeddingRing[str] = EmbeddingRing(4)
+    ring.add(normalize_embedding([1.0, 0.0]), "x")
+    ring.add(normalize_embedding([1.0, 0.2]), "near-x")
+    ring.add(normalize_embedding([0.0, 1.0]), "y")
+
+    assert list(ring.matches(normalize_embedding([1.0, 0.0]), 0.9)) == ["x", "near-x"]
+    assert list(ring.matches(normalize_embedding([1.0, 0.2]), 0.9)) == ["near-x", "x"]
+
+
+def test_add_overwrites_oldest_row_when_full() -> None:
+    """Test that the ring keeps only the newest ``capacity`` rows."""
+    ring: EmbeddingRing[str] = EmbeddingRing(2)
+    for name, vector in [("a", [1.0, 0.0]), ("b", [0.0, 1.0]), ("c", [1.0, 0.01])]:
+        ring.add(normalize_embedding(vector), name)
+
+    assert list(ring.matches(normalize_embedding([1.0, 0.0]), 0.99)) == ["c"]
+
+
+def test_clear_and_empty_ring_match_nothing() -> None:
+    """Test that an empty or cleared ring yields no payloads."""
+    ring: EmbeddingRing[str] = EmbeddingRing(2)
+    query = normalize_embedding([1.0, 0.0])
+    assert list(ring.matches(query, 0.0)) == []
+
+    ring.add(query, "a")
+    ring.clear()
+
+    assert list(ring.matches(query, 0.0)) == []
+
+
+def test_normalize_embedding_leaves_zero_vector_unchanged() -> None:
+    """Test that a zero vector is not divided by its zero norm."""
+    assert normalize_embedding([0.0, 0.0]).tolist() == [0.0, 0.0]
+    assert normalize_embedding([3.0, 4.0]).tolist() == pytest.approx([0.6, 0.8])
@@ -0,0 +1,50 @@
+"""Tests for the in-memory fake Mem0 adapter."""
+
+import pytest
+
+from app.adapters.mem0_adapter import (
+    FakeMemoryAdapter,
+    MemorySearchRequest,
+    MemoryWriteRequest,
+)
+
+MEMORIES = ["Likes green tea", "Plays on a team", "Enjoys steam baths", "Owns a cat"]
+
+
+@pytest.fixture
+def adapter() -> FakeMemoryAdapter:
+    """Fixture providing a fake adapter holding MEMORIES for user u1."""
+    fake = FakeMemoryAdapter()
+    for text in MEMORIES:
+        fake.add(MemoryWriteRequest(user_id="u1", text_content=text))
+    return fake
+
+
+@pytest.mark.parametrize(
+    "query",
+    [
+        "tea",
+        "ea",
+        "green tea",
+        "een te",
+        "s green t",
+        "on a te",
+        "ys on a team",
+        "n a",
+        "a",
+        "TEAM",
+        "cat z",
+        "likes tea",
+    ],
+)
+def test_search_matches_substring_scan(adapter: FakeMemoryAdapter, query: str) -> None:
+    """Test that the token index never changes which memories match a query."""
+    results = adapter.search(MemorySearchRequest(user_id="u1", query=query, limit=10))
+
+    expected = [text for text in MEMORIES if query.lower() in text.lower()]
+    assert [result.content for result in results] == expected
+
+
+def test_search_is_scoped_to_user(adapter: FakeMemoryAdapter) -> None:
+    """Test that another user's memories are never returned."""
+    assert adapter.search(MemorySearchRequest(user_id="u2", query="tea")) == []
@@ -0,0 +1,43 @@
+"""Tests for the shared mem0 client used by Mem0Adapter."""
+
+from unittest.mock import Mock
+
+import pytest
+
+from app.adapters import mem0_adapter
+from app.adapters.mem0_adapter import Mem0Adapter, MemoryWriteRequest
+
+
+@pytest.fixture
+def get_memory_client(monkeypatch: pytest.MonkeyPatch) -> Mock:
+    """Fixture replacing the pooled client factory with a mock."""
+    factory = Mock(return_value=Mock(name="MemoryClient"))
+    monkeypatch.setattr(mem0_adapter, "get_memory_client", factory)
+    return factory
+
+
+def test_default_adapter_does_not_build_a_client(get_memory_client: Mock) -> None:
+    """Test that building and using the default adapter opens no client."""
+    adapter = Mem0Adapter()
+    adapter.add(MemoryWriteRequest(user_id="u1", text_content="likes tea"))
+
+    get_memory_client.assert_not_called()
+
+
+def test_client_is_fetched_once_on_first_use(get_memory_client: Mock) -> None:
+    """Test that the pooled client is fetched with the adapter's credentials."""
+    adapter = Mem0Adapter(api_key="key", host="https://mem0.example")
+
+    first = adapter._memory_client()
+    second = adapter._memory_client()
+
+    get_memory_client.assert_called_once_with("key", "https://mem0.example")
+    assert first is second is get_memory_client.return_value
+
+
+def test_explicit_client_is_used_as_is(get_memory_client: Mock) -> None:
+    """Test that a client passed in bypasses the pool."""
+    client = Mock()
+
+    assert Mem0Adapter(client=client)._memory_client() is client
+    get_memory_client.assert_not_called()
@@ -0,0 +1,106 @@
+"""Tests for the memory search result cache."""
+
+from app.adapters.mem0_adapter import MemorySearchRequest, MemorySearchResult
+from app.adapters.memory_search_cache import MemorySearchCache
+
+RESULTS = [MemorySearchResult(id="m1", content="likes tea", score=0.9)]
+
+
+def test_exact_hit_returns_stored_results() -> None:
+    """Test that an identical request is served from the exact tier."""
+    cache = MemorySearchCache()
+    request = MemorySearchRequest(user_id="u1", query="tea")
+
+    results, _, embedding = cache.lookup(request)
+    assert results is None and embedding is None
+    cache.store(request, RESULTS)
+
+    results, _, _ = cache.lookup(MemorySearchRequest(user_id="u1", query="tea"))
+    assert results == RESULTS
+
+
+def test_invalidate_makes_user_entries_stale() -> None:
+    """Test that invalidating a user bypasses their cached results only."""
+    cache = MemorySearchCache()
+    request_u1 = MemorySearchRequest(user_id="u1", query="tea")
+    request_u2 = MemorySearchRequest(user_id="u2", query="tea")
+    cache.store(request_u1, RESULTS)
+    cache.store(request_u2, RESULTS)
+
+    cache.invalidate("u1")
+
+    assert cache.lookup(request_u1)[0] is None
+    assert cache.lookup(request_u2)[0] == RESULTS
+
+
+def test_exact_tier_evicts_least_recently_used() -> None:
+    """Test that the exact tier is bounded by max_entries."""
+    cache = MemorySearchCache(max_entries=2)
+    first = MemorySearchRequest(user_id="u1", query="first")
+    second = MemorySearchRequest(user_id="u1", query="second")
+    third = MemorySearchRequest(user_id="u1", query="third")
+    cache.store(first, RESULTS)
+    cache.store(second, RESULTS)
+    cache.lookup(first)  # first becomes most recently used
+    cache.store(third, RESULTS)
+
+    assert cache.lookup(first)[0] == RESULTS
+    assert cache.lookup(second)[0] is None
+
+
+def test_semantic_hit_for_similar_query() -> None:
+    """Test that a query with a near-identical embedding hits the semantic tier."""
+    vectors = {
+        "does the user like tea": [1.0, 0.0, 0.01],
+        "does the user enjoy tea": [1.0, 0.0, 0.0],
+        "favourite sport": [0.0, 1.0, 0.0],
+    }
+    cache = MemorySearchCache(embedder=vectors.__getitem__, similarity_threshold=0.95)
+    original = MemorySearchRequest(user_id="u1", query="does the user like tea")
+    results, scope, embedding = cache.lookup(original)
+    assert results is None
+    cache.store(original, RESULTS, scope, embedding)
+
+    paraphrase = MemorySearchRequest(user_id="u1", query="does the user enjoy tea")
+    unrelated = MemorySearchRequest(user_id="u1", query="favourite sport")
+    other_user = MemorySearchRequest(user_id="u2", query="does the user enjoy tea")
+
+    assert cache.lookup(paraphrase)[0] == RESULTS
+    assert cache.lookup(unrelated)[0] is None
+    assert cache.lookup(other_user)[0] is None
+
+
+def test_semantic_tier_overwrites_oldest_entry_when_full() -> None:
+    """Test that the semantic ring buffer keeps only the newest max_entries."""
+    vectors = {
+        "tea": [1.0, 0.0, 0.0],
+        "sport": [0.0, 1.0, 0.0],
+        "music": [0.0, 0.0, 1.0],
+        "teas": [1.0, 0.01, 0.0],
+        "sports": [0.01, 1.0, 0.0],
+        "musics": [0.0, 0.01, 1.0],
+    }
+    cache = MemorySearchCache(max_entries=2, embedder=vectors.__getitem__)
+    for query in ("tea", "sport", "music"):
+        request = MemorySearchRequest(user_id="u1", query=query)
+        _, scope, embedding = cache.lookup(request)
+        cache.store(request, RESULTS, scope, embedding)
+
+    def lookup(query: str) -> list[MemorySearchResult] | None:
+        return cache.lookup(MemorySearchRequest(user_id="u1", query=query))[0]
+
+    assert lookup("teas") is None
+    assert lookup("sports") == RESULTS
+    assert lookup("musics") == RESULTS
+
+
+def test_results_fetched_before_invalidate_are_not_served() -> None:
+    """Test that storing with a pre-invalidation scope does not serve stale results."""
+    cache = MemorySearchCache()
+    request = MemorySearchRequest(user_id="u1", query="tea")
+    _, scope, embedding = cache.lookup(request)
+
+    cache.invalidate("u1")  # a write lands while the search is in flight
+    cache.store(request, RESULTS, scope, embedding)
+
+    assert cache.lookup(request)[0] is None
@@ -0,0 +1,95 @@
+import threading
+from unittest.mock import MagicMock
+
+import pytest
+
+from app.adapters.rabbitmq_channel_pool import RabbitMQChannelPool
+from app.adapters.rabbitmq_config import RabbitMQConfig
+from app.adapters.rabbitmq_message_bus import RabbitMQMessageBus
+from app.core.base_aggregate import DomainEvent
+
+
+class SampleDomainEvent(DomainEvent):
+    some_data: str = "default"
+
+
+def test_channel_pool_opens_connections_lazily_and_reuses_channels() -> None:
+    """Tests that a slot opens its connection once and keeps its channel."""
+    connection = MagicMock()
+    factory = MagicMock(return_value=connection)
+    pool = RabbitMQChannelPool(factory, size=1)
+
+    factory.assert_not_called()
+    with pool.acquire() as pooled:
+        first = pooled.channel
+    with pool.acquire() as pooled:
+        second = pooled.channel
+
+    factory.assert_called_once()
+    connection.channel.assert_called_once()
+    assert first is second
+
+
+def test_channel_pool_reconnects_when_connection_is_closed() -> None:
+    """Tests that a reset slot on a closed connection opens a new connection."""
+    dead_connection = MagicMock()
+    live_connection = MagicMock()
+    factory = MagicMock(side_effect=[dead_connection, live_connection])
+    pool = RabbitMQChannelPool(factory, size=1)
+
+    with pool.acquire() as pooled:
+        assert pooled.channel is dead_connection.channel.return_value
+        pooled.declared_queues.add("SampleDomainEvent")
+        dead_connection.is_open = False
+        pooled.reset()
+        channel = pooled.channel
+
+    assert channel is live_connection.channel.return_value
+    assert pooled.declared_queues == set()
+
+
+def test_channel_pool_hands_each_slot_to_one_thread_at_a_time() -> None:
+    """Tests that concurrent acquirers never share a slot."""
+    pool = RabbitMQChannelPool(MagicMock(), size=2)
+    in_use: set[int] = set()
+    overlaps: list[int] = []
+    lock = threading.Lock()
+
+    def worker() -> None:
+        for _ in range(50):
+            with pool.acquire() as pooled:
+                with lock:
+                    if id(pooled) in in_use:
+                        overlaps.append(id(pooled))
+                    in_use.add(id(pooled))
+                with lock:
+                    in_use.discard(id(pooled))
+
+    threads = [threading.Thread(target=worker) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert overlaps == []
+
+
+def test_channel_pool_from_config_uses_pool_size() -> None:
+    """Tests that from_config sizes the pool from RabbitMQConfig."""
+    pool = RabbitMQChannelPool.from_config(RabbitMQConfig(connection_pool_size=3))
+
+    assert len(pool._slots) == 3
+
+
+@pytest.mark.asyncio
+async def test_rabbitmq_message_bus_publishes_through_pool() -> None:
+    """Tests that a bus with a publish pool keeps publishing off the consumer connection."""
+    consumer_connection = MagicMock()
+    publisher_connection = MagicMock()
+    pool = RabbitMQChannelPool(lambda: publisher_connection, size=1)
+
+    bus = RabbitMQMessageBus(connection=consumer_connection, publish_pool=pool)
+    await bus.publish(SampleDomainEvent())
+
+    consumer_connection.channel.assert_not_called()
+    publisher_connection.channel.return_value.basic_publish.assert_called_once()
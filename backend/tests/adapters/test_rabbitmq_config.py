@@ -9,6 +9,8 @@ def test_rabbitmq_config_default_values() -> None:
     assert config.username is None
     assert config.password is None
     assert config.virtual_host == "/"
+    assert config.connection_pool_size == 4
+    assert config.prefetch_count == 64
 
 
 def test_rabbitmq_config_custom_values() -> None:
@@ -1,4 +1,4 @@
-from unittest.mock import ANY, MagicMock, patch
+from unittest.mock import ANY, MagicMock, call, patch
 
 import pytest
 
@@ -28,7 +28,7 @@ async def test_rabbitmq_message_bus_publish() -> None:
     mock_channel.basic_publish.assert_called_once_with(
         exchange="",
         routing_key="SampleDomainEvent",
-        body=sample_event.model_dump_json(),
+        body=sample_event.model_dump_json().encode(),
     )
 
 
@@ -125,7 +125,7 @@ async def test_rabbitmq_message_bus_publish() -> None:
     mock_channel.basic_publish.assert_called_once_with(
         exchange="",
         routing_key="SampleDomainEvent",  # Relies on type(event).__name__
-        body=sample_event.model_dump_json(),
+        body=sample_event.model_dump_json().encode(),
         properties=ANY,  # Accept any properties object
     )
     args, kwargs = mock_channel.basic_publish.call_args
@@ -133,6 +133,7 @@ async def test_rabbitmq_message_bus_publish() -> None:
     assert (
         kwargs.get("properties").delivery_mode == 2
     )  # pika.spec.PERSISTENT_DELIVERY_MODE
+    assert kwargs.get("properties").content_type == "application/json"
 
 
 # New tests for error handling
@@ -254,6 +255,104 @@ async def test_rabbitmq_message_bus_register_handler_pika_error() -> None:
     mock_channel.basic_consume.assert_not_called()  # basic_consume should not be called if registration fails
 
 
+class OtherDomainEvent(DomainEvent):
+    other_data: str = "default"
+
+
+@pytest.mark.asyncio
+async def test_rabbitmq_message_bus_consumers_share_one_channel() -> None:
+    """Test that every registered handler shares one prefetch-limited consumer channel."""
+    mock_connection = MagicMock()
+    mock_channel = MagicMock()
+    mock_connection.channel.return_value = mock_channel
+
+    mock_channel.basic_consume.side_effect = ["tag-sample", "tag-other"]
+
+    bus = RabbitMQMessageBus(connection=mock_connection)
+    bus.register_handlers({SampleDomainEvent: MagicMock()})
+    bus.register_handler(OtherDomainEvent, MagicMock())
+
+    mock_connection.channel.assert_called_once()
+    assert [c.kwargs["queue"] for c in mock_channel.queue_declare.call_args_list] == [
+        "SampleDomainEvent",
+        "OtherDomainEvent",
+    ]
+    assert mock_channel.basic_consume.call_count == 2
+    mock_channel.basic_qos.assert_called_once_with(
+        prefetch_count=RabbitMQMessageBus.CONSUMER_PREFETCH_COUNT, global_qos=False
+    )
+
+    bus.cancel_consumers()
+    mock_channel.basic_cancel.assert_has_calls([call("tag-sample"), call("tag-other")])
+
+
+def test_rabbitmq_message_bus_start_consuming_drives_connection_until_stopped() -> None:
+    """Test that one consuming loop drives the shared connection until stopped."""
+    mock_connection = MagicMock()
+    bus = RabbitMQMessageBus(connection=mock_connection)
+    iterations = 0
+
+    def process_data_events(time_limit: float) -> None:
+        nonlocal iterations
+        iterations += 1
+        if iterations == 3:
+            bus.stop_consuming()
+
+    mock_connection.process_data_events.side_effect = process_data_events
+
+    bus.start_consuming()
+
+    assert iterations == 3
+
+
+def test_rabbitmq_message_bus_acks_successful_deliveries_in_batches() -> None:
+    """Test that successes are acked with multiple=True and failures nacked singly."""
+    mock_connection = MagicMock()
+    mock_channel = MagicMock()
+    mock_connection.channel.return_value = mock_channel
+
+    bus = RabbitMQMessageBus(connection=mock_connection)
+    bus.ACK_BATCH_SIZE = 3
+    bus.register_handler(SampleDomainEvent, MagicMock())
+    on_message_callback = mock_channel.basic_consume.call_args.kwargs[
+        "on_message_callback"
+    ]
+    body = SampleDomainEvent().model_dump_json().encode()
+
+    for tag in (1, 2):
+        on_message_callback(mock_channel, MagicMock(delivery_tag=tag), None, body)
+    on_message_callback(mock_channel, MagicMock(delivery_tag=3), None, b"bad")
+    mock_channel.basic_ack.assert_not_called()
+    mock_channel.basic_nack.assert_called_once_with(delivery_tag=3, requeue=False)
+
+    on_message_callback(mock_channel, MagicMock(delivery_tag=4), None, body)
+    mock_channel.basic_ack.assert_called_once_with(delivery_tag=4, multiple=True)
+
+    on_message_callback(mock_channel, MagicMock(delivery_tag=5), None, body)
+    bus.flush_acks()
+    mock_channel.basic_ack.assert_called_with(delivery_tag=5, multiple=True)
+    assert mock_channel.basic_ack.call_count == 2
+
+
+def test_rabbitmq_message_bus_small_prefetch_window_acks_early() -> None:
+    """Test that a configured prefetch window is applied and never fills before an ack."""
+    mock_connection = MagicMock()
+    mock_channel = MagicMock()
+    mock_connection.channel.return_value = mock_channel
+
+    bus = RabbitMQMessageBus(connection=mock_connection, prefetch_count=4)
+    bus.register_handler(SampleDomainEvent, MagicMock())
+    mock_channel.basic_qos.assert_called_once_with(prefetch_count=4, global_qos=False)
+    on_message_callback = mock_channel.basic_consume.call_args.kwargs[
+        "on_message_callback"
+    ]
+    body = SampleDomainEvent().model_dump_json().encode()
+
+    for tag in (1, 2):
+        on_message_callback(mock_channel, MagicMock(delivery_tag=tag), None, body)
+    mock_channel.basic_ack.assert_called_once_with(delivery_tag=2, multiple=True)
+
+
 @pytest.mark.asyncio
 async def test_rabbitmq_message_bus_publish_batch_success() -> None:
     """Test that publish_batch successfully publishes all events."""
@@ -268,17 +367,112 @@ async def test_rabbitmq_message_bus_publish_batch_success() -> None:
 
     await bus.publish_batch(sample_events)
 
-    # Assert that basic_publish was called for each event
+    # Assert that basic_publish was called for each event on a single channel
+    mock_connection.channel.assert_called_once()
+    mock_channel.queue_declare.assert_called_once_with(
+        queue="SampleDomainEvent", durable=True
+    )
     assert mock_channel.basic_publish.call_count == len(sample_events)
     for i, event in enumerate(sample_events):
         mock_channel.basic_publish.assert_any_call(
             exchange="",
             routing_key="SampleDomainEvent",
-            body=event.model_dump_json(),
+            body=event.model_dump_json().encode(),
             properties=ANY,  # Accept any properties object
         )
 
 
+@pytest.mark.asyncio
+async def test_rabbitmq_message_bus_reuses_publish_channel() -> None:
+    """Test that publishes share one channel and declare each queue only once."""
+    mock_connection = MagicMock()
+    mock_channel = MagicMock()
+    mock_connection.channel.return_value = mock_channel
+
+    bus = RabbitMQMessageBus(connection=mock_connection)
+
+    await bus.publish(SampleDomainEvent(some_data="first"))
+    await bus.publish(SampleDomainEvent(some_data="second"))
+
+    mock_connection.channel.assert_called_once()
+    mock_channel.queue_declare.assert_called_once_with(
+        queue="SampleDomainEvent", durable=True
+    )
+    assert mock_channel.basic_publish.call_count == 2
+    mock_channel.close.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_rabbitmq_message_bus_reopens_channel_after_failure() -> None:
+    """Test that a failed publish drops the cached channel and re-declares queues."""
+    mock_connection = MagicMock()
+    broken_channel = MagicMock()
+    broken_channel.basic_publish.side_effect = pika.exceptions.StreamLostError(
+        "Simulated stream lost"
+    )
+    fresh_channel = MagicMock()
+    mock_connection.channel.side_effect = [broken_channel, fresh_channel]
+
+    bus = RabbitMQMessageBus(connection=mock_connection)
+
+    with pytest.raises(MessageBusError):
+        await bus.publish(SampleDomainEvent(some_data="lost"))
+    await bus.publish(SampleDomainEvent(some_data="retried"))
+
+    broken_channel.close.assert_called_once()
+    fresh_channel.queue_declare.assert_called_once_with(
+        queue="SampleDomainEvent", durable=True
+    )
+    fresh_channel.basic_publish.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_rabbitmq_message_bus_publishes_unreliable_events_transiently() -> None:
+    """Test that events marked reliable=False are not persisted by the broker."""
+
+    class BookkeepingEvent(DomainEvent):
+        reliable = False
+
+    mock_connection = MagicMock()
+    mock_channel = MagicMock()
+    mock_connection.channel.return_value = mock_channel
+
+    bus = RabbitMQMessageBus(connection=mock_connection)
+
+    await bus.publish_batch([BookkeepingEvent(), SampleDomainEvent()])
+
+    delivery_modes = [
+        call.kwargs["properties"].delivery_mode
+        for call in mock_channel.basic_publish.call_args_list
+    ]
+    assert delivery_modes == [
+        pika.spec.TRANSIENT_DELIVERY_MODE,
+        pika.spec.PERSISTENT_DELIVERY_MODE,
+    ]
+
+
+@pytest.mark.asyncio
+async def test_rabbitmq_message_bus_nacks_malformed_json() -> None:
+    """Test that a body that is not valid JSON is NACKed without calling the handler."""
+    mock_connection = MagicMock()
+    mock_channel = MagicMock()
+    mock_connection.channel.return_value = mock_channel
+
+    bus = RabbitMQMessageBus(connection=mock_connection)
+    mock_handler = MagicMock()
+    bus.register_handler(SampleDomainEvent, mock_handler)
+    on_message_callback = mock_channel.basic_consume.call_args.kwargs[
+        "on_message_callback"
+    ]
+
+    on_message_callback(
+        mock_channel, MagicMock(delivery_tag=7), MagicMock(), b"{not json"
+    )
+
+    mock_handler.assert_not_called()
+    mock_channel.basic_nack.assert_called_once_with(delivery_tag=7, requeue=False)
+
+
 @pytest.mark.asyncio
 async def test_rabbitmq_message_bus_publish_batch_failure() -> None:
     """Test that publish_batch raises MessageBusError if any publish fails."""
@@ -0,0 +1,156 @@
+"""Tests for the SQLAlchemy repository against an in-memory SQLite database."""
+
+from collections.abc import Iterator
+from uuid import UUID, uuid4
+
+import pytest
+from sqlalchemy import Engine, event
+from sqlalchemy.pool import StaticPool
+from sqlmodel import Field, Session, SQLModel, create_engine, select
+
+from app.adapters.repository import SQLAlchemyRepository
+
+
+class RepoItem(SQLModel, table=True):
+    __tablename__ = "repository_test_item"
+
+    id: UUID = Field(default_factory=uuid4, primary_key=True)
+    name: str
+
+
+class RepoItemCreate(SQLModel):
+    name: str
+
+
+class ServerDefaultItem(SQLModel, table=True):
+    __tablename__ = "repository_test_server_default_item"
+
+    id: UUID = Field(default_factory=uuid4, primary_key=True)
+    name: str
+    status: str | None = Field(
+        default=None, sa_column_kwargs={"server_default": "new"}
+    )
+
+
+class RepoItemUpdate(SQLModel):
+    name: str | None = None
+
+
+ItemRepository = SQLAlchemyRepository[RepoItem, RepoItemCreate, RepoItemUpdate]
+
+
+@pytest.fixture
+def engine() -> Iterator[Engine]:
+    """Fixture providing an in-memory SQLite engine with the test tables."""
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    SQLModel.metadata.create_all(
+        engine, tables=[RepoItem.__table__, ServerDefaultItem.__table__]
+    )
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def session(engine: Engine) -> Iterator[Session]:
+    """Fixture providing a session bound to the test engine."""
+    with Session(engine) as session:
+        yield session
+
+
+def _count_commits(session: Session) -> list[None]:
+    """Record one entry per transaction the session commits."""
+    commits: list[None] = []
+    event.listen(session, "after_commit", lambda _session: commits.append(None))
+    return commits
+
+
+def _stored_names(session: Session) -> list[str]:
+    """Return the names of the rows the session can currently see."""
+    return sorted(item.name for item in session.exec(select(RepoItem)))
+
+
+def test_list_pages_with_skip_and_limit(session: Session) -> None:
+    """Test that list() applies offset and limit."""
+    repo = ItemRepository(session, RepoItem)
+    for name in "abcde":
+        repo.create(RepoItemCreate(name=name))
+
+    assert len(repo.list()) == 5
+    assert len(repo.list(skip=1, limit=3)) == 3
+    assert repo.list(skip=5) == []
+
+
+def test_create_many_inserts_all_objects_in_one_commit(session: Session) -> None:
+    """Test that create_many adds every object and commits once."""
+    repo = ItemRepository(session, RepoItem)
+    commits = _count_commits(session)
+
+    created = repo.create_many([RepoItemCreate(name=name) for name in "abc"])
+
+    assert [item.name for item in created] == ["a", "b", "c"]
+    assert len(commits) == 1
+    assert _stored_names(session) == ["a", "b", "c"]
+
+
+def test_create_no_commit_flushes_without_committing(session: Session) -> None:
+    """Test that create_no_commit makes the row visible to the session only."""
+    repo = ItemRepository(session, RepoItem)
+    commits = _count_commits(session)
+
+    item = repo.create_no_commit(RepoItemCreate(name="pending"))
+
+    assert session.get(RepoItem, item.id) is item
+    assert _stored_names(session) == ["pending"]
+    assert commits == []
+
+
+def test_create_no_commit_is_discarded_on_rollback(session: Session) -> None:
+    """Test that uncommitted writes vanish when the unit of work rolls back."""
+    repo = ItemRepository(session, RepoItem)
+    repo.create(RepoItemCreate(name="kept"))
+
+    repo.create_no_commit(RepoItemCreate(name="first"))
+    repo.create_no_commit(RepoItemCreate(name="second"))
+    session.rollback()
+
+    assert _stored_names(session) == ["kept"]
+
+
+def test_create_skips_refresh_without_server_defaults(
+    session: Session, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that rows with only client-side defaults are not reloaded."""
+    refreshed: list[object] = []
+    monkeypatch.setattr(session, "refresh", refreshed.append)
+    repo = ItemRepository(session, RepoItem)
+
+    item = repo.create(RepoItemCreate(name="a"))
+
+    assert refreshed == []
+    assert item.name == "a"
+
+
+def test_create_refreshes_server_generated_values(
+    session: Session, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that a row with a server default is reloaded after create."""
+    refreshed: list[object] = []
+    refresh = session.refresh
+
+    def spy(instance: object) -> None:
+        refreshed.append(instance)
+        refresh(instance)
+
+    monkeypatch.setattr(session, "refresh", spy)
+    repo = SQLAlchemyRepository[ServerDefaultItem, RepoItemCreate, RepoItemUpdate](
+        session, ServerDefaultItem
+    )
+
+    item = repo.create(RepoItemCreate(name="a"))
+
+    assert refreshed == [item]
+    assert item.status == "new"
@@ -74,6 +74,23 @@ def test_get_messages_from_conversation() -> None:
     assert retrieved_messages[1].content == "Second message"
 
 
+def test_conversation_stores_messages_as_columns() -> None:
+    conversation = Conversation(
+        messages=[ChatMessage(role="user", content="Hi"), {"role": "assistant", "content": "Hello"}]
+    )
+
+    assert conversation.roles == ["user", "assistant"]
+    assert conversation.contents == ["Hi", "Hello"]
+    assert conversation.messages[-1] == ChatMessage(role="assistant", content="Hello")
+    assert conversation.messages[:1] == [ChatMessage(role="user", content="Hi")]
+
+    copied = conversation.model_copy(deep=True)
+    copied.roles.append("user")
+    copied.contents.append("How are you?")
+    assert len(copied.messages) == 3
+    assert len(conversation.messages) == 2
+
+
 def test_add_message_raises_event() -> None:
     conversation = Conversation()
     assert not conversation.domain_events
@@ -95,3 +112,29 @@ def test_add_message_raises_event() -> None:
     assert event2.conversation_id == conversation.id
     assert event2.role == "assistant"
     assert event2.content_preview == test_content2[:50]
+
+
+def test_add_messages_appends_in_order() -> None:
+    conversation = Conversation()
+    initial_last_updated_at = conversation.last_updated_at
+    time.sleep(0.01)
+
+    conversation.add_messages([("user", "Question"), ("assistant", "Answer")])
+
+    assert conversation.roles == ["user", "assistant"]
+    assert conversation.contents == ["Question", "Answer"]
+    assert conversation.last_updated_at > initial_last_updated_at
+    events = conversation.pull_events()
+    assert [event.role for event in events] == ["user", "assistant"]
+    assert all(isinstance(event, ConversationMessageAddedEvent) for event in events)
+
+
+def test_add_messages_with_no_pairs_is_noop() -> None:
+    conversation = Conversation()
+    initial_last_updated_at = conversation.last_updated_at
+
+    conversation.add_messages([])
+
+    assert conversation.messages == []
+    assert conversation.last_updated_at == initial_last_updated_at
+    assert conversation.pull_events() == []
@@ -1 +1,58 @@
-# from app.domain.memory.models import MemoryItem
+import os
+import uuid
+
+import pytest
+
+from app.domain.memory.models import MemoryId, MemoryItem, MemoryMetadata
+
+
+def test_memory_item_create() -> None:
+    memory_id = MemoryId(uuid.uuid4())
+    item = MemoryItem.create(
+        user_id="user-1",
+        text_content="Remember this",
+        metadata={"source": "chat"},
+        memory_id=memory_id,
+        external_mem_id="mem0-123",
+    )
+    assert item.id == memory_id
+    assert item.user_id == "user-1"
+    assert item.text_content == "Remember this"
+    assert isinstance(item.metadata, MemoryMetadata)
+    assert item.mem0_id == "mem0-123"
+    assert item.version == 0
+
+
+def test_memory_items_share_empty_metadata() -> None:
+    first = MemoryItem.create(user_id="user-1", text_content="a")
+    second = MemoryItem.create(user_id="user-1", text_content="b", metadata={})
+    assert first.metadata is second.metadata
+
+
+def test_memory_item_update_content_bumps_version() -> None:
+    item = MemoryItem.create(user_id="user-1", text_content="old")
+    item.update_content("new", new_metadata={"k": "v"})
+    assert item.text_content == "new"
+    assert item.version == 1
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="requires os.fork")
+def test_forked_child_does_not_reuse_parent_ids() -> None:
+    """Test that a forked worker does not draw ids from the parent's pool."""
+    MemoryItem.create(user_id="user-1", text_content="prime the id pool")
+
+    read_fd, write_fd = os.pipe()
+    pid = os.fork()
+    if pid == 0:  # child: report the next id and exit without running teardown
+        os.close(read_fd)
+        child_id = MemoryItem.create(user_id="user-1", text_content="child").id
+        os.write(write_fd, child_id.bytes)
+        os._exit(0)
+
+    os.close(write_fd)
+    parent_id = MemoryItem.create(user_id="user-1", text_content="parent").id
+    with os.fdopen(read_fd, "rb") as pipe:
+        child_id = uuid.UUID(bytes=pipe.read())
+    os.waitpid(pid, 0)
+
+    assert child_id != parent_id
@@ -1,3 +1,4 @@
+import asyncio
 from unittest.mock import AsyncMock, Mock
 
 import pytest
@@ -93,6 +94,22 @@ def test_execute_capability_success(
     mock_a2a_handler_service.handle_a2a_request.assert_called_once()
 
 
+def test_execute_capability_returns_handler_model_as_is(
+    client, mock_a2a_handler_service
+):
+    """Test that a handler result already of the output model type is returned directly."""
+    mock_a2a_handler_service.handle_a2a_request.return_value = MockResponse(
+        summary="Typed summary"
+    )
+
+    response = client.post(
+        "/a2a/execute/test_capability", json={"message": "test message"}
+    )
+
+    assert response.status_code == 200
+    assert response.json() == {"summary": "Typed summary"}
+
+
 def test_execute_capability_not_found(client, mock_a2a_capability_service):
     """Test capability not found error."""
     # Arrange
@@ -117,7 +134,10 @@ def test_execute_capability_invalid_input(client, mock_a2a_capability_service):
 
     # Assert
     assert response.status_code == 422
-    assert "detail" in response.json()
+    (error,) = response.json()["detail"]
+    assert error["type"] == "missing"
+    assert error["loc"] == ["message"]
+    assert not {"url", "input", "ctx"} & error.keys()
 
 
 def test_execute_capability_missing_input_schema(client, mock_a2a_capability_service):
@@ -158,3 +178,81 @@ def test_execute_capability_missing_output_schema(client, mock_a2a_capability_se
     # Assert
     assert response.status_code == 500
     assert "Output schema not defined" in response.json()["detail"]
+
+
+def test_execute_capability_batch(client, mock_a2a_capability_service):
+    """Test that batch execution returns per-call results in order."""
+    # Arrange
+    capability = mock_a2a_capability_service.get_capability.return_value
+    mock_a2a_capability_service.get_capability.side_effect = lambda name: (
+        capability if name == "test_capability" else None
+    )
+    batch = {
+        "calls": [
+            {"capability_name": "test_capability", "payload": {"message": "hi"}},
+            {"capability_name": "missing", "payload": {"message": "hi"}},
+        ]
+    }
+
+    # Act
+    response = client.post("/a2a/batch", json=batch)
+
+    # Assert
+    assert response.status_code == 200
+    results = response.json()["results"]
+    assert results[0] == {"status_code": 200, "data": {"summary": "Test summary"}}
+    assert results[1]["status_code"] == 404
+
+
+def test_execute_capability_batch_runs_calls_concurrently(
+    client, mock_a2a_handler_service
+):
+    """Test that batched calls overlap and each failure maps to its own entry."""
+    started = asyncio.Event()
+    calls_started = 0
+
+    async def handle(capability_name, data):
+        nonlocal calls_started
+        calls_started += 1
+        if calls_started == 2:
+            started.set()
+        # Times out unless both calls are in flight at the same time
+        await asyncio.wait_for(started.wait(), timeout=1.0)
+        if data.message == "boom":
+            raise RuntimeError("handler failed")
+        return {"summary": data.message}
+
+    mock_a2a_handler_service.handle_a2a_request.side_effect = handle
+    batch = {
+        "calls": [
+            {"capability_name": "test_capability", "payload": {"message": "ok"}},
+            {"capability_name": "test_capability", "payload": {"message": "boom"}},
+            {"payload": {"message": "no name"}},
+        ]
+    }
+
+    response = client.post("/a2a/batch", json=batch)
+
+    assert response.status_code == 200
+    ok, failed, unnamed = response.json()["results"]
+    assert ok == {"status_code": 200, "data": {"summary": "ok"}}
+    assert failed["status_code"] == 500
+    assert "handler failed" in failed["detail"]
+    assert unnamed["status_code"] == 422
+
+
+def test_execute_capability_rejects_non_object_body(client):
+    """Test that a body that is not a JSON object is rejected before dispatch."""
+    response = client.post(
+        "/a2a/execute/test_capability",
+        content=b"[1, 2, 3]",
+        headers={"Content-Type": "application/json"},
+    )
+    assert response.status_code == 422
+
+    response = client.post(
+        "/a2a/execute/test_capability",
+        content=b"{not json",
+        headers={"Content-Type": "application/json"},
+    )
+    assert response.status_code == 422
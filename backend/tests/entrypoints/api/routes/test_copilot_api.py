@@ -0,0 +1,54 @@
+from unittest.mock import AsyncMock
+from uuid import uuid4
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.adapters.completion_cache import CompletionCache
+from app.entrypoints.api.dependencies import (
+    get_ai_pattern_execution_service,
+    get_completion_cache,
+)
+from app.entrypoints.api.routes.copilot_api import router
+from app.service_layer.ai_pattern_execution_service import AIPatternExecutionService
+
+
+@pytest.fixture
+def mock_ai_service():
+    """Mock AI pattern execution service."""
+    service = AsyncMock(spec=AIPatternExecutionService)
+    service.execute_pattern.return_value = "Hello from the AI"
+    return service
+
+
+@pytest.fixture
+def client(mock_ai_service):
+    """Test client with the AI service mocked and a fresh reply cache."""
+    app = FastAPI()
+    app.include_router(router, prefix="/copilot")
+    cache = CompletionCache()
+    app.dependency_overrides[get_ai_pattern_execution_service] = lambda: mock_ai_service
+    app.dependency_overrides[get_completion_cache] = lambda: cache
+    return TestClient(app)
+
+
+def test_execute_serves_repeated_stateless_message_from_cache(client, mock_ai_service):
+    """Test that an identical message without a conversation reuses the cached reply."""
+    for _ in range(2):
+        response = client.post("/copilot/execute", json={"message": "hi"})
+        assert response.status_code == 200
+        assert response.json() == {"reply": "Hello from the AI"}
+
+    mock_ai_service.execute_pattern.assert_awaited_once()
+
+
+def test_execute_with_conversation_bypasses_cache(client, mock_ai_service):
+    """Test that messages within a conversation always reach the AI service."""
+    payload = {"message": "hi", "conversationId": str(uuid4())}
+
+    for _ in range(2):
+        response = client.post("/copilot/execute", json=payload)
+        assert response.status_code == 200
+
+    assert mock_ai_service.execute_pattern.await_count == 2
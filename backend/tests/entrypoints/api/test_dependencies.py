@@ -1,17 +1,25 @@
+import inspect
 from collections.abc import Callable  # Added for mock_session_factory type hint
 from typing import Any
 from unittest.mock import MagicMock
 
+import pytest
 from fastapi.testclient import TestClient
 
+from app.entrypoints.api import dependencies
 from app.entrypoints.api.dependencies import (
+    get_a2a_capability_service,
     get_db_session_factory,
     get_message_bus,
+    message_bus_instance,
+    reset_message_bus,
+    set_message_bus,
 )
 
 # Assuming main.py is in backend/src/app/entrypoints/api/main.py
 # Adjust import if your app instance is elsewhere or named differently.
 from app.entrypoints.api.main import app
+from app.service_layer.a2a_service import CapabilityMetadata
 from app.service_layer.message_bus import AbstractMessageBus  # Removed EventT
 
 client = TestClient(app)
@@ -77,6 +85,21 @@ def test_message_bus_dependency_injection() -> None:
     app.dependency_overrides = {}
 
 
+@pytest.mark.asyncio
+async def test_set_message_bus_swaps_bus_for_current_context() -> None:
+    """Test that set_message_bus/reset_message_bus control get_message_bus."""
+    assert await get_message_bus() is message_bus_instance
+
+    replacement = MagicMock(spec=AbstractMessageBus)
+    token = set_message_bus(replacement)
+    try:
+        assert await get_message_bus() is replacement
+    finally:
+        reset_message_bus(token)
+
+    assert await get_message_bus() is message_bus_instance
+
+
 def test_concrete_uow_dependency_injection() -> None:
     """Test direct dependency injection of UoW."""
     mock_db_session_factory = MagicMock(
@@ -95,3 +118,52 @@ def test_concrete_uow_dependency_injection() -> None:
     # will not be called unless the UoW is used as a context manager in the endpoint.
 
     app.dependency_overrides = {}
+
+
+def test_message_bus_endpoint_accepts_structural_bus() -> None:
+    """Test that a bus satisfying the protocol without subclassing it is accepted."""
+
+    class StructuralBus:
+        async def publish(self, event: Any) -> None:
+            pass  # pragma: no cover
+
+        async def publish_batch(self, events: list[Any]) -> None:
+            pass  # pragma: no cover
+
+        def register_handler(self, event_type: type[Any], handler: Any) -> None:
+            pass  # pragma: no cover
+
+    app.dependency_overrides[get_message_bus] = StructuralBus
+
+    try:
+        for _ in range(2):  # second call is served from the per-type cache
+            response = client.post("/test-di-message-bus")
+            assert response.status_code == 200
+            assert response.json()["is_bus_instance"] is True
+    finally:
+        app.dependency_overrides = {}
+
+
+@pytest.mark.asyncio
+async def test_a2a_capability_registrations_are_shared() -> None:
+    """Test that a capability registered once is found by later lookups."""
+    service = await get_a2a_capability_service()
+    capability = CapabilityMetadata(name="shared_capability", description="Shared")
+    service.register_capability(capability)
+    try:
+        assert await get_a2a_capability_service() is service
+        assert service.get_capability("shared_capability") is capability
+    finally:
+        service._capabilities.pop("shared_capability", None)
+
+
+def test_dependency_getters_run_on_the_event_loop() -> None:
+    """Test that no getter is a sync function FastAPI would send to the threadpool."""
+    sync_getters = [
+        name
+        for name, func in vars(dependencies).items()
+        if name.startswith("get_")
+        and inspect.isfunction(func)
+        and not inspect.iscoroutinefunction(func)
+    ]
+    assert sync_getters == []
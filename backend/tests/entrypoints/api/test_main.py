@@ -0,0 +1,27 @@
+from fastapi.testclient import TestClient
+
+from app.entrypoints.api.main import create_app
+
+
+def test_every_api_operation_is_tagged() -> None:
+    """Test that every operation has a tag to prefix its generated operation id."""
+    paths = create_app().openapi()["paths"]
+
+    untagged = [
+        (path, method)
+        for path, operations in paths.items()
+        for method, operation in operations.items()
+        if not operation.get("tags")
+    ]
+    assert untagged == []
+
+
+def test_app_factory_starts_and_serves_openapi() -> None:
+    """Test that the factory app runs its lifespan and publishes its schema."""
+    with TestClient(create_app()) as client:
+        openapi = client.get("/openapi.json")
+        root = client.get("/")
+
+    assert openapi.status_code == 200
+    assert "/test-di-uow" in openapi.json()["paths"]
+    assert root.json() == {"message": "Welcome to Vibeconomics Agentic Framework"}
@@ -0,0 +1,97 @@
+import msgspec
+import pytest
+from fastapi import FastAPI, HTTPException, Request
+from fastapi.testclient import TestClient
+
+from app.entrypoints.api.msgspec_body import decode_msgspec_body, msgspec_body_openapi
+
+
+class Part(msgspec.Struct):
+    text: str
+
+
+class EchoRequest(msgspec.Struct):
+    text: str
+    repeat: int = 1
+    parts: list[Part] = []
+
+
+app = FastAPI()
+
+
+@app.post("/echo", openapi_extra=msgspec_body_openapi(EchoRequest))
+async def echo(http_request: Request) -> dict:
+    request = await decode_msgspec_body(http_request, EchoRequest)
+    return {"text": request.text * request.repeat}
+
+
+client = TestClient(app)
+
+
+def test_decode_msgspec_body_returns_struct() -> None:
+    """Test that a valid body is decoded into the struct."""
+    response = client.post("/echo", json={"text": "ab", "repeat": 2})
+
+    assert response.status_code == 200
+    assert response.json() == {"text": "abab"}
+
+
+def test_decode_msgspec_body_rejects_malformed_json_with_422() -> None:
+    """Test that malformed JSON returns a json_invalid validation error."""
+    response = client.post("/echo", content=b"{not json")
+
+    assert response.status_code == 422
+    [error] = response.json()["detail"]
+    assert error["type"] == "json_invalid"
+    assert error["loc"] == ["body"]
+
+
+@pytest.mark.parametrize(
+    ("body", "error_type", "loc"),
+    [
+        ({"repeat": 2}, "missing", ["body", "text"]),
+        ({"text": "ab", "repeat": "x"}, "value_error", ["body", "repeat"]),
+        ({"text": "ab", "parts": [{}]}, "missing", ["body", "parts", 0, "text"]),
+        (
+            {"text": "ab", "parts": [{"text": 1}]},
+            "value_error",
+            ["body", "parts", 0, "text"],
+        ),
+    ],
+)
+def test_decode_msgspec_body_reports_fastapi_shaped_errors(
+    body: dict, error_type: str, loc: list
+) -> None:
+    """Test that schema mismatches return 422 with the failing field's location."""
+    response = client.post("/echo", json=body)
+
+    assert response.status_code == 422
+    [error] = response.json()["detail"]
+    assert error["type"] == error_type
+    assert error["loc"] == loc
+    assert error["msg"] and "$" not in error["msg"]
+
+
+@pytest.mark.asyncio
+async def test_decode_msgspec_body_chains_the_decode_error() -> None:
+    """Test that the 422 keeps msgspec's error as its cause."""
+
+    async def receive() -> dict:
+        return {"type": "http.request", "body": b"{not json", "more_body": False}
+
+    request = Request({"type": "http", "method": "POST", "headers": []}, receive)
+
+    with pytest.raises(HTTPException) as exc_info:
+        await decode_msgspec_body(request, EchoRequest)
+
+    assert isinstance(exc_info.value.__cause__, msgspec.DecodeError)
+
+
+def test_msgspec_body_openapi_documents_request_schema() -> None:
+    """Test that the struct's schema is published as the request body."""
+    request_body = app.openapi()["paths"]["/echo"]["post"]["requestBody"]
+
+    schema = request_body["content"]["application/json"]["schema"]
+    assert request_body["required"] is True
+    assert schema["required"] == ["text"]
+    assert set(schema["properties"]) == {"text", "repeat", "parts"}
@@ -0,0 +1,32 @@
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.config import settings
+from app.entrypoints.fastapi_app import create_app, custom_generate_unique_id
+
+
+def test_create_app_starts_through_its_lifespan() -> None:
+    """Test that the real app builds its OpenAPI schema at startup and serves it."""
+    app = create_app()
+
+    with TestClient(app) as client:
+        assert app.openapi_schema is not None  # warmed by the lifespan
+        response = client.get(f"{settings.API_V1_STR}/openapi.json")
+
+    assert response.status_code == 200
+    assert response.json()["paths"]
+
+
+def test_custom_generate_unique_id_falls_back_to_name_for_untagged_routes() -> None:
+    """Test that an untagged route gets its name as operation id."""
+    app = FastAPI(generate_unique_id_function=custom_generate_unique_id)
+
+    @app.get("/tagged", tags=["items"])
+    async def read_tagged() -> None: ...
+
+    @app.get("/untagged")
+    async def read_untagged() -> None: ...
+
+    paths = app.openapi()["paths"]
+    assert paths["/tagged"]["get"]["operationId"] == "items-read_tagged"
+    assert paths["/untagged"]["get"]["operationId"] == "read_untagged"
@@ -1,3 +1,5 @@
+from dataclasses import FrozenInstanceError
+
 import pytest
 from pydantic import BaseModel
 
@@ -52,6 +54,30 @@ def test_capability_metadata_creation():
     assert metadata.output_schema == MockResponse
 
 
+def test_capability_metadata_validate_output():
+    """Test that validate_output accepts the output model or a dict, and nothing else."""
+    metadata = CapabilityMetadata(
+        name="test_capability",
+        description="A test capability",
+        input_schema=MockRequest,
+        output_schema=MockResponse,
+    )
+    response = MockResponse(output_text="done")
+
+    assert metadata.validate_output(response) is response
+    assert metadata.validate_output({"output_text": "done"}) == response
+    with pytest.raises(TypeError):
+        metadata.validate_output(["done"])
+
+
+def test_capability_metadata_without_output_schema_rejects_output():
+    """Test that a capability without an output schema rejects every result."""
+    metadata = CapabilityMetadata(name="test_capability", description="A test capability")
+
+    with pytest.raises(TypeError):
+        metadata.validate_output({"output_text": "done"})
+
+
 @pytest.mark.asyncio
 async def test_a2a_handler_service_handle_request():
     """Test A2AHandlerService can handle a basic request."""
@@ -186,3 +212,32 @@ def test_list_capabilities(a2a_capability_service: A2ACapabilityService):
     capability_names = [cap.name for cap in capabilities_list]
     assert "SummarizeText" in capability_names
     assert "AnotherCapability" in capability_names
+
+
+def test_capability_metadata_validate_output_accepts_output_subclass():
+    """Test that a subclass instance of the output model is passed through unchanged."""
+
+    class DetailedResponse(MockResponse):
+        detail: str = ""
+
+    metadata = CapabilityMetadata(
+        name="test_capability",
+        description="A test capability",
+        input_schema=MockRequest,
+        output_schema=MockResponse,
+    )
+    response = DetailedResponse(output_text="done", detail="extra")
+
+    assert metadata.validate_output(response) is response
+
+
+def test_capability_metadata_is_immutable():
+    """Test that registered capability metadata cannot be modified in place."""
+    metadata = CapabilityMetadata(
+        name="test_capability",
+        description="A test capability",
+        output_schema=MockResponse,
+    )
+
+    with pytest.raises(FrozenInstanceError):
+        metadata.output_schema = MockRequest
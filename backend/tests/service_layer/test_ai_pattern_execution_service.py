@@ -1,4 +1,6 @@
+import asyncio
 import inspect
+import threading
 from unittest import mock
 
 # Imports for new tests (moved up for PEP-8 compliance)
@@ -138,7 +140,7 @@ async def test_execute_pattern_happy_path(
     mock_context_service.get_context_content = mock.AsyncMock(
         return_value=mock_context_content
     )
-    mock_pattern_service.get_pattern_content = mock.AsyncMock(
+    mock_pattern_service.get_pattern_content = mock.Mock(
         return_value=mock_pattern_content
     )
     mock_template_service.render = mock.AsyncMock(return_value=expected_rendered_prompt)
@@ -195,7 +197,7 @@ async def test_execute_pattern_creates_new_session(
     expected_rendered_prompt = "=== Current Task ===\nUser query: new session test"
     expected_ai_response = "AI response for new session"
 
-    mock_pattern_service.get_pattern_content = mock.AsyncMock(
+    mock_pattern_service.get_pattern_content = mock.Mock(
         return_value="User query: {{query}}"
     )
     mock_template_service.render = mock.AsyncMock(return_value=expected_rendered_prompt)
@@ -261,7 +263,7 @@ async def test_execute_pattern_loads_existing_session(
 
     mock_uow.conversations.get_by_id.return_value = mock_existing_conversation
 
-    mock_pattern_service.get_pattern_content = mock.AsyncMock(
+    mock_pattern_service.get_pattern_content = mock.Mock(
         return_value="Pattern: {{new_query}}"
     )
     expected_base_prompt = "=== Conversation History ===\nUSER: Old message\nASSISTANT: Old response\n=== End History ===\n\n=== Current Task ===\nPattern: {{new_query}}"
@@ -298,12 +300,9 @@ async def test_execute_pattern_loads_existing_session(
         template=expected_base_prompt, variables=input_variables, context_data={}
     )
 
-    calls = [
-        mock.call(role="user", content="follow up"),
-        mock.call(role="assistant", content=expected_ai_response),
-    ]
-    mock_existing_conversation.add_message.assert_has_calls(calls, any_order=False)
-    assert mock_existing_conversation.add_message.call_count == 2
+    mock_existing_conversation.add_messages.assert_called_once_with(
+        (("user", "follow up"), ("assistant", expected_ai_response))
+    )
 
     mock_uow.conversations.save.assert_called_once_with(mock_existing_conversation)
     mock_uow.commit.assert_called
@@ -327,7 +326,7 @@ async def test_execute_pattern_uses_provided_session_id_for_new_conversation(
 
     mock_uow.conversations.get_by_id.return_value = None
 
-    mock_pattern_service.get_pattern_content = mock.AsyncMock(
+    mock_pattern_service.get_pattern_content = mock.Mock(
         return_value="Data: {{data}}"
     )
     mock_template_service.render = mock.AsyncMock(return_value=expected_rendered_prompt)
@@ -390,7 +389,7 @@ async def test_execute_pattern_happy_path_no_strategy_no_context(
     expected_rendered_prompt = "=== Current Task ===\nPattern: Describe Widget."
     expected_ai_response = "AI: A widget is a small gadget."
 
-    mock_pattern_service.get_pattern_content = mock.AsyncMock(
+    mock_pattern_service.get_pattern_content = mock.Mock(
         return_value=mock_pattern_content
     )
     mock_template_service.render = mock.AsyncMock(return_value=expected_rendered_prompt)
@@ -432,6 +431,102 @@ async def test_execute_pattern_happy_path_no_strategy_no_context(
     assert result == expected_ai_response
 
 
+@pytest.mark.asyncio
+async def test_execute_pattern_fetches_prompt_components_concurrently(
+    mock_pattern_service: mock.Mock,
+    mock_template_service: mock.Mock,
+    mock_strategy_service: mock.Mock,
+    mock_context_service: mock.Mock,
+    mock_ai_provider_service: mock.Mock,
+    mock_uow: mock.Mock,
+) -> None:
+    # Arrange: the context lookup only completes once the pattern lookup has
+    # started, which times out if the lookups are awaited one at a time.
+    # The pattern lookup runs in a worker thread, hence a threading.Event.
+    pattern_started = threading.Event()
+
+    async def get_context_content(context_name: str) -> str:
+        assert await asyncio.to_thread(pattern_started.wait, 1.0)
+        return "Some context"
+
+    def get_pattern_content(pattern_name: str) -> str:
+        pattern_started.set()
+        return "Pattern: {{item}}"
+
+    mock_strategy_service.get_strategy = mock.AsyncMock(
+        return_value=mock.Mock(prompt="Be brief.")
+    )
+    mock_context_service.get_context_content = get_context_content
+    mock_pattern_service.get_pattern_content = get_pattern_content
+    mock_template_service.render = mock.AsyncMock(return_value="rendered")
+    mock_ai_provider_service.get_completion = mock.AsyncMock(return_value="done")
+
+    service = AIPatternExecutionService(
+        pattern_service=mock_pattern_service,
+        template_service=mock_template_service,
+        strategy_service=mock_strategy_service,
+        context_service=mock_context_service,
+        ai_provider_service=mock_ai_provider_service,
+        uow=mock_uow,
+    )
+
+    # Act
+    await service.execute_pattern(
+        pattern_name="test_pattern",
+        input_variables={"item": "Widget"},
+        strategy_name="brief",
+        context_name="ctx",
+    )
+
+    # Assert: prompt sections keep their order regardless of completion order
+    mock_template_service.render.assert_called_once_with(
+        template=(
+            "=== Strategy ===\nBe brief.\n\n"
+            "=== Context ===\nSome context\n\n"
+            "=== Current Task ===\nPattern: {{item}}"
+        ),
+        variables={"item": "Widget"},
+        context_data={},
+    )
+
+
+@pytest.mark.asyncio
+async def test_execute_pattern_with_real_pattern_service(
+    tmp_path,
+    mock_template_service: mock.Mock,
+    mock_strategy_service: mock.Mock,
+    mock_context_service: mock.Mock,
+    mock_ai_provider_service: mock.Mock,
+    mock_uow: mock.Mock,
+) -> None:
+    # Arrange: a real PatternService, whose lookup is synchronous
+    (tmp_path / "greet.md").write_text("Say hello to {{name}}", encoding="utf-8")
+    mock_template_service.render = mock.AsyncMock(return_value="Say hello to Ada")
+    mock_ai_provider_service.get_completion = mock.AsyncMock(return_value="Hello, Ada!")
+
+    service = AIPatternExecutionService(
+        pattern_service=PatternService(tmp_path),
+        template_service=mock_template_service,
+        strategy_service=mock_strategy_service,
+        context_service=mock_context_service,
+        ai_provider_service=mock_ai_provider_service,
+        uow=mock_uow,
+    )
+
+    # Act
+    result = await service.execute_pattern(
+        pattern_name="greet", input_variables={"name": "Ada"}
+    )
+
+    # Assert
+    assert result == "Hello, Ada!"
+    mock_template_service.render.assert_called_once_with(
+        template="=== Current Task ===\nSay hello to {{name}}",
+        variables={"name": "Ada"},
+        context_data={},
+    )
+
+
 class MyTestOutputModel(BaseModel):
     name: str
     value: int
@@ -451,7 +546,7 @@ async def test_execute_pattern_with_output_model_success(
     input_variables = {}
     ai_json_response = '{"name": "Test", "value": 123}'
 
-    mock_pattern_service.get_pattern_content = mock.AsyncMock(
+    mock_pattern_service.get_pattern_content = mock.Mock(
         return_value="Some pattern"
     )
     mock_template_service.render = mock.AsyncMock(
@@ -499,7 +594,7 @@ async def test_execute_pattern_with_output_model_parsing_error(
     input_variables = {}
     invalid_ai_json_response = '{"name": "Test", "value": "not_an_int"}'
 
-    mock_pattern_service.get_pattern_content = mock.AsyncMock(
+    mock_pattern_service.get_pattern_content = mock.Mock(
         return_value="Some pattern"
     )
     mock_template_service.render = mock.AsyncMock(
@@ -543,7 +638,7 @@ async def test_execute_pattern_without_output_model_returns_raw_string(
     input_variables = {}
     raw_response = "This is a raw string response."
 
-    mock_pattern_service.get_pattern_content = mock.AsyncMock(
+    mock_pattern_service.get_pattern_content = mock.Mock(
         return_value="Some pattern"
     )
     mock_template_service.render = mock.AsyncMock(
@@ -594,7 +689,7 @@ async def test_execute_pattern_with_simulated_template_extension(
     )
     expected_ai_response = "AI response based on extended prompt"
 
-    mock_pattern_service.get_pattern_content = mock.AsyncMock(
+    mock_pattern_service.get_pattern_content = mock.Mock(
         return_value=mock_pattern_content
     )
     mock_template_service.render = mock.AsyncMock(
@@ -651,7 +746,7 @@ async def test_execute_pattern_raises_error_on_empty_rendered_prompt(
     pattern_name = "test_empty_prompt_pattern"
     input_variables = {}
 
-    mock_pattern_service.get_pattern_content = mock.AsyncMock(
+    mock_pattern_service.get_pattern_content = mock.Mock(
         return_value="Some pattern content"
     )
     mock_template_service.render = mock.AsyncMock(return_value="")
@@ -695,7 +790,7 @@ async def test_execute_pattern_raises_error_on_whitespace_rendered_prompt(
     pattern_name = "test_whitespace_prompt_pattern"
     input_variables = {}
 
-    mock_pattern_service.get_pattern_content = mock.AsyncMock(
+    mock_pattern_service.get_pattern_content = mock.Mock(
         return_value="Some pattern content"
     )
     mock_template_service.render = mock.AsyncMock(return_value="   ")
@@ -741,7 +836,7 @@ async def test_execute_pattern_with_memory_service_available(
         MemorySearchResult(id="1", content="Memory content", score=0.9, metadata=None)
     ]
 
-    mock_pattern_service.get_pattern_content = mock.AsyncMock(
+    mock_pattern_service.get_pattern_content = mock.Mock(
         return_value="Pattern with {{memory:search:user123:test query}}"
     )
     mock_template_service.render = mock.AsyncMock(
@@ -787,7 +882,7 @@ async def test_execute_pattern_with_a2a_client_adapter_available(
     mock_a2a_client_adapter: mock.Mock,
 ) -> None:
     # Arrange
-    mock_pattern_service.get_pattern_content = mock.AsyncMock(
+    mock_pattern_service.get_pattern_content = mock.Mock(
         return_value="Pattern with A2A integration"
     )
     mock_template_service.render = mock.AsyncMock(
@@ -1081,7 +1176,7 @@ async def test_execute_pattern_propagates_a2a_extension_error(
     # Use valid JSON for payload
     pattern_content_with_a2a = 'Calling A2A: {{a2a:invoke:agent_url=http://test.agent/a2a:capability=test_cap:payload={"key":"value"}}}'
 
-    mock_pattern_service.get_pattern_content = mock.AsyncMock(
+    mock_pattern_service.get_pattern_content = mock.Mock(
         return_value=pattern_content_with_a2a
     )
 
@@ -1 +1,101 @@
-# from app.service_layer.ai_provider_service import AIProviderService
+import asyncio
+from unittest.mock import patch
+
+import pytest
+
+from app.service_layer.ai_provider_service import (
+    AIProviderService,
+    BatchingAIProviderService,
+)
+
+
+@pytest.mark.asyncio
+async def test_get_completions_returns_one_completion_per_prompt():
+    """Test that get_completions answers each prompt in order."""
+    service = AIProviderService()
+
+    completions = await service.get_completions(["first", "second"], model_name="m")
+
+    assert completions == [
+        await service.get_completion("first", model_name="m"),
+        await service.get_completion("second", model_name="m"),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_batching_provider_coalesces_concurrent_calls():
+    """Test that concurrent calls with the same settings share one provider call."""
+    service = BatchingAIProviderService(max_wait_ms=50)
+    try:
+        with patch.object(
+            AIProviderService,
+            "get_completions",
+            autospec=True,
+            side_effect=lambda self, prompts, **_: [f"reply to {p}" for p in prompts],
+        ) as get_completions:
+            replies = await asyncio.gather(
+                service.get_completion("a much longer prompt"),
+                service.get_completion("short"),
+                service.get_completion("mid prompt"),
+            )
+
+        assert replies == [
+            "reply to a much longer prompt",
+            "reply to short",
+            "reply to mid prompt",
+        ]
+        get_completions.assert_called_once()
+        # Prompts are sent shortest first
+        assert get_completions.call_args.args[1] == [
+            "short",
+            "mid prompt",
+            "a much longer prompt",
+        ]
+    finally:
+        await service.aclose()
+
+
+@pytest.mark.asyncio
+async def test_batching_provider_separates_different_models():
+    """Test that calls for different models are sent in separate batches."""
+    service = BatchingAIProviderService(max_wait_ms=50)
+    try:
+        with patch.object(
+            AIProviderService,
+            "get_completions",
+            autospec=True,
+            side_effect=lambda self, prompts, model_name=None, **_: [
+                f"{model_name}: {p}" for p in prompts
+            ],
+        ) as get_completions:
+            replies = await asyncio.gather(
+                service.get_completion("hi", model_name="model-a"),
+                service.get_completion("hi", model_name="model-b"),
+            )
+
+        assert replies == ["model-a: hi", "model-b: hi"]
+        assert get_completions.call_count == 2
+    finally:
+        await service.aclose()
+
+
+@pytest.mark.asyncio
+async def test_batching_provider_propagates_batch_failure_to_every_caller():
+    """Test that a failed batched call fails every request in the batch."""
+    service = BatchingAIProviderService(max_wait_ms=50)
+    try:
+        with patch.object(
+            AIProviderService,
+            "get_completions",
+            autospec=True,
+            side_effect=RuntimeError("provider down"),
+        ):
+            results = await asyncio.gather(
+                service.get_completion("one"),
+                service.get_completion("two"),
+                return_exceptions=True,
+            )
+
+        assert all(isinstance(r, RuntimeError) for r in results)
+    finally:
+        await service.aclose()
@@ -1,4 +1,8 @@
+import asyncio
+import gc
 import logging  # Required for caplog to work with logger in message_bus
+import threading
+import weakref
 from unittest.mock import MagicMock
 
 import pytest
@@ -97,3 +101,136 @@ def test_inmemory_message_bus_handler_exception_does_not_stop_others(
 
     # # Restore original log level if changed
     # logger.setLevel(original_level)
+
+
+@pytest.mark.asyncio
+async def test_inmemory_message_bus_dispatches_to_base_class_handlers() -> None:
+    """Test that handlers subscribed to a base event type receive subclasses."""
+    bus = InMemoryMessageBus()
+
+    class SpecialEventA(EventA):
+        pass
+
+    base_handler = MagicMock()
+    special_handler = MagicMock()
+    bus.subscribe(EventA, base_handler)
+    bus.subscribe(SpecialEventA, special_handler)
+
+    special_event = SpecialEventA(value=1)
+    await bus.publish(special_event)
+    await bus.publish(EventA(value=2))
+
+    special_handler.assert_called_once_with(special_event)
+    assert base_handler.call_count == 2
+
+    # Subscribing after a publish must invalidate the resolved handlers
+    late_handler = MagicMock()
+    bus.subscribe(DomainEvent, late_handler)
+    await bus.publish(special_event)
+    late_handler.assert_called_once_with(special_event)
+
+
+@pytest.mark.asyncio
+async def test_inmemory_message_bus_publish_many() -> None:
+    """Test that publish_many delivers every event to sync and async handlers."""
+    bus = InMemoryMessageBus()
+    sync_handler = MagicMock()
+    received: list[DomainEvent] = []
+
+    async def async_handler(event: DomainEvent) -> None:
+        received.append(event)
+
+    async def failing_handler(_event: DomainEvent) -> None:
+        raise ValueError("Handler Error")
+
+    bus.subscribe(EventA, sync_handler)
+    bus.subscribe(EventA, failing_handler)
+    bus.subscribe(EventB, async_handler)
+
+    events = [EventA(value=1), EventB(message="hi"), EventA(value=2)]
+    await bus.publish_many(events)
+
+    assert sorted(call.args[0].value for call in sync_handler.call_args_list) == [
+        1,
+        2,
+    ]
+    assert received == [events[1]]
+    assert list(bus.published_events) == events
+
+
+@pytest.mark.asyncio
+async def test_inmemory_message_bus_awaits_async_handlers_concurrently() -> None:
+    """Test that coroutine handlers for one event overlap instead of running serially."""
+    bus = InMemoryMessageBus()
+    started: list[str] = []
+    release = asyncio.Event()
+
+    async def first_handler(_event: DomainEvent) -> None:
+        started.append("first")
+        await release.wait()
+
+    async def second_handler(_event: DomainEvent) -> None:
+        started.append("second")
+        release.set()
+
+    bus.subscribe(EventA, first_handler)
+    bus.subscribe(EventA, second_handler)
+
+    await asyncio.wait_for(bus.publish(EventA(value=1)), timeout=1)
+
+    assert started == ["first", "second"]
+
+
+@pytest.mark.asyncio
+async def test_inmemory_message_bus_runs_sync_handlers_off_the_event_loop() -> None:
+    """Test that a blocking sync handler doesn't stall coroutine handlers."""
+    bus = InMemoryMessageBus()
+    release = threading.Event()
+    async_done: list[DomainEvent] = []
+
+    def blocking_handler(_event: DomainEvent) -> None:
+        release.wait(timeout=1)
+
+    async def async_handler(event: DomainEvent) -> None:
+        async_done.append(event)
+        release.set()
+
+    bus.subscribe(EventA, blocking_handler)
+    bus.subscribe(EventA, async_handler)
+
+    event = EventA(value=1)
+    await asyncio.wait_for(bus.publish(event), timeout=2)
+
+    assert async_done == [event]
+
+
+@pytest.mark.asyncio
+async def test_inmemory_message_bus_history_is_bounded() -> None:
+    """Test that published_events keeps only the most recent events."""
+    bus = InMemoryMessageBus(history_maxlen=2)
+    events = [EventA(value=i) for i in range(3)]
+
+    for event in events:
+        await bus.publish(event)
+
+    assert list(bus.published_events) == events[1:]
+
+    silent_bus = InMemoryMessageBus(history_maxlen=0)
+    await silent_bus.publish(events[0])
+    assert len(silent_bus.published_events) == 0
+
+
+@pytest.mark.asyncio
+async def test_inmemory_message_bus_is_freed_without_gc() -> None:
+    """Test that the resolved-handler cache does not keep the bus in a cycle."""
+    bus = InMemoryMessageBus()
+    bus.subscribe(EventA, MagicMock())
+    await bus.publish(EventA(value=1))
+    bus_ref = weakref.ref(bus)
+
+    gc.disable()
+    try:
+        del bus
+        assert bus_ref() is None
+    finally:
+        gc.enable()